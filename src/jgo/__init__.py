@@ -23,6 +23,9 @@ High-Level API (Recommended)
 run(endpoint, app_args=None, jvm_args=None, **kwargs)
     Run a Java application from a Maven endpoint.
 
+run_many(invocations, max_jvms=None, memory_budget=None, **kwargs)
+    Run many Java applications concurrently, yielding results as they finish.
+
 build(endpoint, update=False, cache_dir=None, **kwargs) -> Environment
     Build an environment from an endpoint without running it.
 
@@ -102,14 +105,19 @@ See Also
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed
 from dataclasses import replace
 from typing import TYPE_CHECKING
 
+import psutil
+
 from .config import GlobalSettings
 from .constants import MAVEN_CENTRAL_URL
 from .constants import VERSION as __version__
 from .env import EnvironmentBuilder, LinkStrategy
-from .exec import JavaRunner, JavaSource, JVMConfig
+from .exec import JavaRunner, JavaSource, JVMConfig, parse_memory_size
 from .jgo import (
     Endpoint,
     ExecutableNotFound,
@@ -131,6 +139,7 @@ from .util.compat import (
 
 if TYPE_CHECKING:
     import subprocess
+    from collections.abc import Iterable, Iterator
     from pathlib import Path
 
     from .env import Environment
@@ -228,6 +237,174 @@ def run(
     return result
 
 
+_INVOCATION_KEYS = frozenset({"endpoint", "app_args", "jvm_args", "main_class"})
+
+
+def run_many(
+    invocations: Iterable[str | dict],
+    max_jvms: int | None = None,
+    memory_budget: str | None = None,
+    max_heap: str | None = None,
+    max_builds: int = 4,
+    capture: bool = False,
+    update: bool = False,
+    verbose: bool = False,
+    cache_dir: Path | None = None,
+    repositories: dict[str, str] | None = None,
+    java_version: int | None = None,
+    java_vendor: str | None = None,
+    java_source: str = "auto",
+) -> Iterator[tuple[int, subprocess.CompletedProcess]]:
+    """
+    Run many Java applications concurrently, yielding results as they finish.
+
+    All invocations share one Maven context and environment builder. Distinct
+    environments are built concurrently (up to max_builds at a time; an
+    endpoint used by several invocations is built only once), and at most
+    max_jvms JVMs run at the same time, further limited so that their combined
+    maximum heap fits within memory_budget.
+
+    Args:
+        invocations: Endpoint strings, or dicts with an "endpoint" key and
+            optional "app_args", "jvm_args" and "main_class" keys
+        max_jvms: Maximum number of concurrently running JVMs
+            (default: number of CPUs)
+        memory_budget: Total heap available to concurrent JVMs, e.g. "16G"
+            (default: half of system memory)
+        max_heap: Maximum heap per JVM (default: memory_budget / max_jvms)
+        max_builds: Maximum number of environments built concurrently
+        capture: Capture the stdout and stderr of each JVM in its
+            CompletedProcess (see JavaRunner.run_and_capture); otherwise the
+            output of concurrent JVMs goes to the console, interleaved
+        update: Force update of cached environments (once per endpoint)
+        verbose: Enable verbose output
+        cache_dir: Override cache directory
+        repositories: Additional Maven repositories (name -> URL)
+        java_version: Force specific Java version
+        java_vendor: Prefer specific Java vendor
+        java_source: Java source strategy ("auto", "system")
+
+    Yields:
+        (index, CompletedProcess) tuples in completion order, where index is
+        the position of the invocation in the input. If an invocation fails
+        to build or launch, its exception is raised when it is reached.
+
+    Raises:
+        ValueError: If an invocation is malformed
+
+    Example:
+        >>> import jgo
+        >>> jobs = [
+        ...     {"endpoint": "org.python:jython-standalone:2.7.3",
+        ...      "app_args": ["-c", f"print({i})"]}
+        ...     for i in range(100)
+        ... ]
+        >>> for index, result in jgo.run_many(jobs, max_jvms=8, memory_budget="8G"):
+        ...     print(index, result.returncode)
+    """
+    jobs = [_invocation(inv) for inv in invocations]
+
+    # Work out how many JVMs fit, and how much heap each one gets
+    slots = max_jvms or os.cpu_count() or 1
+    budget = (
+        parse_memory_size(memory_budget)
+        if memory_budget
+        else psutil.virtual_memory().total // 2
+    )
+    if max_heap:
+        slots = max(1, min(slots, budget // parse_memory_size(max_heap)))
+    else:
+        max_heap = f"{max(budget // slots // 1024**2, 1)}M"
+
+    config = GlobalSettings.load()
+    remote_repos = {"central": MAVEN_CENTRAL_URL}
+    if repositories:
+        remote_repos.update(repositories)
+    context = MavenContext(
+        repo_cache=config.repo_cache,
+        remote_repos=remote_repos,
+    )
+    builder = EnvironmentBuilder(
+        context=context,
+        cache_dir=cache_dir or config.cache_dir,
+        link_strategy=LinkStrategy.AUTO,
+    )
+    java_source_map = {
+        "system": JavaSource.SYSTEM,
+        "auto": JavaSource.AUTO,
+    }
+    runner = JavaRunner(
+        jvm_config=JVMConfig(max_heap=max_heap),
+        java_source=java_source_map.get(java_source, JavaSource.AUTO),
+        java_version=java_version,
+        java_vendor=java_vendor,
+        verbose=verbose,
+    )
+
+    build_slots = threading.Semaphore(max(1, max_builds))
+    jvm_slots = threading.Semaphore(slots)
+    # Invocations of the same endpoint (modulo main class) share an environment
+    # directory, so they are built one at a time; the first one does the work
+    env_locks: dict[str, threading.Lock] = {}
+    updated: set[str] = set()
+    registry_lock = threading.Lock()
+    # Set once the caller stops consuming results; jobs that are already
+    # running (and waiting for a lock or slot) then give up before the JVM
+    stopped = threading.Event()
+
+    def run_job(job: dict) -> subprocess.CompletedProcess:
+        key = repr(_Endpoint.parse(job["endpoint"]).coordinates)
+        with registry_lock:
+            env_lock = env_locks.setdefault(key, threading.Lock())
+        # Wait for the environment before taking a build slot, so that
+        # invocations queued behind the same environment do not hold slots
+        with env_lock, build_slots:
+            if stopped.is_set():
+                raise CancelledError()
+            environment = builder.from_endpoint(
+                endpoint=job["endpoint"],
+                update=update and key not in updated,
+                main_class=job.get("main_class"),
+            )
+            updated.add(key)
+        with jvm_slots:
+            if stopped.is_set():
+                raise CancelledError()
+            launch = runner.run_and_capture if capture else runner.run
+            return launch(
+                environment=environment,
+                main_class=job.get("main_class"),
+                app_args=job.get("app_args") or [],
+                additional_jvm_args=job.get("jvm_args") or [],
+                print_command=verbose,
+            )
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_builds) + slots)
+    futures: dict = {}
+    try:
+        futures = {executor.submit(run_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Stop launching new JVMs if the caller stops consuming results
+        stopped.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _invocation(invocation: str | dict) -> dict:
+    """Normalize a run_many() invocation to a dict with an "endpoint" key."""
+    if isinstance(invocation, str):
+        return {"endpoint": invocation}
+    unknown = set(invocation) - _INVOCATION_KEYS
+    if unknown:
+        raise ValueError(f"Unknown invocation keys: {', '.join(sorted(unknown))}")
+    if not invocation.get("endpoint"):
+        raise ValueError(f"Invocation has no endpoint: {invocation}")
+    return dict(invocation)
+
+
 def build(
     endpoint: str,
     update: bool = False,
@@ -343,6 +520,7 @@ __all__ = (
     "__version__",
     # New 2.0 API
     "run",
+    "run_many",
     "build",
     "resolve",
     # Old 1.x compatibility API - Functions
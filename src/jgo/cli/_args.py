@@ -26,6 +26,8 @@ class ParsedArgs:
         offline: bool = False,
         no_cache: bool = False,
         timeout: int = 10,
+        max_downloads: int | None = None,
+        rate_limit: str | None = None,
         # Dependency resolution
         resolver: str = "auto",
         direct_only: bool = False,
@@ -39,8 +41,10 @@ class ParsedArgs:
         repositories: dict | None = None,
         # Program to run
         main_class: str | None = None,
+        exec_java: bool = False,
         # Classpath
         classpath_append: list[str] | None = None,
+        explicit_classpath: bool = False,
         # Backward compatibility
         ignore_config: bool = False,
         additional_endpoints: list[str] | None = None,
@@ -87,6 +91,8 @@ class ParsedArgs:
         self.offline = offline
         self.no_cache = no_cache
         self.timeout = timeout
+        self.max_downloads = max_downloads
+        self.rate_limit = rate_limit
         # Dependency resolution
         self.resolver = resolver
         self.direct_only = direct_only
@@ -100,8 +106,10 @@ class ParsedArgs:
         self.repositories = repositories or {}
         # Program to run
         self.main_class = main_class
+        self.exec_java = exec_java
         # Classpath
         self.classpath_append = classpath_append or []
+        self.explicit_classpath = explicit_classpath
         # Backward compatibility
         self.ignore_config = ignore_config
         self.additional_endpoints = additional_endpoints
@@ -322,6 +330,32 @@ def expand_platform(platform: str | None) -> tuple[str | None, str | None, str |
     return PLATFORMS.get(platform) or (None, None, None)
 
 
+def platform_names(os_name: str | None, os_arch: str | None) -> list[str]:
+    """
+    Find the platform names (and aliases) denoting an OS and architecture.
+
+    Platforms of "auto" architecture denote the architecture of this machine.
+
+    Args:
+        os_name: OS name like 'Linux'
+        os_arch: OS architecture like 'amd64'
+
+    Returns:
+        Platform names, most specific first (e.g. ['linux-x64', 'linux', 'linux64'])
+    """
+    detected_arch = detect_os_properties()[2]
+    names = []
+    for name, (platform_os, _, arch) in PLATFORMS.items():
+        if arch == "auto":
+            arch = detected_arch
+        if platform_os == os_name and arch == os_arch:
+            names.append(name)
+    # Architecture-specific names before the "auto" ones
+    names.sort(key=lambda name: PLATFORMS[name][2] == "auto")
+    names += [alias for alias, name in PLATFORM_ALIASES.items() if name in names]
+    return names
+
+
 def parse_remaining(remaining):
     """
     Parse remaining args for JVM and app arguments.
@@ -405,6 +439,8 @@ def build_parsed_args(opts, endpoint=None, jvm_args=None, app_args=None, command
         offline=opts.get("offline", False),
         no_cache=opts.get("no_cache", False),
         timeout=opts.get("timeout", 10),
+        max_downloads=opts.get("max_downloads"),
+        rate_limit=opts.get("rate_limit"),
         # Dependency resolution
         resolver=opts.get("resolver", "auto"),
         direct_only=opts.get("direct_only", False),
@@ -418,8 +454,10 @@ def build_parsed_args(opts, endpoint=None, jvm_args=None, app_args=None, command
         repositories=repositories,
         # Program to run
         main_class=opts.get("main_class"),
+        exec_java=opts.get("exec_java", False),
         # Classpath
         classpath_append=list(opts.get("add_classpath", [])),
+        explicit_classpath=opts.get("explicit_classpath", False),
         # Backward compatibility
         ignore_config=opts.get("ignore_config", False),
         additional_endpoints=None,
@@ -0,0 +1,138 @@
+"""jgo cache - Manage the jgo cache"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+import rich_click as click
+
+from ...config import GlobalSettings
+from ...env import JarStore, collect_garbage
+from ...env._collect import DEFAULT_GRACE_PERIOD, format_size
+from ...exec._config import parse_memory_size
+from .._args import build_parsed_args
+from .._console import console_print
+
+_log = logging.getLogger(__name__)
+
+_SECONDS_PER_DAY = 24 * 60 * 60
+
+
+@click.group(help="Manage the jgo cache.", invoke_without_command=True)
+@click.pass_context
+def cache(ctx):
+    """
+    Manage the jgo cache of environments and JAR metadata.
+
+    Subcommands:
+      gc    - Remove least recently used environments
+      stats - Show the space used and saved by the shared JAR store
+
+    Examples:
+      jgo cache stats
+      jgo cache gc --max-size 2G
+      jgo cache gc --max-age 30
+      jgo --dry-run cache gc --max-size 500M
+    """
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+        ctx.exit(2)
+
+
+@cache.command(help="Remove least recently used environments.")
+@click.option(
+    "--max-size",
+    metavar="SIZE",
+    help="Evict environments until the cache fits this size (e.g. 500M, 2G)",
+)
+@click.option(
+    "--max-age",
+    metavar="DAYS",
+    type=float,
+    help="Remove environments not used for this many days",
+)
+@click.pass_context
+def gc(ctx, max_size, max_age):
+    """
+    Remove least recently used environments from the jgo cache.
+
+    Environments are evicted oldest first until the cache fits --max-size,
+    and those unused for more than --max-age days are removed. Environments
+    in use by a running jgo process, being built, or used within the last
+    few minutes are kept. Metadata and stored JARs (see jar_store) that no
+    remaining environment uses are removed as well. Without options, only
+    those are cleaned up.
+
+    EXAMPLES:
+      jgo cache gc --max-size 2G
+      jgo cache gc --max-age 30
+      jgo --dry-run cache gc --max-size 500M
+    """
+    args, cache_dir = _cache_dir(ctx)
+
+    try:
+        max_bytes = parse_memory_size(max_size) if max_size is not None else None
+    except ValueError as e:
+        _log.error(str(e))
+        ctx.exit(1)
+
+    report = collect_garbage(
+        cache_dir,
+        max_size=max_bytes,
+        max_age=max_age * _SECONDS_PER_DAY if max_age is not None else None,
+        grace_period=DEFAULT_GRACE_PERIOD,
+        dry_run=args.dry_run,
+    )
+
+    verb = "Would remove" if args.dry_run else "Removed"
+    for entry in report.removed:
+        _log.info(f"{verb} {entry.path} ({format_size(entry.size)})")
+    for entry in report.in_use:
+        _log.info(f"Kept {entry.path}: in use")
+    console_print(
+        f"{verb} {len(report.removed)} environment(s), "
+        f"{report.metadata_removed} metadata entries and "
+        f"{report.store_removed} stored JARs, reclaiming "
+        f"{format_size(report.reclaimed_bytes)}; "
+        f"{len(report.kept) + len(report.in_use)} environment(s) kept"
+    )
+    ctx.exit(0)
+
+
+@cache.command(help="Show the space used and saved by the shared JAR store.")
+@click.pass_context
+def stats(ctx):
+    """
+    Show how much space the content-addressed JAR store uses and saves.
+
+    With the jar_store setting enabled, environments hard-link each JAR
+    from one shared copy in the store rather than holding their own.
+
+    EXAMPLES:
+      jgo cache stats
+    """
+    _, cache_dir = _cache_dir(ctx)
+    store = JarStore.for_cache(cache_dir)
+    store_stats = store.stats()
+
+    console_print(f"JAR store: {store.path}")
+    console_print(
+        f"  {store_stats.jars} JARs ({format_size(store_stats.stored_bytes)}), "
+        f"linked {store_stats.links} times by environments"
+    )
+    console_print(
+        f"  Without the store: {format_size(store_stats.linked_bytes)}; "
+        f"saved {format_size(store_stats.saved_bytes)}"
+    )
+    if store_stats.unused:
+        console_print(f"  {store_stats.unused} JARs unused (removed by 'jgo cache gc')")
+    ctx.exit(0)
+
+
+def _cache_dir(ctx):
+    """Parse the global options, and find the jgo cache directory."""
+    opts = ctx.obj
+    config = GlobalSettings.load_from_opts(opts)
+    args = build_parsed_args(opts, command="cache")
+    return args, Path(args.cache_dir or config.cache_dir).expanduser()
@@ -8,7 +8,10 @@ from typing import TYPE_CHECKING
 import rich_click as click
 from rich.markup import escape
 
-from ...config import GlobalSettings, get_settings_path, parse_config_key
+from ...config import GlobalSettings, get_settings_path, parse_bool, parse_config_key
+from ...exec._config import parse_memory_size
+from ...maven import UpdatePolicy
+from ...maven._scheduler import DEFAULT_MAX_DOWNLOADS, LARGE_FILE_SIZE
 from ...styles import JGO_CONF_GLOBAL, JGO_TOML, error, filepath
 from ...util.toml import load_toml_file
 from .._args import build_parsed_args
@@ -136,6 +139,18 @@ def _list_jgorc(config_file: Path, args: ParsedArgs) -> int:
     console_print(f"  cache_dir = {settings.cache_dir}")
     console_print(f"  repo_cache = {settings.repo_cache}")
     console_print(f"  links = {settings.links}")
+    if settings.update_policy != "daily":
+        console_print(f"  update_policy = {settings.update_policy}")
+    if settings.floating_policy:
+        console_print(f"  floating_policy = {settings.floating_policy}")
+    if settings.jar_store:
+        console_print("  jar_store = true")
+    if settings.max_downloads is not None:
+        console_print(f"  max_downloads = {settings.max_downloads}")
+    if settings.rate_limit:
+        console_print(f"  rate_limit = {settings.rate_limit}")
+    if settings.large_file_size:
+        console_print(f"  large_file_size = {settings.large_file_size}")
     console_print()
 
     # Print [repositories] section if any
@@ -145,6 +160,20 @@ def _list_jgorc(config_file: Path, args: ParsedArgs) -> int:
             console_print(f"  {name} = {url}")
         console_print()
 
+    # Print [update_policies] section if any
+    if settings.update_policies:
+        console_print(escape("[update_policies]"))
+        for name, policy in settings.update_policies.items():
+            console_print(f"  {name} = {policy}")
+        console_print()
+
+    # Print [routes] section if any
+    if settings.routes:
+        console_print(escape("[routes]"))
+        for pattern, repos in settings.routes.items():
+            console_print(f"  {pattern} = {repos}")
+        console_print()
+
     # Print [shortcuts] section if any
     if settings.shortcuts:
         console_print(escape("[shortcuts]"))
@@ -215,6 +244,18 @@ def _get_jgorc(config_file: Path, section: str, key: str, args: ParsedArgs) -> i
             console_print(settings.repo_cache)
         elif key == "links":
             console_print(settings.links)
+        elif key == "update_policy":
+            console_print(settings.update_policy)
+        elif key == "floating_policy":
+            console_print(settings.floating_policy or settings.update_policy)
+        elif key == "jar_store":
+            console_print(str(settings.jar_store).lower())
+        elif key == "max_downloads":
+            console_print(settings.max_downloads or DEFAULT_MAX_DOWNLOADS)
+        elif key == "rate_limit":
+            console_print(settings.rate_limit or "none")
+        elif key == "large_file_size":
+            console_print(settings.large_file_size or LARGE_FILE_SIZE)
         else:
             _log.error(f"Unknown setting: {key}")
             return 1
@@ -230,6 +271,18 @@ def _get_jgorc(config_file: Path, section: str, key: str, args: ParsedArgs) -> i
         else:
             _log.error(f"Shortcut '{key}' not found")
             return 1
+    elif section == "update_policies":
+        if key in settings.update_policies:
+            console_print(settings.update_policies[key])
+        else:
+            _log.error(f"No update policy for repository '{key}'")
+            return 1
+    elif section == "routes":
+        if key in settings.routes:
+            console_print(settings.routes[key])
+        else:
+            _log.error(f"No route for '{key}'")
+            return 1
     else:
         _log.error(f"Unknown section: [{section}]")
         return 1
@@ -278,13 +331,54 @@ def _set_jgorc(
     import configparser
 
     # Validate section and key
-    valid_settings = ("cache_dir", "repo_cache", "links")
+    valid_settings = (
+        "cache_dir",
+        "repo_cache",
+        "links",
+        "update_policy",
+        "floating_policy",
+        "jar_store",
+        "max_downloads",
+        "rate_limit",
+        "large_file_size",
+    )
     if section == "settings" and key not in valid_settings:
         _log.error(f"Unknown setting: {key}")
         return 1
-    elif section not in ("settings", "repositories", "shortcuts"):
+    elif section not in (
+        "settings",
+        "repositories",
+        "shortcuts",
+        "update_policies",
+        "routes",
+    ):
         _log.error(f"Unknown section: [{section}]")
         return 1
+    if key in ("update_policy", "floating_policy") or section == "update_policies":
+        try:
+            UpdatePolicy(value)
+        except ValueError as e:
+            _log.error(str(e))
+            return 1
+    if section == "settings" and key == "jar_store":
+        try:
+            parse_bool(value)
+        except ValueError as e:
+            _log.error(str(e))
+            return 1
+    if (
+        section == "settings"
+        and key == "max_downloads"
+        and (not value.isdigit() or int(value) < 1)
+    ):
+        _log.error(f"Invalid max_downloads: {value}")
+        return 1
+    if section == "settings" and key in ("rate_limit", "large_file_size"):
+        try:
+            parse_memory_size(value)
+        except ValueError as e:
+            _log.error(str(e))
+            return 1
 
     # Load existing config
     parser = configparser.ConfigParser()
@@ -19,6 +19,7 @@ from .._context import create_environment_builder, create_maven_context
 from .._output import (
     print_classpath,
     print_dependencies,
+    print_duplicate_classes,
     print_jars,
     print_java_info,
     print_main_classes,
@@ -201,6 +202,37 @@ def mains(ctx, endpoint):
     ctx.exit(0)
 
 
+@click.command(help="Show classes duplicated across JARs.")
+@click.argument("endpoint", required=False)
+@click.pass_context
+def duplicates(ctx, endpoint):
+    """List classes present in more than one JAR, and which copy wins."""
+
+    opts = ctx.obj
+    config = GlobalSettings.load_from_opts(opts)
+    args = build_parsed_args(opts, endpoint=endpoint, command="info")
+
+    context = create_maven_context(args, config.to_dict())
+    builder = create_environment_builder(args, config.to_dict(), context)
+
+    # Build environment
+    if args.is_spec_mode():
+        spec_file = args.get_spec_file()
+        if not spec_file.exists():
+            _log.error(f"{spec_file} not found")
+            ctx.exit(1)
+        spec = EnvironmentSpec.load(spec_file)
+        environment = _from_spec_or_die(ctx, builder, spec, args.update)
+    else:
+        if not endpoint:
+            _log.error("No endpoint specified")
+            ctx.exit(1)
+        environment = builder.from_endpoint(endpoint, update=args.update)
+
+    print_duplicate_classes(environment)
+    ctx.exit(0)
+
+
 @click.command(help="Show dependency tree.")
 @click.argument("endpoint", required=False)
 @click.pass_context
@@ -12,9 +12,16 @@ from ...env import EnvironmentSpec, LockFile, compute_spec_hash
 from ...styles import JGO_LOCK_TOML
 from ...util.logging import log_exception_if_verbose
 from .._args import build_parsed_args
-from .._context import create_environment_builder, create_maven_context
+from .._context import (
+    create_environment_builder,
+    create_maven_context,
+    create_profile_constraints,
+    lock_file_path,
+)
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from .._args import ParsedArgs
 
 _log = logging.getLogger(__name__)
@@ -26,24 +33,36 @@ _log = logging.getLogger(__name__)
     is_flag=True,
     help="Check if lock file is up to date",
 )
+@click.option(
+    "--platforms",
+    metavar="LIST",
+    help="Lock for these platforms together, e.g. linux-x64,macos-arm64",
+)
 @click.pass_context
-def lock(ctx, check):
+def lock(ctx, check, platforms):
     """
     Update jgo.lock.toml without building the environment.
 
     Useful for updating the lock file when RELEASE versions are involved,
     or to verify the lock file is up to date.
 
+    With --platforms, one lock file per platform (jgo.lock.<platform>.toml)
+    is written instead, from a single resolution in which only the POMs
+    depending on the platform (e.g. through natives classifiers) are
+    resolved more than once. Platform names are those of --platform.
+
     EXAMPLES:
       jgo lock
       jgo lock --check
       jgo lock --update
+      jgo lock --platforms linux-x64,linux-arm64,macos-arm64
     """
 
     opts = ctx.obj
     config = GlobalSettings.load_from_opts(opts)
     args = build_parsed_args(opts, command="lock")
     args.check = check
+    args.platforms = [p.strip() for p in platforms.split(",")] if platforms else []
 
     exit_code = execute(args, config.to_dict())
     ctx.exit(exit_code)
@@ -63,7 +82,11 @@ def execute(args: ParsedArgs, config: dict) -> int:
 
     # Get the spec file path
     spec_file = args.get_spec_file()
-    lock_file = spec_file.parent / "jgo.lock.toml"
+    platforms = getattr(args, "platforms", [])
+    if platforms:
+        lock_files = [lock_file_path(spec_file, name) for name in platforms]
+    else:
+        lock_files = [lock_file_path(spec_file)]
 
     try:
         spec = EnvironmentSpec.load_or_error(spec_file)
@@ -73,30 +96,11 @@ def execute(args: ParsedArgs, config: dict) -> int:
 
     # Check if --check mode
     if getattr(args, "check", False):
-        if not lock_file.exists():
-            _log.error("Lock file does not exist")
-            _log.info("Run 'jgo lock' to generate it")
-            return 1
-
-        # Validate lock file
-        try:
-            lockfile = LockFile.load(lock_file)
-
-            # Check if spec has changed since lockfile was generated
-            if lockfile.spec_hash:
-                current_hash = compute_spec_hash(spec_file)
-                if current_hash != lockfile.spec_hash:
-                    _log.error("Lock file is out of date (jgo.toml has changed)")
-                    _log.info("Run 'jgo lock' to update it")
-                    return 1
-
-            _log.info("Lock file is up to date")
-            return 0
-
-        except Exception as e:
-            _log.error(f"Failed to validate lock file: {e}")
-            log_exception_if_verbose(args.verbose)
-            return 1
+        for lock_file in lock_files:
+            if not _check(lock_file, spec_file, args):
+                return 1
+        _log.info("Lock file is up to date")
+        return 0
 
     _log.debug(f"Updating lock file for {spec_file}")
 
@@ -109,14 +113,22 @@ def execute(args: ParsedArgs, config: dict) -> int:
 
         # Resolve and generate lockfile without building environment
         _log.info(f"Resolving dependencies from {spec_file.name}...")
-        lockfile = builder.resolve_lockfile(spec)
-
-        # Save lockfile
-        lockfile.save(lock_file)
-        _log.info(f"Lock file saved to {lock_file}")
-        _log.info(f"  {len(lockfile.dependencies)} dependencies resolved")
-        if lockfile.entrypoints:
-            _log.info(f"  {len(lockfile.entrypoints)} entrypoints found")
+        if platforms:
+            constraints = {
+                name: create_profile_constraints(args, name) for name in platforms
+            }
+            resolved = builder.resolve_lockfiles(spec, constraints)
+            lockfiles = [resolved[name] for name in platforms]
+        else:
+            lockfiles = [builder.resolve_lockfile(spec)]
+
+        # Save lockfiles
+        for lock_file, lockfile in zip(lock_files, lockfiles):
+            lockfile.save(lock_file)
+            _log.info(f"Lock file saved to {lock_file}")
+            _log.info(f"  {len(lockfile.dependencies)} dependencies resolved")
+            if lockfile.entrypoints:
+                _log.info(f"  {len(lockfile.entrypoints)} entrypoints found")
 
         return 0
 
@@ -124,3 +136,31 @@ def execute(args: ParsedArgs, config: dict) -> int:
         _log.error(f"Failed to generate lock file: {e}")
         log_exception_if_verbose(args.verbose)
         return 1
+
+
+def _check(lock_file: Path, spec_file: Path, args: ParsedArgs) -> bool:
+    """Check that a lock file exists and is up to date with the spec file."""
+    if not lock_file.exists():
+        _log.error(f"Lock file {lock_file.name} does not exist")
+        _log.info("Run 'jgo lock' to generate it")
+        return False
+
+    # Validate lock file
+    try:
+        lockfile = LockFile.load(lock_file)
+
+        # Check if spec has changed since lockfile was generated
+        if lockfile.spec_hash:
+            current_hash = compute_spec_hash(spec_file)
+            if current_hash != lockfile.spec_hash:
+                _log.error(
+                    f"Lock file {lock_file.name} is out of date (jgo.toml has changed)"
+                )
+                _log.info("Run 'jgo lock' to update it")
+                return False
+        return True
+
+    except Exception as e:
+        _log.error(f"Failed to validate lock file: {e}")
+        log_exception_if_verbose(args.verbose)
+        return False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -98,6 +99,12 @@ _GLOBAL_FLAGS: frozenset[str] = frozenset([
     metavar="PATH",
     help=f"Append to classpath ({secondary('JARs, directories, etc.')})",
 )
+@click.option(
+    "--explicit-classpath",
+    is_flag=True,
+    help="List JARs individually on the classpath, in dependency resolution "
+    f"order {secondary('(instead of directory wildcards)')}",
+)
 @click.option(
     "--global",
     "force_global",
@@ -110,6 +117,13 @@ _GLOBAL_FLAGS: frozenset[str] = frozenset([
     is_flag=True,
     help=f"Force {JGO_TOML} project mode even when an endpoint-like argument is present.",
 )
+@click.option(
+    "--exec/--no-exec",
+    "exec_java",
+    default=None,
+    help="Replace the jgo process with the JVM instead of waiting for it as a "
+    f"child process {secondary('(default: --exec on POSIX systems)')}",
+)
 @click.argument(
     "endpoint",
     required=False,
@@ -131,8 +145,10 @@ def run(
     main_class,
     entrypoint,
     add_classpath,
+    explicit_classpath,
     force_global,
     force_local,
+    exec_java,
     endpoint,
     remaining,
 ):
@@ -180,8 +196,11 @@ def run(
         opts["entrypoint"] = entrypoint
     if add_classpath:
         opts["add_classpath"] = add_classpath
+    if explicit_classpath:
+        opts["explicit_classpath"] = True
     if force_global:
         opts["force_global"] = True
+    opts["exec_java"] = os.name == "posix" if exec_java is None else exec_java
 
     # --local: force spec/project mode.  Click may have captured a positional
     # token as `endpoint` (e.g. when the user typed `-- script.groovy` and
@@ -323,6 +342,7 @@ def _run_spec(args: ParsedArgs, config: dict) -> int:
         print_command=debug,
         dry_run=args.dry_run,
         module_mode=args.module_mode,
+        exec_java=args.exec_java,
     )
 
     return result.returncode
@@ -395,6 +415,7 @@ def _run_endpoint(args: ParsedArgs, config: dict) -> int:
         print_command=debug,
         dry_run=args.dry_run,
         module_mode=args.module_mode,
+        exec_java=args.exec_java,
     )
 
     return result.returncode
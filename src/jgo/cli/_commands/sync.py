@@ -12,7 +12,11 @@ from ...env import EnvironmentSpec, LockFile
 from ...styles import action, syntax
 from ...util.logging import is_info_enabled, log_exception_if_verbose
 from .._args import build_parsed_args
-from .._context import create_environment_builder, create_maven_context
+from .._context import (
+    create_environment_builder,
+    create_maven_context,
+    find_lock_file,
+)
 from .._output import handle_dry_run
 
 if TYPE_CHECKING:
@@ -31,18 +35,30 @@ _log = logging.getLogger(__name__)
     is_flag=True,
     help=f"Force rebuild even if {syntax('cached')}",
 )
+@click.option(
+    "--frozen",
+    is_flag=True,
+    help="Install exactly what jgo.lock.toml lists, without resolving",
+)
 @click.pass_context
-def sync(ctx, force):
+def sync(ctx, force, frozen):
     """
     Resolve dependencies and build environment in .jgo/ directory.
 
     Reads jgo.toml, resolves all dependencies using Maven, and creates
     the local environment directory with all JARs linked.
 
+    With --frozen, nothing is resolved: the JARs listed in jgo.lock.toml
+    (see 'jgo lock'), or in the jgo.lock.<platform>.toml written by
+    'jgo lock --platforms' for the current platform, are fetched, checked against their recorded SHA-256
+    and linked as recorded. This fails if the lock file is missing or out
+    of date with jgo.toml, which makes it suited to reproducible CI builds.
+
     EXAMPLES:
       jgo sync
       jgo sync --force
       jgo sync --offline
+      jgo sync --frozen
       jgo sync -u  # Update to latest versions
     """
 
@@ -50,6 +66,7 @@ def sync(ctx, force):
     config = GlobalSettings.load_from_opts(opts)
     args = build_parsed_args(opts, command="sync")
     args.force = force
+    args.frozen = frozen
 
     exit_code = execute(args, config.to_dict())
     ctx.exit(exit_code)
@@ -83,6 +100,11 @@ def execute(args: ParsedArgs, config: dict) -> int:
         _log.debug(f"  Description: {spec.description}")
     _log.debug(f"  Dependencies: {len(spec.coordinates)}")
 
+    frozen = getattr(args, "frozen", False)
+    if frozen and args.update:
+        _log.error("--frozen installs the lock file as is; it cannot --update")
+        return 1
+
     # Dry run mode
     if handle_dry_run(args, f"Would sync environment from {spec_file}"):
         return 0
@@ -114,6 +136,16 @@ def execute(args: ParsedArgs, config: dict) -> int:
                 except Exception:
                     pass  # Ignore errors loading old lockfile
 
+        if frozen:
+            lock_path = find_lock_file(args, spec_file)
+            if not lock_path.exists():
+                _log.error(f"{lock_path} does not exist")
+                _log.info("Run 'jgo lock' to generate it")
+                return 1
+            env = builder.from_lockfile(spec, LockFile.load(lock_path), update=update)
+            _log.debug(f"Environment built at: {env.path}")
+            return 0
+
         # Build environment from spec
         env = builder.from_spec(spec, update=update)
 
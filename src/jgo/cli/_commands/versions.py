@@ -67,7 +67,7 @@ def execute(args: ParsedArgs, config: dict) -> int:
 
     try:
         # Update metadata from remote
-        project.update()
+        project.update(force=args.update)
 
         # Get available versions
         metadata = project.metadata
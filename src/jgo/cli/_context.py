@@ -11,9 +11,16 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from ..constants import MAVEN_CENTRAL_URL, default_maven_repo
-from ..env import EnvironmentBuilder, EnvironmentSpec, LinkStrategy
-from ..exec import JavaRunner, JavaSource, JVMConfig, is_gc_flag, normalize_gc_flag
+from ..constants import MAVEN_CENTRAL_URL, default_jgo_cache, default_maven_repo
+from ..env import EnvironmentBuilder, EnvironmentSpec, JarStore, LinkStrategy
+from ..exec import (
+    JavaRunner,
+    JavaSource,
+    JVMConfig,
+    is_gc_flag,
+    normalize_gc_flag,
+    parse_memory_size,
+)
 from ..maven import (
     MavenContext,
     MvnResolver,
@@ -23,6 +30,7 @@ from ..maven import (
 )
 from ..util.logging import is_debug_enabled, is_info_enabled
 from ..util.mvn import ensure_maven_available
+from ._args import detect_os_properties, expand_platform, platform_names
 from .rich._progress import download_progress_callback
 
 if TYPE_CHECKING:
@@ -31,6 +39,110 @@ if TYPE_CHECKING:
 _log = logging.getLogger(__name__)
 
 
+def create_profile_constraints(
+    args: ParsedArgs, platform: str | None = None
+) -> ProfileConstraints:
+    """
+    Create profile constraints from parsed arguments.
+
+    Args:
+        args: Parsed command line arguments
+        platform: Platform (e.g. 'linux-x64', see PLATFORMS) to constrain the
+            OS to, instead of the one given by the arguments
+
+    Returns:
+        ProfileConstraints for the Python resolver
+    """
+    os_name, os_family, os_arch = args.os_name, args.os_family, args.os_arch
+    os_version = args.os_version
+    if platform is not None:
+        os_name, os_family, os_arch = expand_platform(platform)
+        if os_name is None:
+            raise ValueError(f"Unknown platform: {platform}")
+        if os_arch == "auto":
+            os_arch = detect_os_properties()[2]
+        # The OS version of this machine says nothing about the platform's
+        os_version = None
+    return ProfileConstraints(
+        jdk=str(args.java_version) if args.java_version else None,
+        os_name=os_name,
+        os_family=os_family,
+        os_arch=os_arch,
+        os_version=os_version,
+        properties=args.properties,
+        lenient=args.lenient,
+    )
+
+
+def lock_file_path(spec_file: Path, platform: str | None = None) -> Path:
+    """
+    Get the path of the lock file of a spec file.
+
+    Args:
+        spec_file: Path to jgo.toml
+        platform: Platform (e.g. 'linux-x64') of the lock file, as written by
+            'jgo lock --platforms'; None for jgo.lock.toml
+
+    Returns:
+        Path to jgo.lock.toml or jgo.lock.<platform>.toml
+    """
+    name = f"jgo.lock.{platform}.toml" if platform else "jgo.lock.toml"
+    return spec_file.parent / name
+
+
+def find_lock_file(args: ParsedArgs, spec_file: Path) -> Path:
+    """
+    Find the lock file of a spec file for the platform given by the arguments.
+
+    The lock file written by 'jgo lock --platforms' for the platform is
+    preferred when it exists, over jgo.lock.toml.
+
+    Args:
+        args: Parsed command line arguments
+        spec_file: Path to jgo.toml
+
+    Returns:
+        Path to the lock file (which may not exist)
+    """
+    for platform in platform_names(args.os_name, args.os_arch):
+        path = lock_file_path(spec_file, platform)
+        if path.exists():
+            return path
+    return lock_file_path(spec_file)
+
+
+def create_python_resolver(args: ParsedArgs, config: dict) -> PythonResolver:
+    """
+    Create the pure Python resolver from parsed arguments and configuration.
+
+    Args:
+        args: Parsed command line arguments
+        config: Global settings
+
+    Returns:
+        Configured PythonResolver instance
+
+    Raises:
+        ValueError: If the rate limit or large file size is not a valid size
+    """
+    # Download scheduling; command line options override the settings
+    downloads: dict = {}
+    max_downloads = args.max_downloads or config.get("max_downloads")
+    if max_downloads:
+        downloads["max_downloads"] = max_downloads
+    rate_limit = args.rate_limit or config.get("rate_limit")
+    if rate_limit:
+        downloads["rate_limit"] = parse_memory_size(rate_limit)
+    if config.get("large_file_size"):
+        downloads["large_file_size"] = parse_memory_size(config["large_file_size"])
+
+    return PythonResolver(
+        profile_constraints=create_profile_constraints(args),
+        progress_callback=download_progress_callback,
+        **downloads,
+    )
+
+
 def create_maven_context(args: ParsedArgs, config: dict) -> MavenContext:
     """
     Create Maven context from parsed arguments and configuration.
@@ -45,38 +157,14 @@ def create_maven_context(args: ParsedArgs, config: dict) -> MavenContext:
 
     # Determine resolver
     if args.resolver == "python":
-        profile_constraints = ProfileConstraints(
-            jdk=str(args.java_version) if args.java_version else None,
-            os_name=args.os_name,
-            os_family=args.os_family,
-            os_arch=args.os_arch,
-            os_version=args.os_version,
-            properties=args.properties,
-            lenient=args.lenient,
-        )
-        resolver: Resolver = PythonResolver(
-            profile_constraints=profile_constraints,
-            progress_callback=download_progress_callback,
-        )
+        resolver: Resolver = create_python_resolver(args, config)
     elif args.resolver == "mvn":
         mvn_command = ensure_maven_available()
         resolver = MvnResolver(
             mvn_command, update=args.update, debug=is_debug_enabled()
         )
     else:  # auto
-        profile_constraints = ProfileConstraints(
-            jdk=str(args.java_version) if args.java_version else None,
-            os_name=args.os_name,
-            os_family=args.os_family,
-            os_arch=args.os_arch,
-            os_version=args.os_version,
-            properties=args.properties,
-            lenient=args.lenient,
-        )
-        resolver = PythonResolver(
-            profile_constraints=profile_constraints,
-            progress_callback=download_progress_callback,
-        )  # Default to pure Python
+        resolver = create_python_resolver(args, config)  # Default to pure Python
 
     # Get repo cache path
     repo_cache = args.repo_cache
@@ -99,12 +187,26 @@ def create_maven_context(args: ParsedArgs, config: dict) -> MavenContext:
     if args.repositories:
         remote_repos.update(args.repositories)
 
+    # Metadata update policies; --update forces a check of every repository
+    floating_policy: str | None
+    if args.update:
+        update_policy, update_policies = "always", {}
+        floating_policy = "always"
+    else:
+        update_policy = config.get("update_policy", "daily")
+        update_policies = config.get("update_policies", {})
+        floating_policy = config.get("floating_policy")
+
     # Create context
     return MavenContext(
         resolver=resolver,
         repo_cache=repo_cache,
         remote_repos=remote_repos,
         timeout=args.timeout,
+        update_policy=update_policy,
+        update_policies=update_policies,
+        routes=config.get("routes", {}),
+        floating_policy=floating_policy,
     )
 
 
@@ -127,6 +229,7 @@ def create_environment_builder(
         "hard": LinkStrategy.HARD,
         "soft": LinkStrategy.SOFT,
         "copy": LinkStrategy.COPY,
+        "reflink": LinkStrategy.REFLINK,
         "auto": LinkStrategy.AUTO,
     }
 
@@ -144,11 +247,17 @@ def create_environment_builder(
         cache_dir = config.get("cache_dir")
     # If still None, EnvironmentBuilder will auto-detect
 
+    # Content-addressed JAR store shared by all environments of the cache
+    jar_store = None
+    if config.get("jar_store"):
+        jar_store = JarStore.for_cache(cache_dir or default_jgo_cache())
+
     return EnvironmentBuilder(
         context=context,
         cache_dir=cache_dir,
         link_strategy=link_strategy,
         optional_depth=args.get_effective_optional_depth(),
+        jar_store=jar_store,
     )
 
 
@@ -313,4 +422,5 @@ def create_java_runner(
         java_version=args.java_version,
         java_vendor=args.java_vendor,
         verbose=verbose,
+        explicit_classpath=args.explicit_classpath,
     )
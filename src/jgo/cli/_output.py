@@ -14,7 +14,9 @@ from rich.panel import Panel
 from ..env import (
     analyze_jar_bytecode,
     bytecode_to_java_version,
+    find_duplicate_classes,
     find_main_classes,
+    group_shadowed_classes,
     round_to_lts,
 )
 from ..styles import critical, filepath, header, secondary, tip, warning
@@ -175,6 +177,39 @@ def print_main_classes(environment: Environment) -> None:
         console_print()
 
 
+def print_duplicate_classes(environment: Environment) -> None:
+    """
+    Print classes that appear in more than one JAR of the environment.
+
+    JARs are considered in dependency resolution order, so for each pair the
+    first JAR is the one whose class wins on an explicit classpath.
+
+    Args:
+        environment: The resolved environment
+    """
+    all_jars = environment.ordered_jars()
+    if not all_jars:
+        console_print(critical("No JARs in environment"), stderr=True)
+        return
+
+    shadowed = group_shadowed_classes(find_duplicate_classes(all_jars))
+    if not shadowed:
+        console_print(secondary("No duplicate classes found"), stderr=True)
+        return
+
+    count = sum(len(v) for v in shadowed.values())
+    console_print(f"\n{header(f'Found {count} shadowed duplicate classes:')}\n")
+
+    for (winner, loser), class_names in shadowed.items():
+        console_print(
+            f"{filepath(loser.name)} shadowed by {filepath(winner.name)} "
+            f"({len(class_names)} classes):"
+        )
+        for class_name in class_names:
+            console_print(f"  {class_name}")
+        console_print()
+
+
 def print_dependencies(
     dependencies: list[Dependency],
     context: MavenContext,
@@ -18,11 +18,13 @@ from ._args import (
     PLATFORMS,
 )
 from ._commands.add import add
+from ._commands.cache import cache
 from ._commands.config import config
 from ._commands.info import (
     classpath,
     deplist,
     deptree,
+    duplicates,
     entrypoints,
     envdir,
     jars,
@@ -166,6 +168,21 @@ def global_options(f):
         envvar="JGO_TIMEOUT",
         show_envvar=True,
     )(f)
+    f = click.option(
+        "--max-downloads",
+        type=click.IntRange(min=1),
+        metavar="N",
+        help="Maximum number of concurrent artifact downloads (default: 8).",
+        envvar="JGO_MAX_DOWNLOADS",
+        show_envvar=True,
+    )(f)
+    f = click.option(
+        "--rate-limit",
+        metavar="SIZE",
+        help="Cap the combined download rate, in bytes per second (e.g. 10M).",
+        envvar="JGO_RATE_LIMIT",
+        show_envvar=True,
+    )(f)
     f = click.option(
         "--cache-dir",
         type=click.Path(path_type=Path),
@@ -297,9 +314,10 @@ def global_options(f):
     # Advanced options
     f = click.option(
         "--links",
-        type=click.Choice(["hard", "soft", "copy", "auto"]),
+        type=click.Choice(["hard", "soft", "copy", "reflink", "auto"]),
         default=None,
-        help="How to link JARs: hard, soft, copy, or auto (default: from config or auto)",
+        help="How to link JARs: hard, soft, copy, reflink, or auto "
+        "(default: from config or auto)",
     )(f)
     f = click.option(
         "--lenient",
@@ -401,6 +419,7 @@ def cli(ctx, **kwargs):
 
 # Register top-level commands
 cli.add_command(add)
+cli.add_command(cache)
 cli.add_command(config)
 cli.add_command(init)
 cli.add_command(list_cmd)
@@ -430,6 +449,7 @@ def info(ctx):
       modulepath    - Show module-path (modular JARs only)
       jars          - Show all JARs with section headers
       mains         - Show classes with public main methods
+      duplicates    - Show classes duplicated across JARs
       deptree       - Show dependency tree
       deplist       - Show flat list of dependencies
       envdir        - Show environment directory path
@@ -441,6 +461,7 @@ def info(ctx):
       jgo info classpath org.python:jython-standalone
       jgo info jars org.scijava:scijava-common
       jgo info mains org.scijava:scijava-common
+      jgo info duplicates net.imagej:imagej
       jgo info modulepath org.scijava:scijava-common
       jgo info envdir org.scijava:scijava-common
       jgo info javainfo org.scijava:scijava-common
@@ -460,6 +481,7 @@ def info(ctx):
 info.add_command(classpath)
 info.add_command(deplist)
 info.add_command(deptree)
+info.add_command(duplicates)
 info.add_command(entrypoints)
 info.add_command(envdir)
 info.add_command(jars)
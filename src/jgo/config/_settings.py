@@ -12,6 +12,7 @@ import os
 from pathlib import Path
 
 from ..constants import default_jgo_cache, default_maven_repo
+from ..exec._config import parse_memory_size
 from ._manager import get_settings_path
 
 _log = logging.getLogger(__name__)
@@ -28,6 +29,8 @@ class GlobalSettings:
     The settings file is an INI file with sections:
     - [settings]: General settings (cache_dir, repo_cache, links, etc.)
     - [repositories]: Maven repositories (name = URL)
+    - [update_policies]: Metadata update policy per repository (name = policy)
+    - [routes]: Repositories to try first per groupId (org.scijava.* = scijava)
     - [shortcuts]: Coordinate shortcuts for the CLI
     - [jvm]: JVM configuration (gc, max_heap, min_heap, jvm_args, properties)
     - [styles]: Style mappings for coordinate output colors (g, a, v, p, c, s, etc.)
@@ -42,6 +45,14 @@ class GlobalSettings:
         shortcuts: dict[str, str] | None = None,
         jvm_config: dict | None = None,
         styles: dict[str, str] | None = None,
+        update_policy: str = "daily",
+        update_policies: dict[str, str] | None = None,
+        routes: dict[str, str] | None = None,
+        floating_policy: str | None = None,
+        jar_store: bool = False,
+        max_downloads: int | None = None,
+        rate_limit: str | None = None,
+        large_file_size: str | None = None,
     ):
         """
         Initialize configuration.
@@ -49,11 +60,24 @@ class GlobalSettings:
         Args:
             cache_dir: jgo cache directory (defaults to ~/.cache/jgo)
             repo_cache: Maven repository cache (defaults to ~/.m2/repository)
-            links: Link strategy (hard, soft, copy, auto)
+            links: Link strategy (hard, soft, copy, reflink, auto)
             repositories: Maven repositories (name -> URL)
             shortcuts: Coordinate shortcuts
             jvm_config: JVM configuration (gc, max_heap, min_heap, jvm_args, properties)
             styles: Style mappings for coordinate output (key -> Rich color/style)
+            update_policy: How often remote maven-metadata.xml is re-checked
+                (always, daily, interval:N, never)
+            update_policies: Update policy overrides per repository (name -> policy)
+            routes: Repositories to try first per groupId (pattern -> names)
+            floating_policy: How long resolved RELEASE/LATEST versions are
+                reused (an update policy; defaults to update_policy)
+            jar_store: Whether environments hard-link their JARs from a
+                content-addressed store in cache_dir
+            max_downloads: Maximum number of concurrent artifact downloads
+            rate_limit: Cap on the combined download rate, in bytes per
+                second with optional K/M/G suffix (e.g. 10M)
+            large_file_size: Size from which a download counts as large and
+                starts early on a reserved connection (e.g. 4M)
         """
 
         self.cache_dir = cache_dir or default_jgo_cache()
@@ -63,6 +87,14 @@ class GlobalSettings:
         self.shortcuts = shortcuts or {}
         self.jvm_config = jvm_config or {}
         self.styles = styles or {}
+        self.update_policy = update_policy
+        self.update_policies = update_policies or {}
+        self.routes = routes or {}
+        self.floating_policy = floating_policy
+        self.jar_store = jar_store
+        self.max_downloads = max_downloads
+        self.rate_limit = rate_limit
+        self.large_file_size = large_file_size
 
     @classmethod
     def load(cls, settings_file: Path | None = None) -> GlobalSettings:
@@ -127,6 +159,14 @@ class GlobalSettings:
             shortcuts={},
             jvm_config={},
             styles={},
+            update_policy="daily",
+            update_policies={},
+            routes={},
+            floating_policy=None,
+            jar_store=False,
+            max_downloads=None,
+            rate_limit=None,
+            large_file_size=None,
         )
 
     @classmethod
@@ -152,6 +192,12 @@ class GlobalSettings:
         cache_dir = base_config.cache_dir
         repo_cache = base_config.repo_cache
         links = base_config.links
+        update_policy = base_config.update_policy
+        floating_policy = base_config.floating_policy
+        jar_store = base_config.jar_store
+        max_downloads = base_config.max_downloads
+        rate_limit = base_config.rate_limit
+        large_file_size = base_config.large_file_size
 
         if parser.has_section("settings"):
             # Handle both old and new setting names
@@ -175,12 +221,56 @@ class GlobalSettings:
             if parser.has_option("settings", "links"):
                 links = parser.get("settings", "links")
 
+            if parser.has_option("settings", "update_policy"):
+                update_policy = parser.get("settings", "update_policy")
+
+            if parser.has_option("settings", "floating_policy"):
+                floating_policy = parser.get("settings", "floating_policy")
+
+            if parser.has_option("settings", "jar_store"):
+                try:
+                    jar_store = parser.getboolean("settings", "jar_store")
+                except ValueError:
+                    _log.warning(
+                        "Invalid jar_store setting: "
+                        f"{parser.get('settings', 'jar_store')}"
+                    )
+
+            if parser.has_option("settings", "max_downloads"):
+                try:
+                    max_downloads = parser.getint("settings", "max_downloads")
+                except ValueError:
+                    _log.warning(
+                        "Invalid max_downloads setting: "
+                        f"{parser.get('settings', 'max_downloads')}"
+                    )
+
+            if parser.has_option("settings", "rate_limit"):
+                rate_limit = _size_setting(parser, "rate_limit", rate_limit)
+
+            if parser.has_option("settings", "large_file_size"):
+                large_file_size = _size_setting(
+                    parser, "large_file_size", large_file_size
+                )
+
         # Parse [repositories] section
         repositories = dict(base_config.repositories)
         if parser.has_section("repositories"):
             for name, url in parser.items("repositories"):
                 repositories[name] = url
 
+        # Parse [update_policies] section
+        update_policies = dict(base_config.update_policies)
+        if parser.has_section("update_policies"):
+            for name, policy in parser.items("update_policies"):
+                update_policies[name] = policy
+
+        # Parse [routes] section
+        routes = dict(base_config.routes)
+        if parser.has_section("routes"):
+            for pattern, repos in parser.items("routes"):
+                routes[pattern] = repos
+
         # Parse [shortcuts] section
         shortcuts = dict(base_config.shortcuts)
         if parser.has_section("shortcuts"):
@@ -223,6 +313,14 @@ class GlobalSettings:
             shortcuts=shortcuts,
             jvm_config=jvm_config,
             styles=styles,
+            update_policy=update_policy,
+            update_policies=update_policies,
+            routes=routes,
+            floating_policy=floating_policy,
+            jar_store=jar_store,
+            max_downloads=max_downloads,
+            rate_limit=rate_limit,
+            large_file_size=large_file_size,
         )
 
     @classmethod
@@ -260,6 +358,14 @@ class GlobalSettings:
             shortcuts=settings.shortcuts,
             jvm_config=settings.jvm_config,
             styles=settings.styles,
+            update_policy=settings.update_policy,
+            update_policies=settings.update_policies,
+            routes=settings.routes,
+            floating_policy=settings.floating_policy,
+            jar_store=settings.jar_store,
+            max_downloads=settings.max_downloads,
+            rate_limit=settings.rate_limit,
+            large_file_size=settings.large_file_size,
         )
 
     def to_dict(self) -> dict:
@@ -277,6 +383,14 @@ class GlobalSettings:
             "shortcuts": self.shortcuts,
             "jvm": self.jvm_config,  # Note: key is "jvm" not "jvm_config" for consistency with INI file
             "styles": self.styles,
+            "update_policy": self.update_policy,
+            "update_policies": self.update_policies,
+            "routes": self.routes,
+            "floating_policy": self.floating_policy,
+            "jar_store": self.jar_store,
+            "max_downloads": self.max_downloads,
+            "rate_limit": self.rate_limit,
+            "large_file_size": self.large_file_size,
         }
 
     def expand_shortcuts(self, coordinate: str) -> str:
@@ -356,6 +470,18 @@ class GlobalSettings:
         parser.set("settings", "cache_dir", str(self.cache_dir))
         parser.set("settings", "repo_cache", str(self.repo_cache))
         parser.set("settings", "links", self.links)
+        if self.update_policy != "daily":
+            parser.set("settings", "update_policy", self.update_policy)
+        if self.floating_policy:
+            parser.set("settings", "floating_policy", self.floating_policy)
+        if self.jar_store:
+            parser.set("settings", "jar_store", "true")
+        if self.max_downloads is not None:
+            parser.set("settings", "max_downloads", str(self.max_downloads))
+        if self.rate_limit:
+            parser.set("settings", "rate_limit", self.rate_limit)
+        if self.large_file_size:
+            parser.set("settings", "large_file_size", self.large_file_size)
 
         # Write [repositories] section
         if self.repositories:
@@ -363,6 +489,18 @@ class GlobalSettings:
             for name, url in self.repositories.items():
                 parser.set("repositories", name, url)
 
+        # Write [update_policies] section
+        if self.update_policies:
+            parser.add_section("update_policies")
+            for name, policy in self.update_policies.items():
+                parser.set("update_policies", name, policy)
+
+        # Write [routes] section
+        if self.routes:
+            parser.add_section("routes")
+            for pattern, repos in self.routes.items():
+                parser.set("routes", pattern, repos)
+
         # Write [shortcuts] section
         if self.shortcuts:
             parser.add_section("shortcuts")
@@ -384,7 +522,9 @@ class GlobalSettings:
         Set a value in the [settings] section.
 
         Args:
-            key: Setting name (cache_dir, repo_cache, links)
+            key: Setting name (cache_dir, repo_cache, links, update_policy,
+                floating_policy, jar_store, max_downloads, rate_limit,
+                large_file_size)
             value: Setting value
         """
         if key == "cache_dir":
@@ -393,6 +533,20 @@ class GlobalSettings:
             self.repo_cache = Path(value).expanduser()
         elif key == "links":
             self.links = value
+        elif key == "update_policy":
+            self.update_policy = value
+        elif key == "floating_policy":
+            self.floating_policy = value
+        elif key == "jar_store":
+            self.jar_store = parse_bool(value)
+        elif key == "max_downloads":
+            self.max_downloads = int(value)
+        elif key == "rate_limit":
+            parse_memory_size(value)
+            self.rate_limit = value
+        elif key == "large_file_size":
+            parse_memory_size(value)
+            self.large_file_size = value
         else:
             raise ValueError(f"Unknown setting: {key}")
 
@@ -421,7 +575,9 @@ class GlobalSettings:
         Reset a setting to its default value.
 
         Args:
-            key: Setting name (cache_dir, repo_cache, links)
+            key: Setting name (cache_dir, repo_cache, links, update_policy,
+                floating_policy, jar_store, max_downloads, rate_limit,
+                large_file_size)
         """
         defaults = self._default_config()
         if key == "cache_dir":
@@ -430,6 +586,18 @@ class GlobalSettings:
             self.repo_cache = defaults.repo_cache
         elif key == "links":
             self.links = defaults.links
+        elif key == "update_policy":
+            self.update_policy = defaults.update_policy
+        elif key == "floating_policy":
+            self.floating_policy = defaults.floating_policy
+        elif key == "jar_store":
+            self.jar_store = defaults.jar_store
+        elif key == "max_downloads":
+            self.max_downloads = defaults.max_downloads
+        elif key == "rate_limit":
+            self.rate_limit = defaults.rate_limit
+        elif key == "large_file_size":
+            self.large_file_size = defaults.large_file_size
         else:
             raise ValueError(f"Unknown setting: {key}")
 
@@ -475,3 +643,35 @@ def parse_config_key(key: str, default_section: str = "settings") -> tuple[str,
         section, name = key.split(".", 1)
         return section, name
     return default_section, key
+
+
+def _size_setting(
+    parser: configparser.ConfigParser, key: str, default: str | None
+) -> str | None:
+    """Get a size setting such as 10M from [settings], if it is valid."""
+    value = parser.get("settings", key)
+    try:
+        parse_memory_size(value)
+    except ValueError:
+        _log.warning(f"Invalid {key} setting: {value}")
+        return default
+    return value
+
+
+def parse_bool(value: str) -> bool:
+    """
+    Parse a boolean setting the way configparser does.
+
+    Args:
+        value: One of true/false, yes/no, on/off, 1/0 (case-insensitive)
+
+    Returns:
+        The boolean value
+
+    Raises:
+        ValueError: If value is not a boolean
+    """
+    try:
+        return configparser.ConfigParser.BOOLEAN_STATES[value.strip().lower()]
+    except KeyError:
+        raise ValueError(f"Invalid boolean: {value}") from None
@@ -8,6 +8,7 @@ of Maven coordinates, laid out so that Java can consume them directly:
         jars/           — class-path JARs  (non-modular)
         modules/        — module-path JARs (explicit- or automatic-module JARs)
         jgo.lock.toml   — pinned dependency graph + checksums + entrypoints
+        .manifest.json  — size/mtime/inode of each JAR, to validate cheaply
 
 This module provides the classes needed to create, inspect, and reuse
 environments.
@@ -19,12 +20,14 @@ EnvironmentBuilder
     each JAR as modular/non-modular, links them into the right sub-directory,
     and writes ``jgo.lock.toml``.
 
-    Two construction modes:
+    Three construction modes:
 
     * ``from_endpoint(endpoint)`` — ad-hoc resolution from a coordinate string
       (e.g. ``"org.python:jython-standalone:2.7.3"``).
     * ``from_spec(spec)`` — project-mode resolution from a parsed ``jgo.toml``
       file (see ``EnvironmentSpec``).
+    * ``from_lockfile(spec, lockfile)`` — frozen install of the JARs a
+      ``jgo.lock.toml`` lists, without resolution, checking their SHA-256.
 
     Cache paths:
 
@@ -62,7 +65,8 @@ LinkStrategy
 
     * ``AUTO``   — hard-link when possible, copy otherwise (default)
     * ``HARD``   — always hard-link (error if cross-device)
-    * ``COPY``   — always copy
+    * ``COPY``   — always copy (as a reflink where supported)
+    * ``REFLINK``— copy-on-write clone (error if the filesystem cannot)
     * ``SYMLINK``— symbolic link
 
 EnvironmentSpec
@@ -75,6 +79,13 @@ EnvironmentSpec
     >>> spec.coordinates        # List of Maven coordinate strings
     >>> spec.entrypoints        # Dict of name → class or coordinate
 
+JarStore
+    Optional content-addressed store of JARs, keyed by SHA-256, under
+    ``<cache-dir>/store/``.  An ``EnvironmentBuilder`` given a store copies
+    each distinct JAR into it once and hard-links environments to it, so
+    environments share one copy per JAR even with ``LinkStrategy.COPY``.
+    ``store.stats()`` reports the space saved.
+
 LockFile / LockedDependency
     ``jgo.lock.toml`` data — resolved G:A:V coordinates with SHA-256
     checksums, module names, and minimum Java version.  Written by
@@ -95,9 +106,18 @@ find_main_classes(jar_path)
     List all classes that declare a ``public static void main(String[])``
     method inside a JAR.
 
+find_duplicate_classes(jars) / group_shadowed_classes(duplicates)
+    Find classes present in more than one JAR of a class-path, and group
+    them by which JAR shadows which.
+
 parse_manifest(jar_path) / read_raw_manifest(jar_path)
     Read ``META-INF/MANIFEST.MF`` from a JAR.
 
+collect_garbage(cache_dir, max_size=None, max_age=None)
+    Evict least recently used environments from a jgo cache until it fits a
+    size and/or age budget, skipping environments in use, and drop metadata
+    entries no remaining environment refers to.  Returns a ``GCReport``.
+
 compute_spec_hash(spec_path)
     Compute a deterministic hash of a ``jgo.toml`` file for staleness
     detection.
@@ -116,11 +136,19 @@ Example — Build and Inspect an Environment
 
 from ._builder import EnvironmentBuilder
 from ._bytecode import analyze_jar_bytecode, bytecode_to_java_version, round_to_lts
+from ._collect import CacheEntry, GCReport, collect_garbage
 from ._environment import Environment
-from ._jar import find_main_classes, parse_manifest, read_raw_manifest
+from ._jar import (
+    find_duplicate_classes,
+    find_main_classes,
+    group_shadowed_classes,
+    parse_manifest,
+    read_raw_manifest,
+)
 from ._linking import LinkStrategy
 from ._lockfile import LockedDependency, LockFile, compute_spec_hash
 from ._spec import EnvironmentSpec
+from ._store import JarStore, StoreStats
 
 __all__ = [
     # builder
@@ -129,10 +157,16 @@ __all__ = [
     "analyze_jar_bytecode",
     "bytecode_to_java_version",
     "round_to_lts",
+    # collect
+    "CacheEntry",
+    "GCReport",
+    "collect_garbage",
     # environment
     "Environment",
     # jar
+    "find_duplicate_classes",
     "find_main_classes",
+    "group_shadowed_classes",
     "parse_manifest",
     "read_raw_manifest",
     # linking
@@ -143,4 +177,7 @@ __all__ = [
     "compute_spec_hash",
     # spec
     "EnvironmentSpec",
+    # store
+    "JarStore",
+    "StoreStats",
 ]
@@ -6,14 +6,19 @@ Builds Environment instances from Maven coordinates.
 
 from __future__ import annotations
 
+import copy
 import hashlib
 import logging
+import os
+import shutil
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..constants import default_jgo_cache
 from ..parse import Coordinate, Endpoint
 from ..util.java import JavaLocator, JavaSource
+from ..util.locks import file_lock
 from ._bytecode import detect_jar_java_version
 from ._cache import is_cache_valid, read_metadata_cache, write_metadata_cache
 from ._environment import Environment
@@ -24,14 +29,20 @@ from ._jar import (
     classify_jar,
     detect_main_class_from_jar,
     detect_module_info,
+    find_duplicate_classes,
+    group_shadowed_classes,
     has_toplevel_classes,
 )
-from ._linking import LinkStrategy, link_file
+from ._linking import LinkStrategy, link_file, link_files
 from ._lockfile import LockedDependency, LockFile, compute_sha256, compute_spec_hash
+from ._manifest import check_manifest, write_manifest
 
 if TYPE_CHECKING:
-    from ..maven import Artifact, Dependency, MavenContext
+    from collections.abc import Iterator
+
+    from ..maven import Artifact, Dependency, MavenContext, ProfileConstraints
     from ._spec import EnvironmentSpec
+    from ._store import JarStore
 
 _log = logging.getLogger(__name__)
 
@@ -170,10 +181,15 @@ class EnvironmentBuilder:
         cache_dir: Path | None = None,
         link_strategy: LinkStrategy = LinkStrategy.AUTO,
         optional_depth: int = 0,
+        jar_store: JarStore | None = None,
+        link_workers: int = 1,
     ):
         self.context = context
         self.link_strategy = link_strategy
         self.optional_depth = optional_depth
+        self.jar_store = jar_store
+        # Threads linking JARs; more than one helps on network filesystems
+        self.link_workers = max(1, link_workers)
 
         # Auto-detect cache directory if not specified
         if cache_dir is None:
@@ -245,8 +261,16 @@ class EnvironmentBuilder:
 
         # Check cache
         environment = Environment(workspace_path)
-        if self._is_environment_valid(environment, update):
-            # Apply main class overrides for cached environments
+
+        # Concurrent jgo processes wanting the same environment take turns:
+        # the first builds it, the others then find it valid and reuse it
+        with file_lock(environment.build_lock_path):
+            if not self._is_environment_valid(environment, update):
+                with self._staging(environment) as staging:
+                    self._build_endpoint(staging, dependencies)
+                environment._lockfile = None
+
+            # Auto-complete main class overrides (both CLI and endpoint)
             primary = dependencies[0].artifact
             autocompleted_cli_main: str | None = None
             autocompleted_parsed_main: str | None = None
@@ -265,14 +289,27 @@ class EnvironmentBuilder:
                     [environment.jars_dir, environment.modules_dir],
                 )
 
+            # Apply runtime override with priority:
+            # CLI main class > endpoint main class > auto-detected
             environment._runtime_main_class = (
                 autocompleted_cli_main
                 or autocompleted_parsed_main
                 or environment.main_class
             )
+
+            environment.touch()
             return environment
 
-        # Build environment
+    def _build_endpoint(
+        self, environment: Environment, dependencies: list[Dependency]
+    ) -> None:
+        """
+        Build an endpoint's environment and write its lockfile.
+
+        Args:
+            environment: Environment (staging area) to build
+            dependencies: Dependencies of the endpoint
+        """
         locked_deps, min_java_version = self._build_environment(
             environment, dependencies, None
         )
@@ -310,33 +347,6 @@ class EnvironmentBuilder:
         )
         lockfile.save(environment.lock_path)
 
-        # Auto-complete main class overrides (both CLI and endpoint)
-        autocompleted_cli_main = None
-        autocompleted_parsed_main = None
-
-        if main_class:
-            autocompleted_cli_main = autocomplete_main_class(
-                main_class,
-                primary.artifactId,
-                [environment.jars_dir, environment.modules_dir],
-            )
-
-        if parsed_main_class:
-            autocompleted_parsed_main = autocomplete_main_class(
-                parsed_main_class,
-                primary.artifactId,
-                [environment.jars_dir, environment.modules_dir],
-            )
-
-        # Apply runtime override with priority: CLI main class > endpoint main class > auto-detected
-        environment._runtime_main_class = (
-            autocompleted_cli_main
-            or autocompleted_parsed_main
-            or environment.main_class
-        )
-
-        return environment
-
     def from_spec(
         self,
         spec: EnvironmentSpec,
@@ -363,71 +373,129 @@ class EnvironmentBuilder:
         dependencies = self.spec_to_dependencies(spec)
         artifacts = [dep.artifact for dep in dependencies]
 
-        # Use spec's cache_dir if specified, otherwise use builder's default
-        cache_dir = (
-            Path(spec.cache_dir).expanduser() if spec.cache_dir else self.cache_dir
-        )
+        # Check if environment exists and is valid
+        environment = Environment(self._spec_workspace(spec, dependencies))
+        with file_lock(environment.build_lock_path):
+            if self._is_environment_valid(environment, update, check_staleness=True):
+                environment.touch()
+                return environment
+
+            # Build environment and get locked dependencies
+            with self._staging(environment) as staging:
+                locked_deps, min_java_version = self._build_environment(
+                    staging, dependencies, None
+                )
 
-        # Determine workspace path based on mode
-        # Project mode: flat structure (.jgo/ directly)
-        # Ad-hoc mode: hierarchical structure (envs/G/A/hash/)
-        if self.is_project_mode():
-            # Flat structure for project mode
-            workspace_path = cache_dir
-        else:
-            # Hierarchical structure for ad-hoc mode
-            cache_key = self._cache_key(dependencies)
-            primary = artifacts[0]
-            workspace_path = (
-                cache_dir / "envs" / primary.component.project.path_prefix / cache_key
-            )
+                # Infer concrete entrypoints from spec
+                # Search both jars/ and modules/ directories
+                concrete_entrypoints = self._infer_concrete_entrypoints(
+                    spec, artifacts, [staging.jars_dir, staging.modules_dir]
+                )
 
-        # Check if environment exists and is valid
-        environment = Environment(workspace_path)
-        if self._is_environment_valid(environment, update, check_staleness=True):
-            return environment
+                # Compute spec hash for staleness detection
+                # (from root jgo.toml if it exists)
+                root_spec_path = Path("jgo.toml")
+                if root_spec_path.exists():
+                    spec_hash = compute_spec_hash(root_spec_path)
+                else:
+                    # Use the spec path (for ad-hoc mode where we save a copy)
+                    spec_path = environment.path / "jgo.toml"
+                    spec.save(spec_path)
+                    spec_hash = compute_spec_hash(spec_path)
+
+                # Generate lock file from locked dependencies
+                self._clear_lockfile_cache(staging)
+
+                lockfile = LockFile(
+                    dependencies=locked_deps,
+                    environment_name=spec.name,
+                    java_version=java_version or spec.java_version,
+                    java_vendor=spec.java_vendor,
+                    min_java_version=min_java_version,
+                    entrypoints=concrete_entrypoints,
+                    default_entrypoint=spec.default_entrypoint,
+                    spec_hash=spec_hash,
+                    link_strategy=self.link_strategy.name,
+                )
+                lockfile.save(staging.lock_path)
+            environment._lockfile = None
 
-        # Build environment and get locked dependencies
-        locked_deps, min_java_version = self._build_environment(
-            environment, dependencies, None
-        )
+            # In project mode, don't copy jgo.toml (root is source of truth)
+            # In ad-hoc mode, save a copy for reference (already done above if needed)
 
-        # Infer concrete entrypoints from spec
-        # Search both jars/ and modules/ directories
-        concrete_entrypoints = self._infer_concrete_entrypoints(
-            spec, artifacts, [environment.jars_dir, environment.modules_dir]
-        )
+            environment.touch()
+            return environment
 
-        # Compute spec hash for staleness detection (from root jgo.toml if it exists)
-        root_spec_path = Path("jgo.toml")
-        if root_spec_path.exists():
-            spec_hash = compute_spec_hash(root_spec_path)
-        else:
-            # Use the spec path (for ad-hoc mode where we save a copy)
-            spec_path = environment.path / "jgo.toml"
-            spec.save(spec_path)
-            spec_hash = compute_spec_hash(spec_path)
+    def from_lockfile(
+        self, spec: EnvironmentSpec, lockfile: LockFile, update: bool = False
+    ) -> Environment:
+        """
+        Build an environment from a lockfile alone, without resolving ("frozen").
 
-        # Generate lock file from locked dependencies
-        self._clear_lockfile_cache(environment)
+        Unlike from_spec(), no POM is read and no model is built: exactly the
+        JARs the lockfile lists are fetched (concurrently), checked against
+        their recorded SHA-256, and linked where their recorded classification
+        (jar_type/is_modular) puts them. Like npm ci, this requires a lockfile
+        that is up to date with the spec, as written by 'jgo lock'.
 
-        lockfile = LockFile(
-            dependencies=locked_deps,
-            environment_name=spec.name,
-            java_version=java_version or spec.java_version,
-            java_vendor=spec.java_vendor,
-            min_java_version=min_java_version,
-            entrypoints=concrete_entrypoints,
-            default_entrypoint=spec.default_entrypoint,
-            spec_hash=spec_hash,
-            link_strategy=self.link_strategy.name,
-        )
-        lockfile.save(environment.lock_path)
+        Args:
+            spec: Environment specification the lockfile was generated from
+            lockfile: Lockfile to install, with a sha256 for every JAR
+            update: If True, rebuild even if the environment is up to date
 
-        # In project mode, don't copy jgo.toml (root is source of truth)
-        # In ad-hoc mode, save a copy for reference (already done above if needed)
+        Returns:
+            Environment instance
 
-        return environment
+        Raises:
+            ValueError: If the lockfile is out of date with the spec, or
+                lacks a JAR's checksum
+            RuntimeError: If a JAR does not match its checksum
+        """
+        if not spec.coordinates:
+            raise ValueError("No coordinates specified in environment spec.")
+        root_spec_path = Path("jgo.toml")
+        if (
+            lockfile.spec_hash
+            and root_spec_path.exists()
+            and compute_spec_hash(root_spec_path) != lockfile.spec_hash
+        ):
+            raise ValueError(
+                "Lock file is out of date (jgo.toml has changed); "
+                "run 'jgo lock' to update it"
+            )
+        missing = [
+            f"{dep.groupId}:{dep.artifactId}:{dep.version}"
+            for dep in lockfile.dependencies
+            if not dep.sha256
+        ]
+        if missing:
+            raise ValueError(
+                f"Lock file has no checksum for {', '.join(missing)}; "
+                "run 'jgo lock' to update it"
+            )
+
+        dependencies = self.spec_to_dependencies(spec)
+        environment = Environment(self._spec_workspace(spec, dependencies))
+        with file_lock(environment.build_lock_path):
+            current = environment.lockfile
+            if (
+                current is not None
+                and _locked_entries(current) == _locked_entries(lockfile)
+                and self._is_environment_valid(environment, update)
+            ):
+                environment.touch()
+                return environment
+
+            with self._staging(environment) as staging:
+                self._link_locked(staging, lockfile.dependencies)
+                self._clear_lockfile_cache(staging)
+                installed = copy.copy(lockfile)
+                installed.link_strategy = self.link_strategy.name
+                installed.save(staging.lock_path)
+            environment._lockfile = None
+
+            environment.touch()
+            return environment
 
     def resolve_lockfile(
         self,
@@ -447,10 +515,62 @@ class EnvironmentBuilder:
         Returns:
             LockFile with resolved dependencies and entrypoints
         """
-        import tempfile
+        dependencies = self.spec_to_dependencies(spec)
+        return self._lockfile(spec, dependencies, java_version)
 
-        # Parse coordinates into dependencies
+    def resolve_lockfiles(
+        self,
+        spec: EnvironmentSpec,
+        platforms: dict[str, ProfileConstraints],
+        java_version: str | None = None,
+    ) -> dict[str, LockFile]:
+        """
+        Resolve dependencies for several platforms, and create their lockfiles.
+
+        The platforms are resolved together in one pass (see
+        PythonResolver.resolve_platforms), so that POMs whose dependencies
+        are the same on every platform are only modeled once.
+
+        Args:
+            spec: Environment specification
+            platforms: Profile constraints of each platform, by platform name
+            java_version: Resolved Java version from cjdk (for lockfiles)
+
+        Returns:
+            LockFile of each platform, by platform name
+
+        Raises:
+            ValueError: If the resolver cannot resolve for several platforms
+        """
         dependencies = self.spec_to_dependencies(spec)
+        resolver = dependencies[0].context.resolver
+        resolve_platforms = getattr(resolver, "resolve_platforms", None)
+        if resolve_platforms is None:
+            raise ValueError(
+                f"{type(resolver).__name__} cannot resolve for several platforms; "
+                "use the python resolver"
+            )
+        results = resolve_platforms(
+            dependencies, platforms, optional_depth=self.optional_depth
+        )
+        return {
+            name: self._lockfile(
+                spec, dependencies, java_version, resolved=resolved, platform=name
+            )
+            for name, resolved in results.items()
+        }
+
+    def _lockfile(
+        self,
+        spec: EnvironmentSpec,
+        dependencies: list[Dependency],
+        java_version: str | None,
+        resolved: tuple[list[Dependency], list[Dependency]] | None = None,
+        platform: str | None = None,
+    ) -> LockFile:
+        """Create a lockfile, resolving the dependencies unless resolved is given."""
+        import tempfile
+
         artifacts = [dep.artifact for dep in dependencies]
 
         # Create a temporary environment directory for dependency resolution
@@ -463,7 +583,7 @@ class EnvironmentBuilder:
 
             # Resolve dependencies (downloads to Maven cache, links to temp dir)
             locked_deps, min_java_version = self._build_environment(
-                temp_env, dependencies, None
+                temp_env, dependencies, None, resolved=resolved
             )
 
             # Infer concrete entrypoints from spec
@@ -489,10 +609,140 @@ class EnvironmentBuilder:
             default_entrypoint=spec.default_entrypoint,
             spec_hash=spec_hash,
             link_strategy=self.link_strategy.name,
+            platform=platform,
         )
 
         return lockfile
 
+    def _spec_workspace(
+        self, spec: EnvironmentSpec, dependencies: list[Dependency]
+    ) -> Path:
+        """Directory of the environment of a spec."""
+        # Use spec's cache_dir if specified, otherwise use builder's default
+        cache_dir = (
+            Path(spec.cache_dir).expanduser() if spec.cache_dir else self.cache_dir
+        )
+
+        # Determine workspace path based on mode
+        # Project mode: flat structure (.jgo/ directly)
+        # Ad-hoc mode: hierarchical structure (envs/G/A/hash/)
+        if self.is_project_mode():
+            # Flat structure for project mode
+            return cache_dir
+        # Hierarchical structure for ad-hoc mode
+        cache_key = self._cache_key(dependencies)
+        primary = dependencies[0].artifact
+        return cache_dir / "envs" / primary.component.project.path_prefix / cache_key
+
+    def _link_locked(
+        self, environment: Environment, locked_deps: list[LockedDependency]
+    ) -> None:
+        """
+        Link the JARs of a lockfile into an environment, as they are recorded.
+
+        Raises:
+            RuntimeError: If a JAR does not match its recorded SHA-256
+        """
+        artifacts = [
+            self.context.project(dep.groupId, dep.artifactId)
+            .at_version(dep.version)
+            .artifact(dep.classifier or "", dep.packaging)
+            for dep in locked_deps
+        ]
+        sources = self.context.resolver.prefetch(artifacts)
+
+        to_link: dict[Path, tuple[Path, str | None]] = {}
+        for dep, source in zip(locked_deps, sources):
+            sha256 = compute_sha256(source)
+            if sha256 != dep.sha256:
+                raise RuntimeError(
+                    f"Checksum mismatch for {source.name}: expected {dep.sha256}, "
+                    f"got {sha256}"
+                )
+            target_dir = _jar_dir(environment, dep.jar_type, dep.is_modular)
+            to_link[target_dir / (dep.filename or source.name)] = (source, sha256)
+
+        # Start from the previous build's JARs (see _staging) and relink all
+        environment.jars_dir.mkdir(parents=True, exist_ok=True)
+        environment.modules_dir.mkdir(exist_ok=True)
+        existing = {
+            d: _jar_names(d) for d in (environment.jars_dir, environment.modules_dir)
+        }
+        remove = [
+            dir_path / name for dir_path, names in existing.items() for name in names
+        ]
+        link_files(
+            [(source, dest) for dest, (source, _) in to_link.items()],
+            self.link_strategy,
+            remove=remove,
+            workers=self.link_workers,
+            link=lambda source, dest: self._link_jar(source, dest, to_link[dest][1]),
+        )
+        _log.debug(f"Linked {len(to_link)} JARs from the lockfile")
+
+    def _link_jar(self, source_path: Path, dest_path: Path, sha256: str | None):
+        """Link a JAR from the JAR store if there is one, else from source_path."""
+        if not (
+            self.jar_store is not None
+            and sha256
+            and self.jar_store.link(source_path, sha256, dest_path)
+        ):
+            link_file(source_path, dest_path, self.link_strategy)
+
+    @contextmanager
+    def _staging(self, environment: Environment) -> Iterator[Environment]:
+        """
+        Build an environment in a staging area, then swap it into place.
+
+        The staging area starts out with links to the environment's current
+        JARs and a copy of its lockfile, so the build can be incremental. On
+        success, the staged jars/ and modules/ directories are renamed into
+        place and the staged lockfile is renamed last: an environment whose
+        lockfile exists is therefore always complete. If the build fails, the
+        environment is left as it was.
+
+        The caller must hold the environment's build lock.
+
+        Args:
+            environment: Environment to (re)build
+
+        Yields:
+            Environment for the staging area, to build into
+        """
+        staging = Environment(environment.staging_path)
+        # Leftovers of a build that crashed
+        shutil.rmtree(staging.path, ignore_errors=True)
+        staging.path.mkdir(parents=True)
+        try:
+            # Seed with the current JARs, for the build to keep those that did
+            # not change; pointless if the build cannot reuse them anyway
+            reusable = bool(self._previous_build(environment))
+            for name in ("jars", "modules"):
+                source = environment.path / name
+                if reusable and source.is_dir():
+                    _link_directory(source, staging.path / name, self.link_workers)
+            if environment.lock_path.exists():
+                shutil.copyfile(environment.lock_path, staging.lock_path)
+
+            yield staging
+            write_manifest(staging)
+
+            # From here until the new lockfile is in place, the environment
+            # is incomplete: a crash leaves it without a lockfile, so it is
+            # rebuilt next time. Old argfiles are dropped with the old JARs.
+            environment._lockfile = None
+            environment.lock_path.unlink(missing_ok=True)
+            for name in ("jars", "modules", "argfiles"):
+                current = environment.path / name
+                if current.exists():
+                    os.replace(current, staging.path / f"{name}.old")
+                if (staging.path / name).exists():
+                    os.replace(staging.path / name, current)
+            os.replace(staging.manifest_path, environment.manifest_path)
+            os.replace(staging.lock_path, environment.lock_path)
+        finally:
+            shutil.rmtree(staging.path, ignore_errors=True)
+
     def _clear_lockfile_cache(self, environment: Environment) -> None:
         """
         Clear cached lockfile before regenerating it.
@@ -559,6 +809,28 @@ class EnvironmentBuilder:
         if not environment.classpath:
             return False
 
+        # The lockfile is written last, so a build that did not finish leaves
+        # none; it must also come from a build with the same link strategy
+        lockfile = environment.lockfile
+        if lockfile is None:
+            return False
+        strategy = lockfile.link_strategy
+        if strategy and strategy != self.link_strategy.name:
+            return False
+
+        # The JARs and lockfile must be as recorded in the manifest at build
+        # time; without a manifest, every JAR the lockfile lists must exist
+        valid = check_manifest(environment)
+        if valid is False:
+            return False
+        if valid is None:
+            for dep in lockfile.dependencies:
+                if dep.filename and not (
+                    (environment.jars_dir / dep.filename).exists()
+                    or (environment.modules_dir / dep.filename).exists()
+                ):
+                    return False
+
         # Check if lockfile is stale (only for spec-based environments)
         if check_staleness and self._is_lockfile_stale(environment):
             return False
@@ -720,11 +992,32 @@ class EnvironmentBuilder:
 
         return concrete_entrypoints
 
+    def _previous_build(self, environment: Environment) -> dict:
+        """
+        Get the dependencies the environment was last built with.
+
+        Args:
+            environment: Environment about to be rebuilt
+
+        Returns:
+            Dict of artifact coordinates -> LockedDependency, empty if the
+            environment has no readable lockfile or was linked differently
+        """
+        try:
+            lockfile = environment.lockfile
+        except (OSError, ValueError, KeyError) as e:
+            _log.debug(f"Ignoring unreadable lockfile {environment.lock_path}: {e}")
+            return {}
+        if lockfile is None or lockfile.link_strategy != self.link_strategy.name:
+            return {}
+        return {_locked_key(dep): dep for dep in lockfile.dependencies}
+
     def _build_environment(
         self,
         environment: Environment,
         dependencies: list[Dependency],
         main_class: str | None,
+        resolved: tuple[list[Dependency], list[Dependency]] | None = None,
     ) -> tuple[list[LockedDependency], int | None]:
         """
         Build the environment by resolving and linking JARs.
@@ -737,6 +1030,8 @@ class EnvironmentBuilder:
             environment: Environment to build
             dependencies: Input dependencies to resolve
             main_class: Main class (unused, kept for signature compatibility)
+            resolved: (resolved_inputs, resolved_transitive) of dependencies,
+                if resolved already
 
         Returns:
             List of locked dependencies with module info (for lock file generation)
@@ -746,25 +1041,40 @@ class EnvironmentBuilder:
         jars_dir = environment.path / "jars"
         modules_dir = environment.path / "modules"
 
-        # Clean existing JARs to prevent duplicates across jars/ and modules/
-        # This ensures JARs are only in one directory based on current classification
-        for dir_path in [jars_dir, modules_dir]:
-            if dir_path.exists():
-                for jar_file in dir_path.glob("*.jar"):
-                    jar_file.unlink()
+        # Entries of the previous build, so that only what changed since is
+        # relinked; without a usable lockfile, every JAR is relinked
+        previous = self._previous_build(environment)
+
+        # Argfiles list the JARs from the previous build; drop them
+        shutil.rmtree(environment.path / "argfiles", ignore_errors=True)
 
         jars_dir.mkdir(exist_ok=True)
         modules_dir.mkdir(exist_ok=True)
 
+        # What the directories hold now, from one scan each; linking is then
+        # done in bulk below, without stat'ing JARs one by one
+        existing = {d: _jar_names(d) for d in (jars_dir, modules_dir)}
+        to_link: dict[Path, tuple[Path, str | None]] = {}
+
         # Resolve all dependencies together (not separately!)
         # This ensures Maven handles version conflicts across all dependencies
         # Returns (resolved_inputs, resolved_transitive) where:
         # - resolved_inputs: Input deps with MANAGED versions resolved
         # - resolved_transitive: Transitive dependencies (excludes inputs)
-        resolved_inputs, resolved_transitive = dependencies[0].context.resolver.resolve(
-            dependencies,
-            optional_depth=self.optional_depth,
-        )
+        if resolved is None:
+            resolved = dependencies[0].context.resolver.resolve(
+                dependencies,
+                optional_depth=self.optional_depth,
+            )
+        resolved_inputs, resolved_transitive = resolved
+
+        # Fetch all JARs up front, so that the resolver can download them
+        # concurrently; the loops below then find them in the local cache
+        wanted = {dep.artifact.key: dep.artifact for dep in resolved_inputs}
+        for dep in resolved_transitive:
+            if dep.scope in ("compile", "runtime"):
+                wanted.setdefault(dep.artifact.key, dep.artifact)
+        dependencies[0].context.resolver.prefetch(wanted.values())
 
         # Track locked dependencies with module info
         locked_deps: list[LockedDependency] = []
@@ -786,6 +1096,40 @@ class EnvironmentBuilder:
                 jar_tool_state["initialized"] = True
             return jar_tool_state["tool"]
 
+        def target_dir_for(jar_type, is_modular):
+            """Directory a JAR belongs in, given its classification."""
+            return _jar_dir(environment, jar_type, is_modular)
+
+        def reuse_previous(artifact):
+            """Keep a JAR linked by the previous build, if it is unchanged."""
+            locked = previous.get(_locked_key(artifact))
+            if (
+                locked is None
+                or not locked.sha256
+                or locked.filename != artifact.filename
+                or artifact.version.endswith("-SNAPSHOT")  # may change in place
+            ):
+                return None
+            if (
+                artifact.filename
+                not in existing[target_dir_for(locked.jar_type, locked.is_modular)]
+            ):
+                return None
+            # The lockfile does not record each JAR's Java version; take it from
+            # the metadata cache, which also confirms the classification is known
+            cached_metadata = read_metadata_cache(
+                artifact.groupId,
+                artifact.artifactId,
+                artifact.version,
+                artifact.filename,
+                self.cache_dir,
+            )
+            if cached_metadata is None or not is_cache_valid(
+                cached_metadata, locked.sha256
+            ):
+                return None
+            return locked, cached_metadata.min_java_version
+
         # Helper function to classify and link a JAR artifact
         def process_artifact(artifact, source_path):
             """Classify JAR, link it to the appropriate directory, and create locked dependency."""
@@ -865,16 +1209,9 @@ class EnvironmentBuilder:
                     )
 
             # Determine target directory based on jar_type
-            if jar_type is not None:
-                target_dir = modules_dir if jar_type != JarType.PLAIN else jars_dir
-            else:
-                # No classification - use module_info
-                target_dir = modules_dir if module_info.is_modular else jars_dir
-
+            target_dir = target_dir_for(jar_type, module_info.is_modular)
             dest_path = target_dir / artifact.filename
-
-            if not dest_path.exists():
-                link_file(source_path, dest_path, self.link_strategy)
+            to_link[dest_path] = (source_path, sha256)
 
             # Create locked dependency with module info and classification
             return LockedDependency(
@@ -887,6 +1224,7 @@ class EnvironmentBuilder:
                 is_modular=module_info.is_modular,
                 module_name=module_info.module_name,
                 jar_type=jar_type,
+                filename=dest_path.name,
             ), min_java_ver
 
         # Process artifacts and their transitive dependencies
@@ -894,6 +1232,7 @@ class EnvironmentBuilder:
         # Use artifact.key which includes classifier and packaging to handle
         # multiple artifacts with same G:A:V (e.g., natives for different platforms)
         processed = set()
+        unchanged = 0
 
         # First, process the resolved artifacts (with MANAGED versions resolved)
         for dep in resolved_inputs:
@@ -902,8 +1241,12 @@ class EnvironmentBuilder:
                 continue  # Skip duplicates
             processed.add(artifact.key)
 
-            source_path = artifact.resolve()
-            locked_dep, jar_min_ver = process_artifact(artifact, source_path)
+            reused = reuse_previous(artifact)
+            if reused is not None:
+                unchanged += 1
+            locked_dep, jar_min_ver = reused or process_artifact(
+                artifact, artifact.resolve()
+            )
             locked_deps.append(locked_dep)
             if jar_min_ver is not None:
                 min_java_version = max(min_java_version or 0, jar_min_ver)
@@ -918,11 +1261,122 @@ class EnvironmentBuilder:
                 continue  # Skip duplicates
             processed.add(artifact.key)
 
-            source_path = artifact.resolve()
-            locked_dep, jar_min_ver = process_artifact(artifact, source_path)
+            reused = reuse_previous(artifact)
+            if reused is not None:
+                unchanged += 1
+            locked_dep, jar_min_ver = reused or process_artifact(
+                artifact, artifact.resolve()
+            )
             locked_deps.append(locked_dep)
             if jar_min_ver is not None:
                 min_java_version = max(min_java_version or 0, jar_min_ver)
 
+        # Where each JAR of the new resolution belongs
+        ordered_jars = [
+            target_dir_for(dep.jar_type, dep.is_modular) / dep.filename
+            for dep in locked_deps
+            if dep.filename
+        ]
+
+        # Unlink what the new resolution no longer includes, and what is to
+        # be replaced (its content may be outdated), then link in one batch
+        wanted_paths = set(ordered_jars)
+        stale = [
+            dir_path / name
+            for dir_path, names in existing.items()
+            for name in names
+            if dir_path / name not in wanted_paths
+        ]
+        replaced = [path for path in to_link if path.name in existing[path.parent]]
+
+        link_files(
+            [(source, dest) for dest, (source, _) in to_link.items()],
+            self.link_strategy,
+            remove=stale + replaced,
+            workers=self.link_workers,
+            link=lambda source, dest: self._link_jar(source, dest, to_link[dest][1]),
+        )
+        if previous:
+            _log.debug(
+                f"Updated environment: {unchanged} JARs unchanged, "
+                f"{len(to_link)} linked, {len(stale)} removed"
+            )
+
+        # Warn about classes shadowed on the (resolution-ordered) class-path;
+        # this opens every JAR, so only when the class-path JARs changed
+        if any(path.parent == jars_dir for path in [*to_link, *stale]):
+            _warn_duplicate_classes(
+                [jar for jar in ordered_jars if jar.parent == jars_dir]
+            )
+
         # Return locked dependencies and min Java version for lock file generation
         return locked_deps, min_java_version
+
+
+def _link_directory(source: Path, dest: Path, workers: int = 1) -> None:
+    """Populate dest with links to the JARs in source, preserving symlinks."""
+    dest.mkdir()
+    with os.scandir(source) as entries:
+        symlinks = {
+            entry.name: entry.is_symlink()
+            for entry in entries
+            if entry.name.endswith(".jar")
+        }
+
+    def link(source_path: Path, target: Path) -> None:
+        if symlinks[target.name]:
+            os.symlink(os.readlink(source_path), target)
+            return
+        try:
+            os.link(source_path, target)
+        except OSError:
+            shutil.copyfile(source_path, target)
+
+    link_files(
+        [(source / name, dest / name) for name in symlinks],
+        LinkStrategy.HARD,
+        workers=workers,
+        link=link,
+    )
+
+
+def _jar_dir(environment: Environment, jar_type, is_modular: bool) -> Path:
+    """Directory of an environment a JAR belongs in, given its classification."""
+    if jar_type is not None:
+        modular = jar_type != JarType.PLAIN
+    else:
+        # No classification - use module_info
+        modular = is_modular
+    return environment.modules_dir if modular else environment.jars_dir
+
+
+def _locked_entries(lockfile: LockFile) -> list[dict]:
+    """The JAR entries of a lockfile, for comparing lockfiles."""
+    return [dep.to_dict() for dep in lockfile.dependencies]
+
+
+def _jar_names(directory: Path) -> set[str]:
+    """Names of the JARs in a directory, from a single scan."""
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if entry.name.endswith(".jar")}
+
+
+def _locked_key(artifact) -> tuple:
+    """Coordinates identifying an artifact among locked dependencies."""
+    return (
+        artifact.groupId,
+        artifact.artifactId,
+        artifact.version,
+        artifact.classifier or None,
+        artifact.packaging,
+    )
+
+
+def _warn_duplicate_classes(jars: list[Path]) -> None:
+    """Log a warning for each JAR whose classes are shadowed by an earlier JAR."""
+    shadowed = group_shadowed_classes(find_duplicate_classes(jars))
+    for (winner, loser), class_names in shadowed.items():
+        _log.warning(
+            f"{len(class_names)} duplicate classes in {loser.name} are shadowed "
+            f"by {winner.name} (e.g. {class_names[0]})"
+        )
@@ -0,0 +1,305 @@
+"""
+Garbage collection of the jgo cache.
+
+Every build of a new endpoint leaves an environment behind under
+<cache-dir>/envs/, and every analyzed JAR an entry under <cache-dir>/info/.
+collect_garbage() evicts the least recently used environments until the
+cache fits an age and/or size budget, then drops metadata entries that no
+remaining environment refers to, and JARs of the shared JAR store (see
+JarStore) that no remaining environment links to.
+
+An environment is never removed while it is in use:
+- while a jgo process holds a lease on it (see Environment.lease), which
+  JavaRunner does for as long as the JVM runs;
+- while a jgo process is building it (its build lock is held);
+- within a grace period after it was last handed out by EnvironmentBuilder
+  (see Environment.touch), covering the moment between building an
+  environment and launching Java from it.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import stat
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from ..util.locks import file_lock
+from ._environment import Environment
+from ._lockfile import LockFile
+from ._store import JarStore
+
+_log = logging.getLogger(__name__)
+
+# Seconds after its last use during which an environment is always kept
+DEFAULT_GRACE_PERIOD = 10 * 60
+
+# Where environments are moved to before they are deleted
+TRASH_DIR = ".trash"
+
+
+@dataclass
+class CacheEntry:
+    """An environment of the jgo cache, as seen by the garbage collector."""
+
+    path: Path
+    last_used: float  # Epoch seconds
+    size: int  # Bytes freed by deleting it (JARs shared elsewhere excluded)
+
+
+@dataclass
+class GCReport:
+    """Outcome of a garbage collection."""
+
+    removed: list[CacheEntry] = field(default_factory=list)
+    kept: list[CacheEntry] = field(default_factory=list)
+    in_use: list[CacheEntry] = field(default_factory=list)
+    metadata_removed: int = 0
+    store_removed: int = 0
+    reclaimed_bytes: int = 0
+
+
+def collect_garbage(
+    cache_dir: Path,
+    max_size: int | None = None,
+    max_age: float | None = None,
+    grace_period: float = DEFAULT_GRACE_PERIOD,
+    dry_run: bool = False,
+    now: float | None = None,
+) -> GCReport:
+    """
+    Evict least recently used environments from a jgo cache.
+
+    Args:
+        cache_dir: The jgo cache directory (containing envs/ and info/)
+        max_size: Size budget in bytes for all environments together
+        max_age: Remove environments unused for more than this many seconds
+        grace_period: Never remove environments used within this many seconds
+        dry_run: If True, only report what would be removed
+        now: Current epoch seconds (defaults to time.time())
+
+    Returns:
+        What was (or would be) removed and kept, and the bytes reclaimed
+    """
+    if now is None:
+        now = time.time()
+    if not dry_run:
+        # Leftovers of a collection that was interrupted
+        shutil.rmtree(cache_dir / TRASH_DIR, ignore_errors=True)
+    report = GCReport()
+    store = JarStore.for_cache(cache_dir)
+    store_inodes = store.inodes()
+
+    # Stored JARs that no environment used to begin with
+    report.store_removed, freed = store.prune(dry_run)
+    report.reclaimed_bytes += freed
+
+    entries = sorted(
+        scan_environments(cache_dir, store_inodes), key=lambda e: e.last_used
+    )
+    total = sum(e.size for e in entries)
+
+    for entry in entries:
+        expired = max_age is not None and now - entry.last_used > max_age
+        over_budget = max_size is not None and total > max_size
+        if not (expired or over_budget):
+            report.kept.append(entry)
+            continue
+        if now - entry.last_used < grace_period or not _remove(
+            cache_dir, entry, dry_run
+        ):
+            report.in_use.append(entry)
+            continue
+        report.removed.append(entry)
+        report.reclaimed_bytes += entry.size
+        total -= entry.size
+
+    if report.removed and not dry_run:
+        # Stored JARs that only the removed environments used; their bytes
+        # are part of those environments' sizes already
+        count, _ = store.prune()
+        report.store_removed += count
+
+    report.metadata_removed, freed = _remove_orphaned_metadata(
+        cache_dir, [e.path for e in report.kept + report.in_use], dry_run
+    )
+    report.reclaimed_bytes += freed
+    return report
+
+
+def scan_environments(
+    cache_dir: Path, store_inodes: set[tuple[int, int]] | None = None
+) -> list[CacheEntry]:
+    """
+    Find the environments of a jgo cache, with their last use and size.
+
+    Args:
+        cache_dir: The jgo cache directory
+        store_inodes: (device, inode) of the JARs in the cache's JAR store;
+            an environment's link to one counts as its only copy
+
+    Returns:
+        One entry per environment under cache_dir/envs
+    """
+    entries = []
+    for dirpath, dirnames, filenames in os.walk(cache_dir / "envs"):
+        if "jgo.lock.toml" not in filenames and "jars" not in dirnames:
+            continue
+        dirnames.clear()  # Do not descend into environments
+        path = Path(dirpath)
+        size = _unique_size(path, store_inodes or set())
+        entries.append(CacheEntry(path, _last_used(path), size))
+    return entries
+
+
+def _last_used(path: Path) -> float:
+    """When an environment was last used: its marker, else when it was built."""
+    env = Environment(path)
+    for candidate in (env.last_used_path, env.lock_path, path):
+        try:
+            return candidate.stat().st_mtime
+        except OSError:
+            continue
+    return 0.0
+
+
+def _unique_size(path: Path, store_inodes: set[tuple[int, int]]) -> int:
+    """Bytes of the files under path that have no other hard link."""
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for name in filenames:
+            try:
+                st = os.lstat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            links = st.st_nlink - ((st.st_dev, st.st_ino) in store_inodes)
+            if links == 1 and not stat.S_ISLNK(st.st_mode):
+                size += st.st_size
+    return size
+
+
+def _has_lease(env: Environment) -> bool:
+    """Check whether a live process holds a lease on an environment."""
+    try:
+        leases = list(env.leases_dir.iterdir())
+    except FileNotFoundError:
+        return False
+    for lease in leases:
+        try:
+            with file_lock(lease, timeout=0):
+                pass
+        except TimeoutError:
+            return True
+        # Lease of a process that is gone
+        lease.unlink(missing_ok=True)
+    return False
+
+
+def _remove(cache_dir: Path, entry: CacheEntry, dry_run: bool) -> bool:
+    """
+    Remove an environment unless it is in use.
+
+    Returns:
+        True if the environment was (or, in a dry run, would be) removed
+    """
+    env = Environment(entry.path)
+    try:
+        with file_lock(env.build_lock_path, timeout=0):
+            if _has_lease(env):
+                return False
+            if dry_run:
+                return True
+            # Move it out of the way first, so that no process finds it half
+            # deleted; builders waiting for its lock then start afresh
+            trash = cache_dir / TRASH_DIR / uuid.uuid4().hex
+            trash.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(entry.path, trash)
+    except TimeoutError:
+        return False
+    except OSError as e:
+        # E.g. on Windows, where files open in another process pin it
+        _log.debug(f"Could not remove environment {entry.path}: {e}")
+        return False
+    shutil.rmtree(trash, ignore_errors=True)
+    _log.debug(f"Removed environment {entry.path}")
+    _prune_empty_parents(entry.path.parent, cache_dir / "envs")
+    return True
+
+
+def _prune_empty_parents(path: Path, root: Path) -> None:
+    """Remove path and its ancestors up to (excluding) root while empty."""
+    while path != root and root in path.parents:
+        try:
+            path.rmdir()
+        except OSError:
+            return
+        path = path.parent
+
+
+def _referenced_metadata(env_paths: list[Path]) -> set[tuple[str, ...]]:
+    """Metadata cache keys (G, A, V, filename) of the JARs of environments."""
+    keys: set[tuple[str, ...]] = set()
+    for path in env_paths:
+        env = Environment(path)
+        try:
+            lockfile = LockFile.load(env.lock_path)
+        except (OSError, ValueError, KeyError):
+            continue
+        for dep in lockfile.dependencies:
+            if dep.filename:
+                keys.add((dep.groupId, dep.artifactId, dep.version, dep.filename))
+    return keys
+
+
+def _remove_orphaned_metadata(
+    cache_dir: Path, env_paths: list[Path], dry_run: bool
+) -> tuple[int, int]:
+    """
+    Remove metadata cache entries no remaining environment refers to.
+
+    Returns:
+        Number of entries removed and bytes freed
+    """
+    info_dir = cache_dir / "info"
+    if not info_dir.is_dir():
+        return 0, 0
+    referenced = _referenced_metadata(env_paths)
+    count = freed = 0
+    emptied = set()
+    for entry_path in sorted(info_dir.rglob("*.json")):
+        # info/<group path...>/<artifactId>/<version>/<filename>.json
+        parts = entry_path.relative_to(info_dir).parts
+        if len(parts) < 4:
+            continue
+        filename = parts[-1][: -len(".json")]
+        key = (".".join(parts[:-3]), parts[-3], parts[-2], filename)
+        if key in referenced:
+            continue
+        try:
+            size = entry_path.stat().st_size
+            if not dry_run:
+                entry_path.unlink()
+                emptied.add(entry_path.parent)
+        except OSError:
+            continue
+        count += 1
+        freed += size
+    for path in emptied:
+        _prune_empty_parents(path, info_dir)
+    return count, freed
+
+
+def format_size(size: int) -> str:
+    """Format a byte count for humans, e.g. 1536 -> "1.5 KiB"."""
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
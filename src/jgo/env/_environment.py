@@ -7,17 +7,25 @@ execution.
 
 from __future__ import annotations
 
+import itertools
+import os
 import zipfile
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
+from ..util.locks import file_lock
 from ._bytecode import detect_environment_java_version
 from ._jar import detect_module_info
 from ._lockfile import LockFile
 from ._spec import EnvironmentSpec
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
+# Distinguishes the leases taken by one process
+_lease_ids = itertools.count()
+
 
 class Environment:
     """
@@ -42,6 +50,58 @@ class Environment:
         """Path to jgo.lock.toml file in this environment."""
         return self.path / "jgo.lock.toml"
 
+    @property
+    def build_lock_path(self) -> Path:
+        """Path to the file locked while a jgo process builds this environment."""
+        return self.path / ".build.lock"
+
+    @property
+    def last_used_path(self) -> Path:
+        """Path to the marker whose mtime is when this environment was last used."""
+        return self.path / ".last-used"
+
+    @property
+    def leases_dir(self) -> Path:
+        """Path to the lock files held while this environment is in use."""
+        return self.path / ".leases"
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path to the validation manifest (.manifest.json) in this environment."""
+        return self.path / ".manifest.json"
+
+    @property
+    def staging_path(self) -> Path:
+        """Path to the directory a new build of this environment is assembled in."""
+        return self.path / ".staging"
+
+    def touch(self) -> None:
+        """Record that this environment is being used now (see collect_garbage)."""
+        try:
+            self.last_used_path.touch()
+        except OSError:
+            pass
+
+    @contextmanager
+    def lease(self) -> Iterator[int]:
+        """
+        Mark this environment as in use for the duration of a with block.
+
+        The lease is a lock file held by this process, so it ends when the
+        process does, even if it crashes; collect_garbage never removes an
+        environment with a lease. A process started with exec keeps the lease
+        if it inherits the yielded descriptor.
+
+        Yields:
+            Descriptor of the lease's lock file
+        """
+        lease_path = self.leases_dir / f"{os.getpid()}-{next(_lease_ids)}.lock"
+        try:
+            with file_lock(lease_path) as fd:
+                yield fd
+        finally:
+            lease_path.unlink(missing_ok=True)
+
     @property
     def spec(self) -> EnvironmentSpec | None:
         """
@@ -154,6 +214,11 @@ class Environment:
         """Directory containing module-path JARs."""
         return self.path / "modules"
 
+    @property
+    def argfiles_dir(self) -> Path:
+        """Directory containing cached java @argfiles for this environment."""
+        return self.path / "argfiles"
+
     @property
     def all_jars(self) -> list[Path]:
         """All JAR files in this environment (both jars/ and modules/)."""
@@ -178,6 +243,40 @@ class Environment:
             return []
         return sorted(self.modules_dir.glob("*.jar"))
 
+    def ordered_jars(self, directories: list[Path] | None = None) -> list[Path]:
+        """
+        JARs in the given directories, in dependency resolution order.
+
+        The order is the one recorded in the lock file (direct dependencies
+        first, then transitive dependencies nearest-first). JARs the lock file
+        does not know about are appended in name order.
+
+        Args:
+            directories: Directories to include (default: jars/ and modules/)
+
+        Returns:
+            List of JAR paths
+        """
+        if directories is None:
+            directories = [self.jars_dir, self.modules_dir]
+        present: dict[str, Path] = {}
+        for directory in directories:
+            if directory.exists():
+                for jar in sorted(directory.glob("*.jar")):
+                    present.setdefault(jar.name, jar)
+
+        ordered = []
+        lockfile = self.lockfile
+        if lockfile:
+            for dep in lockfile.dependencies:
+                found: Path | None = (
+                    present.pop(dep.filename, None) if dep.filename else None
+                )
+                if found is not None:
+                    ordered.append(found)
+        ordered.extend(present.values())
+        return ordered
+
     @property
     def has_modules(self) -> bool:
         """True if environment has any modular JARs."""
@@ -137,6 +137,71 @@ def has_toplevel_classes(jar_path: Path) -> bool:
     return False
 
 
+def list_classes(jar_path: Path) -> list[str]:
+    """
+    List the fully qualified names of the classes in a JAR.
+
+    Module descriptors, package-info classes and multi-release entries under
+    META-INF/ are skipped.
+
+    Args:
+        jar_path: Path to JAR file
+
+    Returns:
+        Class names (e.g. "org.example.Main"), in JAR entry order
+    """
+    try:
+        with zipfile.ZipFile(jar_path) as jar:
+            names = jar.namelist()
+    except (zipfile.BadZipFile, FileNotFoundError):
+        return []
+    return [
+        name[: -len(".class")].replace("/", ".")
+        for name in names
+        if name.endswith(".class")
+        and not name.startswith("META-INF/")
+        and not name.endswith(("module-info.class", "package-info.class"))
+    ]
+
+
+def find_duplicate_classes(jars: list[Path]) -> dict[str, list[Path]]:
+    """
+    Find classes that are present in more than one JAR.
+
+    Args:
+        jars: JAR files in class-path order
+
+    Returns:
+        Dict mapping each duplicated class name to the JARs containing it,
+        in class-path order (the first JAR wins; the others are shadowed)
+    """
+    owners: dict[str, list[Path]] = {}
+    for jar_path in jars:
+        for class_name in list_classes(jar_path):
+            owners.setdefault(class_name, []).append(jar_path)
+    return {name: paths for name, paths in owners.items() if len(paths) > 1}
+
+
+def group_shadowed_classes(
+    duplicates: dict[str, list[Path]],
+) -> dict[tuple[Path, Path], list[str]]:
+    """
+    Group duplicate classes by (winning JAR, shadowed JAR) pairs.
+
+    Args:
+        duplicates: Result of find_duplicate_classes()
+
+    Returns:
+        Dict mapping (winner, shadowed) JAR pairs to the sorted class names
+        that the winner shadows
+    """
+    pairs: dict[tuple[Path, Path], list[str]] = {}
+    for class_name, jars in duplicates.items():
+        for shadowed in jars[1:]:
+            pairs.setdefault((jars[0], shadowed), []).append(class_name)
+    return {pair: sorted(names) for pair, names in pairs.items()}
+
+
 def _find_module_info_path(
     jar_path: Path, java_version: int | None = None
 ) -> str | None:
@@ -4,11 +4,32 @@ Linking strategies for jgo.
 Defines how to link JAR files from Maven repository to jgo cache.
 """
 
+from __future__ import annotations
+
 import errno
 import os
 import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+# Linux ioctl cloning a file's extents into another file (from linux/fs.h)
+_FICLONE = 0x40049409
+
+# Errors meaning the filesystem (or platform) cannot reflink these files
+_REFLINK_UNSUPPORTED = {
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.EINVAL,
+    errno.ENOTTY,
+    errno.ENOSYS,
+}
 
 
 class LinkStrategy(Enum):
@@ -19,9 +40,122 @@ class LinkStrategy(Enum):
     HARD = "hard"
     SOFT = "soft"
     COPY = "copy"
+    REFLINK = "reflink"
     AUTO = "auto"
 
 
+def reflink(source: Path, link_name: Path) -> None:
+    """
+    Create link_name as a copy-on-write clone of source.
+
+    The clone shares source's data blocks until either file is modified, so
+    it costs about as little as a hard link, yet behaves like a copy. This
+    needs a filesystem supporting it: e.g. btrfs or XFS on Linux (FICLONE
+    ioctl), or APFS on macOS (clonefile).
+
+    Args:
+        source: Source file path
+        link_name: Path of the clone to create; must not exist
+
+    Raises:
+        OSError: If the clone cannot be made, e.g. with errno EOPNOTSUPP or
+            EXDEV when the filesystem does not support it for these files
+    """
+    if sys.platform == "darwin":
+        _clonefile(source, link_name)
+        return
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(
+            errno.EOPNOTSUPP, "Reflinks are not supported on this platform"
+        ) from None
+    with open(source, "rb") as src, open(link_name, "xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            os.unlink(link_name)
+            raise
+
+
+def _clonefile(source: Path, link_name: Path) -> None:
+    """Clone a file with macOS's clonefile(2)."""
+    import ctypes
+
+    libc = ctypes.CDLL(None, use_errno=True)
+    if libc.clonefile(os.fsencode(source), os.fsencode(link_name), 0) != 0:
+        code = ctypes.get_errno()
+        raise OSError(code, os.strerror(code), str(link_name))
+
+
+def copy_file(source: Path, dest: Path) -> None:
+    """
+    Copy a file, as a reflink when the filesystem supports it.
+
+    Args:
+        source: Source file path
+        dest: Destination path; must not exist
+    """
+    try:
+        reflink(source, dest)
+        return
+    except OSError as e:
+        if e.errno not in _REFLINK_UNSUPPORTED:
+            raise
+    shutil.copyfile(source, dest)
+
+
+def link_files(
+    links: Iterable[tuple[Path, Path]],
+    strategy: LinkStrategy,
+    remove: Iterable[Path] = (),
+    workers: int = 1,
+    link: Callable[[Path, Path], object] | None = None,
+) -> None:
+    """
+    Remove and create many links in one batch.
+
+    The caller is expected to know the contents of the target directories
+    already (e.g. from one os.scandir each), so that nothing is stat'ed here:
+    each path to remove is unlinked, then each link is created. On network
+    filesystems, where every such call is a round-trip to the server, several
+    workers overlap them.
+
+    Args:
+        links: (source, link_name) pairs to link
+        strategy: Link strategy to use
+        remove: Paths to unlink first, e.g. stale entries or entries to replace
+        workers: Number of threads performing the operations
+        link: Function linking source to link_name, instead of link_file
+            with strategy
+    """
+
+    def link_with_strategy(source: Path, link_name: Path) -> None:
+        link_file(source, link_name, strategy)
+
+    link_one = link if link is not None else link_with_strategy
+
+    def unlink(path: Path) -> None:
+        path.unlink(missing_ok=True)
+
+    def link_pair(pair: tuple[Path, Path]) -> None:
+        link_one(*pair)
+
+    operations: list[tuple[Callable[[Any], None], list]] = [
+        (unlink, list(remove)),
+        (link_pair, list(links)),
+    ]
+    for operation, items in operations:
+        if workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                # list() re-raises the first error
+                list(pool.map(operation, items))
+        else:
+            for item in items:
+                operation(item)
+
+
 def link_file(source: Path, link_name: Path, strategy: LinkStrategy):
     """
     Link a file using the specified strategy.
@@ -36,7 +170,9 @@ def link_file(source: Path, link_name: Path, strategy: LinkStrategy):
     elif strategy == LinkStrategy.SOFT:
         return os.symlink(source, link_name)
     elif strategy == LinkStrategy.COPY:
-        return shutil.copyfile(source, link_name)
+        return copy_file(source, link_name)
+    elif strategy == LinkStrategy.REFLINK:
+        return reflink(source, link_name)
     elif strategy == LinkStrategy.AUTO:
         # Try hard link first
         try:
@@ -47,6 +183,14 @@ def link_file(source: Path, link_name: Path, strategy: LinkStrategy):
             if e.errno != errno.EXDEV:
                 raise
 
+        # Try a reflink next: copy semantics at about the cost of a link, and
+        # possible across e.g. btrfs subvolumes, where hard links are not
+        try:
+            return reflink(source, link_name)
+        except OSError as e:
+            if e.errno not in _REFLINK_UNSUPPORTED:
+                raise
+
         # Try soft link next
         try:
             return os.symlink(source, link_name)
@@ -36,6 +36,7 @@ class LockedDependency(TOMLSerializableMixin, FieldValidatorMixin):
         module_name: str | None = None,
         placement: str | None = None,
         jar_type: JarType | None = None,
+        filename: str | None = None,
     ):
         self.groupId = groupId
         self.artifactId = artifactId
@@ -47,6 +48,7 @@ class LockedDependency(TOMLSerializableMixin, FieldValidatorMixin):
         self.module_name = module_name
         self.placement = placement  # "class-path", "module-path", or None (auto)
         self.jar_type = jar_type  # JarType or None if not analyzed
+        self.filename = filename  # Name of the JAR within the environment
 
     @classmethod
     def from_dependency(cls, dep: Dependency) -> LockedDependency:
@@ -95,6 +97,8 @@ class LockedDependency(TOMLSerializableMixin, FieldValidatorMixin):
             data["placement"] = self.placement
         if self.jar_type is not None:
             data["jar_type"] = int(self.jar_type)
+        if self.filename:
+            data["filename"] = self.filename
         return data
 
     @classmethod
@@ -113,6 +117,7 @@ class LockedDependency(TOMLSerializableMixin, FieldValidatorMixin):
             jar_type=JarType(data["jar_type"])
             if data.get("jar_type") is not None
             else None,
+            filename=data.get("filename"),
         )
 
     def __repr__(self) -> str:
@@ -124,7 +129,9 @@ class LockFile(TOMLSerializableMixin, FieldValidatorMixin):
     Lock file for reproducible builds (jgo.lock.toml).
 
     Records:
-    - Exact resolved versions (SNAPSHOT → timestamped)
+    - Exact resolved versions (SNAPSHOT → timestamped), in resolution order
+      (direct dependencies first, then nearest-first), which is also the
+      order of the explicit class-path
     - SHA256 checksums for verification
     - Environment metadata (name, java versions)
     - Entrypoints (concrete, inferred main classes)
@@ -143,6 +150,7 @@ class LockFile(TOMLSerializableMixin, FieldValidatorMixin):
         spec_hash: str | None = None,
         link_strategy: str | None = None,
         jgo_version: str = "2.0.0",
+        platform: str | None = None,
     ):
         self.dependencies = dependencies
         self.environment_name = environment_name
@@ -154,6 +162,8 @@ class LockFile(TOMLSerializableMixin, FieldValidatorMixin):
         self.spec_hash = spec_hash
         self.link_strategy = link_strategy
         self.jgo_version = jgo_version
+        # Platform resolved for (see EnvironmentBuilder.resolve_lockfiles)
+        self.platform = platform
         self.generated = datetime.now(timezone.utc)
 
         # Validate that "default" is not used as an entrypoint name
@@ -207,6 +217,7 @@ class LockFile(TOMLSerializableMixin, FieldValidatorMixin):
         environment_name = env_section.get("name")
         min_java_version = env_section.get("min_java_version")
         link_strategy = env_section.get("link_strategy")
+        platform = env_section.get("platform")
 
         # Parse java section
         java_section = data.get("java", {})
@@ -231,6 +242,7 @@ class LockFile(TOMLSerializableMixin, FieldValidatorMixin):
             spec_hash=spec_hash,
             link_strategy=link_strategy,
             jgo_version=jgo_version,
+            platform=platform,
         )
 
         # Restore generated timestamp if available
@@ -263,6 +275,8 @@ class LockFile(TOMLSerializableMixin, FieldValidatorMixin):
             env_section["min_java_version"] = self.min_java_version
         if self.link_strategy:
             env_section["link_strategy"] = self.link_strategy
+        if self.platform:
+            env_section["platform"] = self.platform
         if env_section:
             data["environment"] = env_section
 
@@ -0,0 +1,117 @@
+"""
+Validation manifests for materialized environments.
+
+When an environment is built, jgo records the size, modification time and
+inode of each linked JAR, together with a hash of the lockfile, in
+<env-dir>/.manifest.json. Checking a cached environment then takes one
+os.scandir per JAR directory and a stat per JAR, with no hashing of JARs:
+a JAR that was deleted, replaced or added, or whose symlink target is gone,
+as well as a lockfile edited since the build, all invalidate the environment.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from ._environment import Environment
+
+_log = logging.getLogger(__name__)
+
+# Manifest format version - increment when schema changes
+MANIFEST_FORMAT_VERSION = 1
+
+# Directories of an environment whose JARs the manifest covers
+JAR_DIRS = ("jars", "modules")
+
+
+def _lockfile_hash(lock_path: Path) -> str | None:
+    """SHA256 of the lockfile's bytes, or None if it cannot be read."""
+    try:
+        return hashlib.sha256(lock_path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def _scan(env_path: Path) -> dict[str, list[int]]:
+    """
+    Stat the JARs of an environment.
+
+    Raises:
+        OSError: If a JAR cannot be stat'ed, e.g. a dangling symlink
+    """
+    jars = {}
+    for name in JAR_DIRS:
+        try:
+            entries = os.scandir(env_path / name)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".jar"):
+                    st = entry.stat()
+                    jars[f"{name}/{entry.name}"] = [
+                        st.st_size,
+                        st.st_mtime_ns,
+                        st.st_ino,
+                    ]
+    return jars
+
+
+def write_manifest(environment: Environment) -> None:
+    """
+    Record the current state of an environment's JARs and lockfile.
+
+    Args:
+        environment: A freshly built environment, with its lockfile written
+    """
+    manifest = {
+        "version": MANIFEST_FORMAT_VERSION,
+        "lockfile_sha256": _lockfile_hash(environment.lock_path),
+        "jars": _scan(environment.path),
+    }
+    with open(environment.manifest_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def check_manifest(environment: Environment) -> bool | None:
+    """
+    Check that an environment still matches its manifest.
+
+    Args:
+        environment: Environment to check
+
+    Returns:
+        True if the JARs and lockfile are as recorded, False if anything
+        changed, or None if the environment has no (readable) manifest
+    """
+    try:
+        with open(environment.manifest_path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(manifest, dict)
+        or manifest.get("version") != MANIFEST_FORMAT_VERSION
+    ):
+        return None
+
+    lockfile_sha256 = _lockfile_hash(environment.lock_path)
+    if lockfile_sha256 is None or lockfile_sha256 != manifest.get("lockfile_sha256"):
+        _log.debug(f"Lockfile of {environment.path} changed since it was built")
+        return False
+    try:
+        jars = _scan(environment.path)
+    except OSError as e:
+        _log.debug(f"Environment {environment.path} has an unreadable JAR: {e}")
+        return False
+    if jars != manifest.get("jars"):
+        _log.debug(f"JARs of {environment.path} changed since it was built")
+        return False
+    return True
@@ -0,0 +1,194 @@
+"""
+Content-addressed JAR store shared across environments.
+
+Environments normally link each JAR from the local Maven repository, and
+hold a copy of it when linking is impossible (LinkStrategy.COPY, or a cache
+on another device than the repository). With a JarStore, each distinct JAR
+content is copied once into
+
+    <cache-dir>/store/sha256/<first two hex digits>/<sha256>.jar
+
+and environments hard-link to that copy instead. JARs with the same content
+are stored once whichever repository (or ~/.m2 layout) they came from, and
+survive the local repository being wiped.
+
+The number of hard links of a stored JAR tells how many environments use
+it: a JAR whose only link is the store itself is unused, and is removed by
+the garbage collector.
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import stat
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from ._linking import copy_file
+
+_log = logging.getLogger(__name__)
+
+# Name of the store directory under the jgo cache directory
+STORE_DIR = "store"
+
+
+@dataclass
+class StoreStats:
+    """Space used by a JarStore, and saved by sharing its JARs."""
+
+    jars: int = 0  # Distinct JARs in the store
+    stored_bytes: int = 0  # Bytes the store occupies
+    links: int = 0  # Environment links to stored JARs
+    linked_bytes: int = 0  # Bytes the environments would hold as copies
+    unused: int = 0  # Stored JARs no environment links to
+
+    @property
+    def saved_bytes(self) -> int:
+        """Bytes saved compared to one copy per environment link."""
+        return max(0, self.linked_bytes - self.stored_bytes)
+
+
+class JarStore:
+    """
+    A directory of JARs keyed by the SHA-256 of their content.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Create a handle on a store; the directory is created on first use.
+
+        Args:
+            path: Store directory, usually <cache-dir>/store
+        """
+        self.path = Path(path).expanduser()
+
+    @classmethod
+    def for_cache(cls, cache_dir: Path) -> JarStore:
+        """The store of a jgo cache directory."""
+        return cls(Path(cache_dir).expanduser() / STORE_DIR)
+
+    def path_for(self, sha256: str) -> Path:
+        """Where the JAR with the given SHA-256 is (or would be) stored."""
+        sha256 = sha256.lower()
+        return self.path / "sha256" / sha256[:2] / f"{sha256}.jar"
+
+    def add(self, source: Path, sha256: str) -> Path:
+        """
+        Store a JAR, unless a JAR with the same content is stored already.
+
+        The store owns a copy of its own (a reflink where the filesystem
+        supports it), so that the JAR outlives source and cannot change behind
+        the back of the environments linking to it.
+
+        Args:
+            source: JAR to store
+            sha256: SHA-256 of source's content
+
+        Returns:
+            Path of the stored JAR
+        """
+        blob = self.path_for(sha256)
+        if blob.exists():
+            return blob
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        temp = blob.with_name(f".{blob.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            copy_file(source, temp)
+            if os.name != "nt":  # Read-only files cannot be deleted on Windows
+                # An in-place write through any environment's link would
+                # corrupt every environment sharing the JAR
+                os.chmod(temp, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+            # Atomic, so concurrent builders storing the same JAR both win
+            os.replace(temp, blob)
+        finally:
+            temp.unlink(missing_ok=True)
+        _log.debug(f"Stored {source.name} as {blob.name}")
+        return blob
+
+    def link(self, source: Path, sha256: str, link_name: Path) -> bool:
+        """
+        Store a JAR and hard-link link_name to the stored copy.
+
+        Args:
+            source: JAR to store
+            sha256: SHA-256 of source's content
+            link_name: Path of the link to create
+
+        Returns:
+            True if linked; False if the store cannot be hard-linked from
+            link_name's directory (e.g. another device), in which case the
+            caller should fall back to linking source
+        """
+        try:
+            try:
+                os.link(self.add(source, sha256), link_name)
+            except FileNotFoundError:
+                # Pruned by a concurrent garbage collection; store it again
+                os.link(self.add(source, sha256), link_name)
+        except OSError as e:
+            if e.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                raise
+            _log.debug(f"Could not link {link_name.name} from the store: {e}")
+            return False
+        return True
+
+    def _blobs(self):
+        """Yield (path, stat) of each stored JAR."""
+        root = self.path / "sha256"
+        try:
+            shards = list(os.scandir(root))
+        except FileNotFoundError:
+            return
+        for shard in shards:
+            if not shard.is_dir(follow_symlinks=False):
+                continue
+            with os.scandir(shard.path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".jar"):
+                        try:
+                            yield Path(entry.path), entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+
+    def inodes(self) -> set[tuple[int, int]]:
+        """(device, inode) of every stored JAR, to recognize links to them."""
+        return {(st.st_dev, st.st_ino) for _, st in self._blobs()}
+
+    def stats(self) -> StoreStats:
+        """Measure the store and the space its sharing saves."""
+        stats = StoreStats()
+        for _, st in self._blobs():
+            stats.jars += 1
+            stats.stored_bytes += st.st_size
+            links = st.st_nlink - 1  # The store's own entry
+            stats.links += links
+            stats.linked_bytes += links * st.st_size
+            if links == 0:
+                stats.unused += 1
+        return stats
+
+    def prune(self, dry_run: bool = False) -> tuple[int, int]:
+        """
+        Remove the stored JARs that no environment links to.
+
+        Args:
+            dry_run: If True, only count what would be removed
+
+        Returns:
+            Number of JARs removed and bytes freed
+        """
+        count = freed = 0
+        for blob, st in self._blobs():
+            if st.st_nlink > 1:
+                continue
+            if not dry_run:
+                try:
+                    blob.unlink()
+                except OSError:
+                    continue
+            count += 1
+            freed += st.st_size
+        return count, freed
@@ -28,6 +28,11 @@ JavaRunner
       ``subprocess.CompletedProcess``.
     * ``run_and_capture(environment, ...)`` — capture stdout/stderr into
       ``result.stdout`` / ``result.stderr``.
+    * ``await arun(environment, ...)`` — start the JVM from asyncio and return
+      the ``asyncio.subprocess.Process`` (piped stdout/stderr by default).
+    * ``astream(environment, ...)`` — async iterator of ``(stream, data)``
+      lines or chunks, with backpressure, ``timeout`` and cancellation
+      (the JVM is killed if the consumer stops early).
 
 JVMConfig
     Encapsulates JVM tuning knobs passed as arguments to ``java``.
@@ -80,6 +85,9 @@ is_gc_flag(arg)
 normalize_gc_flag(arg)
     Normalise a GC flag to its canonical ``-XX:+UseXxxGC`` form.
 
+parse_memory_size(size)
+    Convert a JVM-style memory size (e.g. ``"512M"``, ``"2G"``) to bytes.
+
 Example — Full Execution Pipeline
 -----------------------------------
 >>> from jgo.maven import MavenContext
@@ -100,7 +108,7 @@ Example — Full Execution Pipeline
 """
 
 from ..util.java import JavaLocator, JavaSource
-from ._config import JVMConfig
+from ._config import JVMConfig, parse_memory_size
 from ._gc import is_gc_flag, normalize_gc_flag
 from ._runner import JavaRunner
 
@@ -111,4 +119,5 @@ __all__ = [
     "JavaLocator",
     "JavaRunner",
     "normalize_gc_flag",
+    "parse_memory_size",
 ]
@@ -29,6 +29,30 @@ def _flatten_properties(d: dict, prefix: str = "") -> dict:
     return result
 
 
+_MEMORY_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+def parse_memory_size(size: str) -> int:
+    """
+    Parse a JVM-style memory size (e.g., "512M", "2G", "1048576") into bytes.
+
+    Args:
+        size: Memory size with optional K/M/G/T suffix (case-insensitive)
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size is not a valid memory size
+    """
+    text = size.strip().upper()
+    unit = text[-1] if text and text[-1] in _MEMORY_UNITS else ""
+    number = text[: len(text) - len(unit)]
+    if not number.isdigit():
+        raise ValueError(f"Invalid memory size: {size}")
+    return int(number) * _MEMORY_UNITS[unit]
+
+
 class JVMConfig:
     """
     Configuration for JVM execution.
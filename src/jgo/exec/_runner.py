@@ -6,16 +6,36 @@ Executes Java programs with constructed environments.
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import os
+import signal
 import subprocess
 import sys
+import tempfile
+from contextlib import AbstractContextManager, nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, NoReturn
 
 from ..util.java import JavaLocator, JavaSource
 from ._config import JVMConfig
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 _log = logging.getLogger(__name__)
 
+# Combined length (in characters) of class-path/module-path arguments above
+# which argfile="auto" moves them into an @argfile instead of argv.
+ARGFILE_THRESHOLD = 8192
+
+# Longest line (in bytes) that the asyncio API can read from a JVM stream.
+STREAM_LINE_LIMIT = 1024 * 1024
+
+# Tasks releasing the environment leases of running JVMs started via asyncio
+_lease_tasks: set[asyncio.Task] = set()
+
 
 class JavaRunner:
     """
@@ -29,6 +49,8 @@ class JavaRunner:
         java_version: int | None = None,
         java_vendor: str | None = None,
         verbose: bool = False,
+        argfile: str = "auto",
+        explicit_classpath: bool = False,
     ):
         """
         Initialize Java runner.
@@ -39,12 +61,23 @@ class JavaRunner:
             java_version: Desired Java version (overrides environment detection)
             java_vendor: Desired Java vendor (e.g., "adoptium", "zulu")
             verbose: Enable verbose output
+            argfile: When to pass class-path/module-path arguments via a Java 9+
+                @argfile stored in the environment directory: "auto" (only when
+                they exceed ARGFILE_THRESHOLD characters), "always", or "never"
+            explicit_classpath: List the environment's JARs individually on the
+                class-path, in dependency resolution order (nearest first), rather
+                than using directory wildcards whose expansion order is up to the
+                JVM. Determines which copy of a duplicated class wins.
         """
+        if argfile not in ("auto", "always", "never"):
+            raise ValueError(f"Invalid argfile mode: {argfile}")
         self.jvm_config = jvm_config or JVMConfig()
         self.java_source = java_source
         self.java_version = java_version
         self.java_vendor = java_vendor
         self.verbose = verbose
+        self.argfile = argfile
+        self.explicit_classpath = explicit_classpath
 
     def run(
         self,
@@ -56,6 +89,7 @@ class JavaRunner:
         print_command: bool = False,
         dry_run: bool = False,
         module_mode: str = "auto",
+        exec_java: bool = False,
     ) -> subprocess.CompletedProcess:
         """
         Run a Java program from an environment.
@@ -71,6 +105,9 @@ class JavaRunner:
             print_command: If True, print the java command being executed
             dry_run: If True, print the command but don't execute it
             module_mode: Module mode - "auto", "class-path-only", or "module-path-only"
+            exec_java: If True (and on POSIX), replace the current process with
+                the JVM via exec instead of running it as a child process.
+                On success this call never returns.
 
         Returns:
             CompletedProcess from subprocess.run
@@ -78,6 +115,59 @@ class JavaRunner:
         Raises:
             RuntimeError: If main class cannot be determined or Java execution fails
         """
+        cmd, java_path = self._build_command(
+            environment,
+            main_class=main_class,
+            app_args=app_args,
+            additional_jvm_args=additional_jvm_args,
+            additional_classpath=additional_classpath,
+            module_mode=module_mode,
+        )
+
+        # Print command if requested or in dry-run/verbose mode
+        # Print directly to stderr for clean, unwrapped output
+        if print_command or self.verbose or dry_run:
+            print(" ".join(cmd), file=sys.stderr)
+
+        # In dry-run mode, don't execute - just return a mock result
+        if dry_run:
+            return subprocess.CompletedProcess(args=cmd, returncode=0)
+
+        # Lease the environment while Java runs, so that garbage collection
+        # of the jgo cache leaves it alone
+        with _lease(environment) as lease_fd:
+            if exec_java and os.name == "posix":
+                # The JVM inherits the lease and holds it until it exits
+                if lease_fd is not None:
+                    os.set_inheritable(lease_fd, True)
+                _exec(cmd, java_path)
+
+            # Execute
+            try:
+                result = subprocess.run(cmd, check=False)
+                return result
+            except FileNotFoundError:
+                raise RuntimeError(f"Java executable not found: {java_path}")
+            except OSError as e:
+                raise RuntimeError(f"Failed to execute Java program: {e}")
+
+    def _build_command(
+        self,
+        environment,  # Type hint would be circular: jgo.env.Environment
+        main_class: str | None = None,
+        app_args: list[str] | None = None,
+        additional_jvm_args: list[str] | None = None,
+        additional_classpath: list[str] | None = None,
+        module_mode: str = "auto",
+    ) -> tuple[list[str], Path]:
+        """
+        Build the java command line for running a program from an environment.
+
+        See run() for a description of the arguments.
+
+        Returns:
+            Tuple of (command, java_path)
+        """
         # Determine main class
         effective_main_class = main_class or environment.main_class
         if not effective_main_class:
@@ -148,6 +238,7 @@ class JavaRunner:
 
         # Build command
         cmd = [str(java_path)]
+        path_args: list[str] = []
 
         # Add JVM arguments (pass java major version for smart GC defaults)
         jvm_args = self.jvm_config.to_jvm_args(java_version=actual_java_version.major)
@@ -160,9 +251,9 @@ class JavaRunner:
         # Add module-path (directory, not enumerated JARs)
         # Only use module-path if Java 9+ and modules are present
         if use_modules and modules_dir.exists() and supports_modules:
-            cmd.extend(["--module-path", str(modules_dir)])
+            path_args.extend(["--module-path", str(modules_dir)])
             # Add all modules from the module-path
-            cmd.extend(["--add-modules", "ALL-MODULE-PATH"])
+            path_args.extend(["--add-modules", "ALL-MODULE-PATH"])
         elif use_modules and not supports_modules:
             # Java 8 or earlier - fall back to classpath for modular JARs
             use_modules = False
@@ -174,12 +265,22 @@ class JavaRunner:
         # Add classpath
         if use_classpath or classpath_dirs:
             # Start with environment directories, then add user-specified paths
-            all_classpath = list(classpath_dirs)
+            all_classpath = (
+                environment.ordered_jars(classpath_dirs)
+                if self.explicit_classpath and classpath_dirs
+                else list(classpath_dirs)
+            )
             if additional_classpath:
                 all_classpath.extend(Path(p) for p in additional_classpath)
             if all_classpath:
                 classpath_str = self._build_classpath(all_classpath)
-                cmd.extend(["-cp", classpath_str])
+                path_args.extend(["-cp", classpath_str])
+
+        cmd.extend(
+            self._path_args_or_argfile(
+                environment, path_args, actual_java_version.major
+            )
+        )
 
         # Determine if main class is in modular JAR
         module_name = None
@@ -200,23 +301,7 @@ class JavaRunner:
         if app_args:
             cmd.extend(app_args)
 
-        # Print command if requested or in dry-run/verbose mode
-        # Print directly to stderr for clean, unwrapped output
-        if print_command or self.verbose or dry_run:
-            print(" ".join(cmd), file=sys.stderr)
-
-        # In dry-run mode, don't execute - just return a mock result
-        if dry_run:
-            return subprocess.CompletedProcess(args=cmd, returncode=0)
-
-        # Execute
-        try:
-            result = subprocess.run(cmd, check=False)
-            return result
-        except FileNotFoundError:
-            raise RuntimeError(f"Java executable not found: {java_path}")
-        except OSError as e:
-            raise RuntimeError(f"Failed to execute Java program: {e}")
+        return cmd, java_path
 
     def run_and_capture(
         self,
@@ -246,7 +331,11 @@ class JavaRunner:
         if not effective_main_class:
             raise RuntimeError("No main class specified")
 
-        classpath = environment.classpath
+        classpath = (
+            environment.ordered_jars([environment.jars_dir])
+            if self.explicit_classpath
+            else environment.classpath
+        )
         if not classpath:
             raise RuntimeError(f"No JARs found in environment: {environment.path}")
 
@@ -269,8 +358,11 @@ class JavaRunner:
         if additional_jvm_args:
             cmd.extend(additional_jvm_args)
 
-        classpath_str = self._build_classpath(classpath)
-        cmd.extend(["-cp", classpath_str])
+        path_args = ["-cp", self._build_classpath(classpath)]
+        if self._wants_argfile(path_args):
+            java_major = locator._get_java_version(java_path).major
+            path_args = self._path_args_or_argfile(environment, path_args, java_major)
+        cmd.extend(path_args)
         cmd.append(effective_main_class)
 
         if app_args:
@@ -290,6 +382,236 @@ class JavaRunner:
         except OSError as e:
             raise RuntimeError(f"Failed to execute Java program: {e}")
 
+    async def arun(
+        self,
+        environment,  # Type hint would be circular: jgo.env.Environment
+        main_class: str | None = None,
+        app_args: list[str] | None = None,
+        additional_jvm_args: list[str] | None = None,
+        additional_classpath: list[str] | None = None,
+        print_command: bool = False,
+        module_mode: str = "auto",
+        stdin=None,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    ) -> asyncio.subprocess.Process:
+        """
+        Start a Java program from an environment without blocking the event loop.
+
+        The command is built exactly as for run(); locating (or downloading)
+        Java happens in a worker thread. The returned process's stdout and
+        stderr are asyncio StreamReaders (async-iterable line by line) when
+        piped. Pipes are not drained automatically: a reader that falls behind
+        makes the JVM block on write, which bounds memory use but means every
+        piped stream must be consumed (or use astream()).
+
+        Args:
+            environment: Environment containing classpath and metadata
+            main_class: Main class to execute (uses environment.main_class
+                if not specified)
+            app_args: Arguments to pass to the application
+            additional_jvm_args: Additional JVM arguments (beyond jvm_config)
+            additional_classpath: Additional classpath elements
+            print_command: If True, print the java command being executed
+            module_mode: Module mode - "auto", "class-path-only", or "module-path-only"
+            stdin: stdin for the process (as for asyncio.create_subprocess_exec)
+            stdout: stdout for the process (default: PIPE)
+            stderr: stderr for the process (default: PIPE; use
+                asyncio.subprocess.STDOUT to merge it into stdout)
+
+        Returns:
+            The started asyncio.subprocess.Process
+
+        Raises:
+            RuntimeError: If main class cannot be determined or Java cannot be started
+        """
+        process, _ = await self._astart(
+            environment,
+            main_class=main_class,
+            app_args=app_args,
+            additional_jvm_args=additional_jvm_args,
+            additional_classpath=additional_classpath,
+            print_command=print_command,
+            module_mode=module_mode,
+            stdin=stdin,
+            stdout=stdout,
+            stderr=stderr,
+        )
+        return process
+
+    async def _astart(
+        self,
+        environment,
+        main_class: str | None,
+        app_args: list[str] | None,
+        additional_jvm_args: list[str] | None,
+        additional_classpath: list[str] | None,
+        print_command: bool,
+        module_mode: str,
+        stdin,
+        stdout,
+        stderr,
+    ) -> tuple[asyncio.subprocess.Process, list[str]]:
+        """Build the command in a worker thread and start it; see arun()."""
+        cmd, java_path = await asyncio.to_thread(
+            self._build_command,
+            environment,
+            main_class=main_class,
+            app_args=app_args,
+            additional_jvm_args=additional_jvm_args,
+            additional_classpath=additional_classpath,
+            module_mode=module_mode,
+        )
+
+        if print_command or self.verbose:
+            print(" ".join(cmd), file=sys.stderr)
+
+        # Lease the environment until the JVM exits (see run())
+        lease = _lease(environment)
+        lease.__enter__()
+        try:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=stdin,
+                    stdout=stdout,
+                    stderr=stderr,
+                    limit=STREAM_LINE_LIMIT,
+                )
+            except FileNotFoundError:
+                raise RuntimeError(f"Java executable not found: {java_path}")
+            except OSError as e:
+                raise RuntimeError(f"Failed to execute Java program: {e}")
+        except BaseException as e:
+            lease.__exit__(type(e), e, e.__traceback__)
+            raise
+
+        async def release_lease() -> None:
+            try:
+                await process.wait()
+            finally:
+                lease.__exit__(None, None, None)
+
+        task = asyncio.create_task(release_lease())
+        _lease_tasks.add(task)
+        task.add_done_callback(_lease_tasks.discard)
+        return process, cmd
+
+    async def astream(
+        self,
+        environment,  # Type hint would be circular: jgo.env.Environment
+        main_class: str | None = None,
+        app_args: list[str] | None = None,
+        additional_jvm_args: list[str] | None = None,
+        additional_classpath: list[str] | None = None,
+        module_mode: str = "auto",
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+        check: bool = True,
+        max_pending: int = 64,
+    ) -> AsyncIterator[tuple[str, bytes]]:
+        """
+        Run a Java program and stream its stdout and stderr as they are produced.
+
+        Yields ("stdout", data) and ("stderr", data) tuples, where data is a
+        line (including its trailing newline) or, if chunk_size is given, a raw
+        chunk of at most chunk_size bytes. Both streams are read concurrently
+        into a queue of at most max_pending items, so a slow consumer throttles
+        the JVM instead of buffering its output in memory.
+
+        If the timeout expires, or the consumer stops iterating early (break,
+        aclose(), or task cancellation), the JVM is killed and reaped.
+
+        Args:
+            environment: Environment containing classpath and metadata
+            main_class: Main class to execute
+            app_args: Arguments to pass to the application
+            additional_jvm_args: Additional JVM arguments (beyond jvm_config)
+            additional_classpath: Additional classpath elements
+            module_mode: Module mode - "auto", "class-path-only", or "module-path-only"
+            chunk_size: Yield raw chunks of up to this many bytes instead of lines
+            timeout: Seconds after which the JVM is killed (None: no limit)
+            check: If True, raise CalledProcessError for a non-zero exit code
+            max_pending: Maximum number of read but unconsumed items
+
+        Yields:
+            (stream name, data) tuples
+
+        Raises:
+            asyncio.TimeoutError: If the timeout expires
+            subprocess.CalledProcessError: If check is True and the JVM fails
+            ValueError: If a line is longer than STREAM_LINE_LIMIT bytes
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        process, cmd = await self._astart(
+            environment,
+            main_class=main_class,
+            app_args=app_args,
+            additional_jvm_args=additional_jvm_args,
+            additional_classpath=additional_classpath,
+            print_command=False,
+            module_mode=module_mode,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        # Items are (stream, data); data None marks end of stream, and an
+        # exception (e.g. a line longer than STREAM_LINE_LIMIT) is re-raised
+        queue: asyncio.Queue[tuple[str, bytes | Exception | None]] = asyncio.Queue(
+            max_pending
+        )
+
+        async def pump(name: str, reader: asyncio.StreamReader) -> None:
+            try:
+                while True:
+                    if chunk_size is None:
+                        data = await reader.readline()
+                    else:
+                        data = await reader.read(chunk_size)
+                    if not data:
+                        break
+                    await queue.put((name, data))
+            except (OSError, ValueError) as e:
+                # E.g. a line longer than STREAM_LINE_LIMIT; raised by the reader
+                await queue.put((name, e))
+                return
+            await queue.put((name, None))
+
+        # Both are pipes, as requested above
+        assert process.stdout is not None and process.stderr is not None
+        pumps = [
+            asyncio.create_task(pump("stdout", process.stdout)),
+            asyncio.create_task(pump("stderr", process.stderr)),
+        ]
+        try:
+            open_streams = len(pumps)
+            while open_streams:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    raise asyncio.TimeoutError()
+                name, data = await asyncio.wait_for(queue.get(), remaining)
+                if data is None:
+                    open_streams -= 1
+                elif isinstance(data, Exception):
+                    raise data
+                else:
+                    yield name, data
+
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            returncode = await asyncio.wait_for(process.wait(), remaining)
+            if check and returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd)
+        finally:
+            for task in pumps:
+                task.cancel()
+            await asyncio.gather(*pumps, return_exceptions=True)
+            if process.returncode is None:
+                _log.debug("Killing Java process (stream closed early or timed out)")
+                process.kill()
+                await process.wait()
+
     def _build_classpath(self, paths: list[Path]) -> str:
         """
         Build classpath string from paths.
@@ -309,3 +631,128 @@ class JavaRunner:
             return str(path / "*") if path.is_dir() else str(path)
 
         return separator.join(format_path(path) for path in paths)
+
+    def _wants_argfile(self, path_args: list[str]) -> bool:
+        """Check whether the given path arguments should go into an @argfile."""
+        if not path_args or self.argfile == "never":
+            return False
+        if self.argfile == "always":
+            return True
+        return sum(len(arg) + 1 for arg in path_args) > ARGFILE_THRESHOLD
+
+    def _path_args_or_argfile(
+        self, environment, path_args: list[str], java_major: int
+    ) -> list[str]:
+        """
+        Replace class-path/module-path arguments with a single @argfile argument.
+
+        Argument files are a Java 9+ launcher feature; older Java versions and
+        short argument lists are passed through unchanged.
+
+        Args:
+            environment: Environment whose directory stores the argfile
+            path_args: Class-path/module-path arguments (e.g. ["-cp", "..."])
+            java_major: Major version of the Java that will run the command
+
+        Returns:
+            Either path_args unchanged, or ["@/path/to/argfile"]
+        """
+        if java_major < 9 or not self._wants_argfile(path_args):
+            return path_args
+        argfile = write_argfile(environment.argfiles_dir, path_args)
+        _log.debug(f"Passing class-path/module-path via argfile: {argfile}")
+        return [f"@{argfile}"]
+
+
+def _lease(environment) -> AbstractContextManager[int | None]:
+    """Lease an environment while its JVM runs; see Environment.lease()."""
+    lease = getattr(environment, "lease", None)
+    return lease() if lease is not None else nullcontext()
+
+
+def _exec(cmd: list[str], java_path: Path) -> NoReturn:
+    """
+    Replace the current process with the given command.
+
+    Signal dispositions that Python changes at startup are restored first
+    (as subprocess does with restore_signals=True), since ignored signals
+    survive exec.
+    """
+    _log.debug("Replacing jgo process with java via exec")
+    for name in ("SIGPIPE", "SIGXFZ", "SIGXFSZ"):
+        if hasattr(signal, name):
+            signal.signal(getattr(signal, name), signal.SIG_DFL)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(cmd[0], cmd)
+    except FileNotFoundError:
+        raise RuntimeError(f"Java executable not found: {java_path}")
+    except OSError as e:
+        raise RuntimeError(f"Failed to execute Java program: {e}")
+
+
+def write_argfile(argfiles_dir: Path, args: list[str]) -> Path:
+    """
+    Write arguments to a Java @argfile, reusing an identical existing one.
+
+    Class-path wildcards (dir/*) are expanded to the JARs they match, since
+    the launcher does not expand wildcards found inside argument files. The
+    file is named after the hash of its content, so it only changes when the
+    environment (or the extra class-path) changes, and concurrent launches
+    never observe a partially written file.
+
+    Args:
+        argfiles_dir: Directory in which to store the argfile
+        args: Arguments to write
+
+    Returns:
+        Path to the argfile
+    """
+    lines = []
+    expand_next = False
+    for arg in args:
+        value = _expand_classpath_wildcards(arg) if expand_next else arg
+        lines.append(_quote_argfile_arg(value))
+        expand_next = arg in ("-cp", "-classpath", "--class-path")
+    content = "\n".join(lines) + "\n"
+
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    argfile = argfiles_dir / f"{digest}.args"
+    if argfile.exists():
+        return argfile
+
+    argfiles_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=argfiles_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_name, argfile)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return argfile
+
+
+def _expand_classpath_wildcards(classpath: str) -> str:
+    """Expand dir/* class-path entries into the JAR files they match."""
+    separator = ";" if sys.platform == "win32" else ":"
+    entries = []
+    for entry in classpath.split(separator):
+        directory = Path(entry[:-1]) if entry.endswith("*") else None
+        if directory is not None and directory.is_dir():
+            with os.scandir(directory) as it:
+                jars = sorted(
+                    e.path
+                    for e in it
+                    if e.name.lower().endswith(".jar") and not e.is_dir()
+                )
+            entries.extend(jars)
+        else:
+            entries.append(entry)
+    return separator.join(entries)
+
+
+def _quote_argfile_arg(arg: str) -> str:
+    """Quote an argument for a Java @argfile (backslash is the escape character)."""
+    return '"' + arg.replace("\\", "\\\\").replace('"', '\\"') + '"'
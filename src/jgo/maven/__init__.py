@@ -76,6 +76,8 @@ Resolvers
 PythonResolver (default)
     Pure-Python resolver that parses POMs, handles BOMs/imports, and
     downloads JARs directly via HTTP — no ``mvn`` binary required.
+    ``resolve_platforms(dependencies, platforms)`` resolves for several
+    ``ProfileConstraints`` at once, sharing platform-independent POM models.
 
 MvnResolver
     Shells out to the ``mvn`` command line tool.  Useful when precise
@@ -83,18 +85,39 @@ MvnResolver
 
 Both implement the abstract ``Resolver`` interface, which exposes:
 - ``download(artifact)`` — fetch one artifact file
+- ``prefetch(artifacts)`` — fetch many artifact files (concurrently, for
+  PythonResolver, via ``DownloadScheduler``)
 - ``resolve(dependencies)`` — resolve full transitive dependency graph
 - ``get_dependency_list(dependencies)`` — flat list of resolved deps
 - ``get_dependency_tree(dependencies)`` — full dependency tree
 
+Transports
+----------
+Transport / RequestsTransport
+    How a ``MavenContext`` talks HTTP to remote repositories
+    (``MavenContext(transport=...)``); the default uses ``requests``.
+
+AsyncTransport / ThreadedAsyncTransport
+    The same for asyncio code; e.g.
+    ``ThreadedAsyncTransport(context.transport)`` runs a context's transport
+    in worker threads.
+
 Version Utilities
 -----------------
 MavenVersion, VersionRange, parse_version_range, version_in_range
     Maven version comparison and range support (e.g., ``[1.0,2.0)``).
 
+VersionIndex
+    Versions sorted once for binary-search range queries; see
+    ``Project.version_index``.
+
 compare_versions(v1, v2)
     Return negative/zero/positive (like ``cmp``) using Maven ordering rules.
 
+max_version(versions), sort_versions(versions), parse_maven_version(v)
+    Key-based ordering of many versions; ``MavenVersion.sort_key()`` gives a
+    plain tuple, and ``parse_maven_version`` interns parsed versions.
+
 POM / Metadata Classes
 -----------------------
 POM
@@ -105,10 +128,18 @@ Model
     Fully-built effective POM after parent inheritance and property
     resolution. Used internally by PythonResolver.
 
+ModelCache
+    Models shared between resolutions for several platforms; see
+    ``PythonResolver.resolve_platforms``.
+
 Metadata / MetadataXML / Metadatas
     Maven ``maven-metadata.xml`` data — available versions, release/latest
     markers, and snapshot timestamp resolution.
 
+UpdatePolicy
+    How often cached metadata is re-checked against each remote repository
+    (``always``, ``daily``, ``interval:N``, ``never``); see ``MavenContext``.
+
 Example — Resolve Dependencies
 -------------------------------
 >>> from jgo.maven import MavenContext
@@ -134,17 +165,28 @@ from ._core import (
     Project,
     Resolver,
 )
-from ._metadata import Metadata, Metadatas, MetadataXML
-from ._model import Model, ProfileConstraints
+from ._metadata import Metadata, Metadatas, MetadataXML, UpdatePolicy
+from ._model import Model, ModelCache, ProfileConstraints
 from ._pom import POM, XML
 from ._resolver import MvnResolver, PythonResolver
+from ._scheduler import DownloadScheduler, RateLimiter
+from ._transport import (
+    AsyncTransport,
+    RequestsTransport,
+    ThreadedAsyncTransport,
+    Transport,
+)
 from ._version import (
     MavenVersion,
+    VersionIndex,
     VersionRange,
     compare_semver,
     compare_versions,
     is_semver_1x,
+    max_version,
+    parse_maven_version,
     parse_version_range,
+    sort_versions,
     version_in_range,
 )
 
@@ -160,8 +202,10 @@ __all__ = [
     "Metadata",
     "Metadatas",
     "MetadataXML",
+    "UpdatePolicy",
     # model
     "Model",
+    "ModelCache",
     "ProfileConstraints",
     # pom
     "POM",
@@ -170,12 +214,24 @@ __all__ = [
     "MvnResolver",
     "PythonResolver",
     "Resolver",
+    # scheduler
+    "DownloadScheduler",
+    "RateLimiter",
+    # transport
+    "AsyncTransport",
+    "RequestsTransport",
+    "ThreadedAsyncTransport",
+    "Transport",
     # version
     "MavenVersion",
+    "VersionIndex",
     "VersionRange",
     "compare_semver",
     "compare_versions",
     "is_semver_1x",
+    "max_version",
+    "parse_maven_version",
     "parse_version_range",
+    "sort_versions",
     "version_in_range",
 ]
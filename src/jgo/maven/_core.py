@@ -25,8 +25,8 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from functools import cmp_to_key
 from hashlib import md5, sha1
 from os import environ
 from pathlib import Path
@@ -35,12 +35,24 @@ from typing import TYPE_CHECKING, Iterable
 from ..constants import MAVEN_CENTRAL_URL, default_maven_repo
 from ..parse import Coordinate, coord2str
 from ..util.io import binary, text
-from ._metadata import Metadatas, MetadataXML, SnapshotMetadataXML
+from ..util.locks import file_lock
+from ._metadata import (
+    Metadatas,
+    MetadataXML,
+    SnapshotMetadataXML,
+    UpdatePolicy,
+    fetch_metadata,
+)
 from ._pom import POM, parse_dependency_element_to_coordinate
-from ._version import compare_versions
+from ._remote import FLOATING_FILE, ROUTES_FILE, FloatingVersionIndex, RouteTable
+from ._transport import RequestsTransport
+from ._version import VersionIndex, VersionRange, max_version
 
 if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
     from ._metadata import Metadata
+    from ._transport import Transport
 
 # -- Constants --
 
@@ -48,6 +60,8 @@ DEFAULT_LOCAL_REPOS: list[Path] = []
 DEFAULT_REMOTE_REPOS = {"central": MAVEN_CENTRAL_URL}
 DEFAULT_CLASSIFIER = ""
 DEFAULT_PACKAGING = "jar"
+DEFAULT_UPDATE_POLICY = "daily"
+LOCKS_DIR = ".locks"
 
 
 class MavenContext:
@@ -56,6 +70,9 @@ class MavenContext:
     * Local repo cache folder.
     * Local repository storage folders.
     * Remote repository name:URL pairs.
+    * Metadata update policy per remote repository.
+    * Configured and learned groupId -> repository routes.
+    * Transport for HTTP requests to the remote repositories.
     * Artifact resolution mechanism.
     """
 
@@ -66,6 +83,11 @@ class MavenContext:
         local_repos: list[Path] | None = None,
         remote_repos: dict[str, str] | None = None,
         timeout: int = 10,
+        update_policy: str = DEFAULT_UPDATE_POLICY,
+        update_policies: dict[str, str] | None = None,
+        routes: dict[str, str | list[str]] | None = None,
+        transport: Transport | None = None,
+        floating_policy: str | None = None,
     ):
         """
         Create a Maven context.
@@ -94,6 +116,26 @@ class MavenContext:
             timeout:
                 HTTP request timeout in seconds for downloading artifacts and metadata.
                 Defaults to 10 seconds.
+            update_policy:
+                How often remote maven-metadata.xml is re-checked: "always",
+                "daily", "interval:N" (minutes) or "never". Defaults to "daily",
+                as in Maven. See UpdatePolicy.
+            update_policies:
+                Optional dict of remote name:policy pairs overriding update_policy
+                for individual repositories.
+            routes:
+                Optional dict of groupId pattern:remote name(s) pairs, e.g.
+                {"org.scijava.*": "scijava"}. Artifacts of matching groupIds are
+                requested from the named repositories first. Repositories that
+                served a groupId before are also tried early. See RouteTable.
+            transport:
+                Optional Transport performing the HTTP requests to the remote
+                repositories. Defaults to a RequestsTransport.
+            floating_policy:
+                How long a RELEASE or LATEST version, once resolved, is reused
+                without reading maven-metadata.xml, as an update policy (e.g.
+                "interval:60"). Defaults to update_policy. See
+                FloatingVersionIndex.
         """
         self.repo_cache: Path = repo_cache or Path(
             environ.get("M2_REPO", default_maven_repo())
@@ -105,6 +147,16 @@ class MavenContext:
             DEFAULT_REMOTE_REPOS if remote_repos is None else remote_repos
         ).copy()
         self.timeout: int = timeout
+        self.update_policy = UpdatePolicy(update_policy)
+        self.update_policies: dict[str, UpdatePolicy] = {
+            name: UpdatePolicy(spec) for name, spec in (update_policies or {}).items()
+        }
+        self.routes = RouteTable(self.repo_cache / ROUTES_FILE, routes)
+        self.floating_versions = FloatingVersionIndex(
+            self.repo_cache / FLOATING_FILE,
+            UpdatePolicy(floating_policy) if floating_policy else self.update_policy,
+        )
+        self.transport: Transport = transport or RequestsTransport()
         # Import here to avoid circular dependency
         if resolver is None:
             from ._resolver import PythonResolver
@@ -112,6 +164,101 @@ class MavenContext:
             resolver = PythonResolver()
         self.resolver: Resolver = resolver
 
+    def update_policy_for(self, repo_name: str) -> UpdatePolicy:
+        """
+        Get the metadata update policy for a remote repository.
+
+        Args:
+            repo_name: Name of the remote repository.
+
+        Returns:
+            The repository's own policy if configured, else the default policy.
+        """
+        return self.update_policies.get(repo_name, self.update_policy)
+
+    def ordered_repos(self, groupId: str) -> list[tuple[str, str]]:
+        """
+        Get the remote repositories to ask for an artifact, in priority order.
+
+        Repositories routed for the groupId come first: those of the matching
+        configured rule, then the one that last served it (see RouteTable).
+        The others follow in configured order.
+
+        Args:
+            groupId: The groupId of the artifact.
+
+        Returns:
+            List of (name, URL) pairs.
+        """
+        names = self.routes.order(groupId, self.remote_repos)
+        return [(name, self.remote_repos[name]) for name in names]
+
+    def lock(self, path: Path) -> AbstractContextManager[int]:
+        """
+        Get the cross-process lock guarding a file in the local repository cache.
+
+        jgo processes sharing a repository cache take this lock around
+        downloads, so that one process fetches a file while the others wait
+        and then reuse it. Lock files live in the .locks directory of the
+        repository cache, like those of Maven's file-based named locks.
+
+        Args:
+            path: The guarded file, e.g. an artifact's cached_path.
+
+        Returns:
+            Context manager holding the lock (see jgo.util.locks.file_lock).
+        """
+        try:
+            key = "~".join(path.relative_to(self.repo_cache).parts)
+        except ValueError:
+            key = sha1(str(path).encode()).hexdigest()
+        return file_lock(self.repo_cache / LOCKS_DIR / f"{key}.lock")
+
+    def update_metadata(self, path_prefix: Path, force: bool = False) -> list[str]:
+        """
+        Refresh maven-metadata.xml for a path from all remote repositories at once.
+
+        Requests go out concurrently, so a refresh costs the latency of the
+        slowest repository rather than the sum over all of them. Each
+        repository's copy is cached as maven-metadata-<repo>.xml under
+        repo_cache; readers merge them (see Metadatas).
+
+        Args:
+            path_prefix: Relative metadata directory, e.g. org/scijava/scijava-common
+            force: If True, check every repository regardless of update policy.
+
+        Returns:
+            Names of the repositories holding metadata for the path.
+        """
+        cache_dir = self.repo_cache / path_prefix
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Convert Path to forward-slash string for URL
+        path_str = str(path_prefix).replace("\\", "/")
+
+        def fetch(repo: tuple[str, str]) -> bool:
+            repo_name, repo_url = repo
+            metadata_file = cache_dir / f"maven-metadata-{repo_name}.xml"
+            # A process that waited for the lock usually finds the metadata
+            # fresh and skips the request per the update policy
+            with self.lock(metadata_file):
+                return fetch_metadata(
+                    f"{repo_url}/{path_str}/maven-metadata.xml",
+                    metadata_file,
+                    self.update_policy_for(repo_name),
+                    self.timeout,
+                    force=force,
+                    transport=self.transport,
+                )
+
+        repos = list(self.remote_repos.items())
+        if len(repos) <= 1:
+            found = [fetch(repo) for repo in repos]
+        else:
+            with ThreadPoolExecutor(max_workers=len(repos)) as pool:
+                found = list(pool.map(fetch, repos))
+        return [name for (name, _), ok in zip(repos, found) if ok]
+
     def project(self, groupId: str, artifactId: str) -> Project:
         """
         Get a project (G:A) with the given groupId and artifactId.
@@ -266,6 +413,7 @@ class Project:
         self.groupId = groupId
         self.artifactId = artifactId
         self._metadata: Metadata | None = None
+        self._version_index: VersionIndex | None = None
 
     def __eq__(self, other):
         return (
@@ -313,29 +461,24 @@ class Project:
             self._metadata = Metadatas([MetadataXML(p) for p in paths if p.exists()])
         return self._metadata
 
-    def update(self) -> None:
-        """Update metadata from remote sources."""
-        import requests
-
-        repo_cache_dir = self.context.repo_cache / self.path_prefix
-        repo_cache_dir.mkdir(parents=True, exist_ok=True)
-
-        # Try to fetch maven-metadata.xml from each remote repository
-        for repo_name, repo_url in self.context.remote_repos.items():
-            metadata_url = f"{repo_url}/{self.path_prefix}/maven-metadata.xml"
-            try:
-                response = requests.get(metadata_url, timeout=self.context.timeout)
-                if response.status_code == 200:
-                    # Save to local cache with repo name suffix
-                    metadata_file = repo_cache_dir / f"maven-metadata-{repo_name}.xml"
-                    with open(metadata_file, "wb") as f:
-                        f.write(response.content)
-            except requests.RequestException:
-                # Silently ignore failures - metadata might not be available
-                pass
+    def update(self, force: bool = False) -> None:
+        """
+        Update metadata from remote sources.
+
+        All repositories are queried concurrently (see
+        MavenContext.update_metadata). Each is only contacted when its update
+        policy says the cached maven-metadata.xml is due for a check, and then
+        with a conditional request (see fetch_metadata).
+
+        Args:
+            force: If True, check every repository regardless of update policy.
+        """
+        # Metadata might not be available - failures are ignored
+        self.context.update_metadata(self.path_prefix, force=force)
 
         # Force reload of metadata
         self._metadata = None
+        self._version_index = None
 
     @property
     def release(self) -> str | None:
@@ -379,7 +522,7 @@ class Project:
         if not release_versions:
             return None
 
-        return max(release_versions, key=cmp_to_key(compare_versions))
+        return max_version(release_versions)
 
     @property
     def latest(self) -> str | None:
@@ -428,7 +571,33 @@ class Project:
         if not all_versions:
             return None
 
-        return max(all_versions, key=cmp_to_key(compare_versions))
+        return max_version(all_versions)
+
+    @property
+    def version_index(self) -> VersionIndex:
+        """
+        All known versions of this project, sorted for range queries.
+
+        Built on first use from the project metadata, and rebuilt after update().
+        """
+        if self._version_index is None:
+            self._version_index = VersionIndex(self.metadata.versions)
+        return self._version_index
+
+    def highest_in_range(
+        self, range_spec: str | VersionRange, snapshots: bool = False
+    ) -> str | None:
+        """
+        The highest known version of this project satisfying a version range.
+
+        Args:
+            range_spec: Range specification (e.g. "[1.2,2.0)") or VersionRange.
+            snapshots: If True, SNAPSHOT versions are also candidates.
+
+        Returns:
+            The highest matching version string, or None if none match.
+        """
+        return self.version_index.highest(range_spec, snapshots=snapshots)
 
     def versions(
         self, releases: bool = True, snapshots: bool = False, locked: bool = False
@@ -514,9 +683,21 @@ class Component:
 
         # Check if version needs resolution
         if self.version in ("RELEASE", "LATEST"):
-            # Fetch metadata from remote if needed
-            if not self.project.metadata or not self.project.metadata.versions:
-                self.project.update()
+            # A recent resolution spares reading and refreshing the metadata
+            floating = self.context.floating_versions
+            repos = [
+                *self.context.remote_repos.values(),
+                *map(str, self.context.local_repos),
+            ]
+            resolved = floating.lookup(
+                self.groupId, self.artifactId, self.version, repos
+            )
+            if resolved is not None:
+                self._resolved_version = resolved
+                return resolved
+
+            # Fetch metadata from remote if missing or due per update policy
+            self.project.update()
 
             # Resolve to actual version
             if self.version == "RELEASE":
@@ -530,6 +711,9 @@ class Component:
                     f"{self.project.groupId}:{self.project.artifactId}"
                 )
 
+            floating.record(
+                self.groupId, self.artifactId, self.version, repos, resolved
+            )
             self._resolved_version = resolved
             return resolved
 
@@ -569,44 +753,27 @@ class Component:
 
         return self._snapshot_metadata
 
-    def update_snapshot_metadata(self) -> None:
+    def update_snapshot_metadata(self, force: bool = False) -> None:
         """
         Fetch SNAPSHOT metadata from remote repositories.
         Similar to Project.update() but for version-level metadata.
+
+        Args:
+            force: If True, check every repository regardless of update policy.
         """
         if not self.resolved_version.endswith("-SNAPSHOT"):
             return
 
         import logging
 
-        import requests
-
         _log = logging.getLogger(__name__)
 
-        cache_dir = self.context.repo_cache / self.path_prefix
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
         _log.debug(f"Fetching SNAPSHOT metadata for {self}")
 
-        # Try to fetch maven-metadata.xml from each remote repository
-        found = False
-        for repo_name, repo_url in self.context.remote_repos.items():
-            # Convert Path to forward-slash string for URL
-            path_str = str(self.path_prefix).replace("\\", "/")
-            metadata_url = f"{repo_url}/{path_str}/maven-metadata.xml"
-            try:
-                _log.debug(f"Trying {metadata_url}")
-                response = requests.get(metadata_url, timeout=self.context.timeout)
-                if response.status_code == 200:
-                    # Save to local cache with repo name suffix
-                    metadata_file = cache_dir / f"maven-metadata-{repo_name}.xml"
-                    metadata_file.write_bytes(response.content)
-                    _log.info(
-                        f"Downloaded SNAPSHOT metadata for {self} from {repo_name}"
-                    )
-                    found = True
-            except requests.RequestException as e:
-                _log.debug(f"Failed to fetch SNAPSHOT metadata from {repo_name}: {e}")
+        # Fetch maven-metadata.xml from all remote repositories at once
+        found = self.context.update_metadata(self.path_prefix, force=force)
+        if found:
+            _log.info(f"Have SNAPSHOT metadata for {self} from {', '.join(found)}")
 
         if not found:
             _log.warning(f"No SNAPSHOT metadata found for {self} in any repository")
@@ -839,7 +1006,15 @@ class Artifact:
                     return p
 
         # Artifact was not found locally; need to download it.
-        result = self.context.resolver.download(self)
+        if cached_file:
+            # Other processes sharing the cache may want it too: one downloads
+            # while the others wait, then finds the file present
+            with self.context.lock(cached_file):
+                if cached_file.exists():
+                    return cached_file
+                result = self.context.resolver.download(self)
+        else:
+            result = self.context.resolver.download(self)
         if result is None:
             raise RuntimeError(f"Could not resolve artifact: {self}")
         return result
@@ -1114,6 +1289,21 @@ class Resolver(ABC):
         """
         ...
 
+    def prefetch(self, artifacts: Iterable[Artifact]) -> list[Path]:
+        """
+        Make many artifacts available locally, downloading them as needed.
+
+        The base implementation resolves them one after another; resolvers
+        may download them concurrently.
+
+        Args:
+            artifacts: The artifacts to resolve.
+
+        Returns:
+            Local paths of the artifacts, in the order given.
+        """
+        return [artifact.resolve() for artifact in artifacts]
+
     @abstractmethod
     def resolve(
         self,
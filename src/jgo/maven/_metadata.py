@@ -4,17 +4,24 @@ Maven metadata handling (maven-metadata.xml files).
 
 from __future__ import annotations
 
+import logging
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import date, datetime
 from itertools import combinations
 from re import match
 from typing import TYPE_CHECKING, Iterable
 
+from ..util.io import read_json, write_atomic, write_json
 from ._pom import XML
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from ._transport import Transport
+
+_log = logging.getLogger(__name__)
+
 
 class Metadata(ABC):
     """Abstract base class for Maven metadata."""
@@ -255,3 +262,188 @@ def ts2dt(ts: str) -> datetime:
     if not m:
         raise ValueError(f"Invalid timestamp: {ts}")
     return datetime(*map(int, m.groups()))  # type: ignore[arg-type]
+
+
+class UpdatePolicy:
+    """
+    How often remote maven-metadata.xml is re-checked, like Maven's updatePolicy.
+
+    Policies:
+    * always - check on every update
+    * daily - check on the first update of each (local) day
+    * interval:N - check when the last check is more than N minutes old
+    * never - only fetch metadata that is not cached yet
+
+    Metadata that has never been fetched is always due, whatever the policy.
+    """
+
+    def __init__(self, spec: str = "daily"):
+        """
+        Parse an update policy.
+
+        Args:
+            spec: "always", "daily", "interval:N" (minutes) or "never"
+
+        Raises:
+            ValueError: If the policy is not recognized
+        """
+        spec = spec.strip().lower()
+        self.interval: float | None = None
+        if spec.startswith("interval:"):
+            try:
+                minutes = int(spec[len("interval:") :])
+            except ValueError:
+                minutes = -1
+            if minutes < 0:
+                raise ValueError(f"Invalid update policy interval: {spec}")
+            self.interval = minutes * 60.0
+        elif spec not in ("always", "daily", "never"):
+            raise ValueError(
+                f"Invalid update policy: {spec} "
+                "(expected always, daily, interval:N or never)"
+            )
+        self.spec = spec
+
+    def __eq__(self, other):
+        return isinstance(other, UpdatePolicy) and self.spec == other.spec
+
+    def __hash__(self):
+        return hash(self.spec)
+
+    def __repr__(self):
+        return f"UpdatePolicy({self.spec!r})"
+
+    def is_due(self, last_checked: float | None, now: float | None = None) -> bool:
+        """
+        Check whether remote metadata should be checked again.
+
+        Args:
+            last_checked: Epoch seconds of the last successful check, or None
+            now: Current epoch seconds (defaults to time.time())
+
+        Returns:
+            True if a remote check is due
+        """
+        if last_checked is None:
+            return True
+        if now is None:
+            now = time.time()
+        if self.spec == "always":
+            return True
+        if self.spec == "never":
+            return False
+        if self.spec == "daily":
+            return date.fromtimestamp(last_checked) < date.fromtimestamp(now)
+        assert self.interval is not None
+        return now - last_checked > self.interval
+
+
+def metadata_status_path(metadata_file: Path) -> Path:
+    """
+    Get the sidecar file recording fetch state for a cached metadata file.
+
+    E.g. maven-metadata-central.xml -> maven-metadata-central.xml.status.json
+    """
+    return metadata_file.with_name(metadata_file.name + ".status.json")
+
+
+def _read_status(metadata_file: Path) -> dict:
+    """Load the fetch state of a cached metadata file (empty if unknown)."""
+    return read_json(metadata_status_path(metadata_file))
+
+
+def _write_status(metadata_file: Path, status: dict) -> None:
+    """Record the fetch state of a cached metadata file."""
+    try:
+        write_json(metadata_status_path(metadata_file), status)
+    except OSError as e:
+        _log.debug(f"Could not record metadata status for {metadata_file}: {e}")
+
+
+def fetch_metadata(
+    url: str,
+    metadata_file: Path,
+    policy: UpdatePolicy,
+    timeout: float,
+    force: bool = False,
+    transport: Transport | None = None,
+) -> bool:
+    """
+    Refresh a cached maven-metadata.xml from its remote URL when due.
+
+    The time of the last check and the response's ETag and Last-Modified
+    headers are kept in a sidecar file (see metadata_status_path). If the
+    policy says the cached copy is still fresh, no request is made;
+    otherwise the request is conditional (If-None-Match / If-Modified-Since),
+    so unchanged metadata costs a 304 rather than a full download. A 404 is
+    recorded too, like Maven's lastUpdated files: a repository without the
+    metadata is not asked again until the policy says so.
+
+    Args:
+        url: URL of the remote maven-metadata.xml
+        metadata_file: Local cache file (e.g. maven-metadata-central.xml)
+        policy: Update policy for the repository
+        timeout: HTTP timeout in seconds
+        force: If True, check the remote even if the policy says it is fresh
+        transport: Transport to send the request with (default: requests)
+
+    Returns:
+        True if metadata_file holds current metadata from this repository
+        (fresh, unchanged, or newly downloaded); False if the remote has none
+        or could not be reached.
+    """
+    import requests
+
+    from ._transport import RequestsTransport
+
+    status = _read_status(metadata_file)
+    if not force and not policy.is_due(status.get("checked")):
+        if status.get("missing"):
+            _log.debug(f"No metadata at {url} (cached 404)")
+            return False
+        if metadata_file.exists():
+            _log.debug(f"Cached metadata is fresh: {metadata_file}")
+            return True
+    if not metadata_file.exists():
+        # Validators of a file that is gone (or was never there) are moot
+        status = {}
+
+    headers = {}
+    if status.get("etag"):
+        headers["If-None-Match"] = status["etag"]
+    if status.get("last_modified"):
+        headers["If-Modified-Since"] = status["last_modified"]
+
+    try:
+        transport = transport or RequestsTransport()
+        response = transport.get(url, headers=headers, timeout=timeout)
+    except requests.RequestException as e:
+        _log.debug(f"Failed to fetch {url}: {e}")
+        return False
+
+    if response.status_code == 304:
+        _log.debug(f"Metadata unchanged: {url}")
+        status["checked"] = time.time()
+        _write_status(metadata_file, status)
+        return True
+
+    if response.status_code == 404:
+        _log.debug(f"No metadata at {url}")
+        _write_status(metadata_file, {"checked": time.time(), "missing": True})
+        return False
+
+    if response.status_code != 200:
+        _log.debug(f"No metadata at {url} (HTTP {response.status_code})")
+        return False
+
+    # Readers (e.g. other processes resolving versions) never see a partial file
+    write_atomic(metadata_file, response.content)
+    _write_status(
+        metadata_file,
+        {
+            "checked": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        },
+    )
+    return True
@@ -4,6 +4,7 @@ Maven dependency model and resolution.
 
 from __future__ import annotations
 
+import copy
 import logging
 import os
 from dataclasses import dataclass, field
@@ -20,6 +21,7 @@ from ._core import Dependency, DependencyNode, MavenContext, Project
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from ._core import Component
     from ._pom import POM
 
 _log = logging.getLogger(__name__)
@@ -27,6 +29,25 @@ _log = logging.getLogger(__name__)
 # (groupId, artifactId, classifier, type)
 GACT = tuple[str, str, str, str]
 
+# ProfileConstraints fields injected as properties (see Model.__init__)
+_INJECTED_FIELDS = {
+    "os.name": "os_name",
+    "os.family": "os_family",
+    "os.arch": "os_arch",
+    "os.version": "os_version",
+    "basedir": "basedir",
+}
+
+# ProfileConstraints fields matched by <activation><os> conditions
+_OS_FIELDS = {
+    "name": "os_name",
+    "family": "os_family",
+    "arch": "os_arch",
+    "version": "os_version",
+}
+
+_PROPERTY_FIELD = "properties:"
+
 
 @dataclass
 class ProfileConstraints:
@@ -42,6 +63,26 @@ class ProfileConstraints:
     basedir: str = "."
     lenient: bool = False
 
+    def field_value(self, name: str) -> object:
+        """
+        Get the value of a field, as named in Model.platform_fields.
+
+        Args:
+            name: Field name, or "properties:<key>" for one of the properties
+
+        Returns:
+            The value, or None for an absent property
+        """
+        if name.startswith(_PROPERTY_FIELD):
+            return self.properties.get(name[len(_PROPERTY_FIELD) :])
+        return getattr(self, name)
+
+
+def _field_value(constraints: ProfileConstraints | None, name: str) -> object:
+    if constraints is None:
+        return None
+    return constraints.field_value(name)
+
 
 class Model:
     """
@@ -54,6 +95,7 @@ class Model:
         context: MavenContext,
         root_dep_mgmt: dict[GACT, Dependency] | None = None,
         profile_constraints: ProfileConstraints | None = None,
+        models: ModelCache | None = None,
     ):
         """
         Build a Maven metadata model from the given POM.
@@ -65,12 +107,26 @@ class Model:
                 This takes precedence over the local dependency management and is used
                 to ensure consistent versions across all transitive dependencies.
             profile_constraints: Optional constraints for profile activation.
+            models: Optional cache of models to reuse for imported BOMs and,
+                in dependencies(), for the models of dependencies.
         """
 
         self.pom = pom
         self.context = context
         self.root_dep_mgmt = root_dep_mgmt
         self.profile_constraints = profile_constraints
+        self.models = models
+
+        # ProfileConstraints fields (see ProfileConstraints.field_value) that
+        # can change this model's dependencies and dependency management.
+        # Under constraints agreeing on all of them, the model is the same.
+        self.platform_fields: set[str] = {"lenient"}
+        # Property values as merged, before interpolation
+        self._raw_props: dict[str, str] = {}
+        # Fields deciding whether profiles setting a property are active
+        self._prop_fields: dict[str, set[str]] = {}
+        # Properties that only the profile constraints define
+        self._injected: set[str] = set()
         self.gav = f"{pom.groupId}:{pom.artifactId}:{pom.version}"
         _log.debug(f"{self.gav}: begin model initialization")
 
@@ -125,6 +181,7 @@ class Model:
                 if k not in os_props:
                     os_props[k] = v
             # Merge with lowest priority (don't override existing props)
+            self._injected = {k for k in os_props if k not in self.props}
             self._merge_props(os_props)
 
         # Replace ${...} expressions in property values.
@@ -353,9 +410,11 @@ class Model:
                         continue
 
                     # Skip dependencies with uninterpolated properties in lenient mode
+                    # NB: Models from self.models may have been built under other
+                    # (equivalent) constraints; ours are the ones that apply.
                     lenient = (
-                        model.profile_constraints.lenient
-                        if model.profile_constraints
+                        self.profile_constraints.lenient
+                        if self.profile_constraints
                         else False
                     )
                     if lenient and Model._has_uninterpolated_properties(dep):
@@ -364,6 +423,11 @@ class Model:
                         )
                         continue
 
+                    if self.models is not None:
+                        # Shared models are traversed once per platform; leave
+                        # their dependencies as they are for the next traversal
+                        dep = copy.copy(dep)
+
                     # Record this dependency
                     resolved[gact] = dep
                     all_deps[gact] = dep
@@ -407,11 +471,8 @@ class Model:
                     # Queue this dependency's model for next depth level
                     if max_depth is None or current_depth < max_depth:
                         try:
-                            dep_model = Model(
-                                dep.artifact.component.pom(),
-                                model.context,
-                                root_dep_mgmt,
-                                model.profile_constraints,
+                            dep_model = self._dependency_model(
+                                dep.artifact.component, root_dep_mgmt
                             )
                             # Accumulate exclusions: combine ancestor exclusions with this dep's exclusions
                             new_exclusions = accumulated_exclusions + dep.exclusions
@@ -428,6 +489,18 @@ class Model:
 
         return list(all_deps.values()), tree_root
 
+    def _dependency_model(
+        self,
+        component: Component,
+        root_dep_mgmt: dict[GACT, Dependency] | None,
+    ) -> Model:
+        """Build (or reuse from self.models) the model of a dependency."""
+        if self.models is not None:
+            return self.models.model(component, root_dep_mgmt, self.profile_constraints)
+        return Model(
+            component.pom(), self.context, root_dep_mgmt, self.profile_constraints
+        )
+
     def _import_boms(self, candidates: dict[GACT, Dependency]) -> None:
         """
         Scan the candidates for dependencies of type pom with scope import.
@@ -454,14 +527,21 @@ class Model:
             bom_gav = f"{dep.groupId}:{dep.artifactId}:{dep.version}"
             _log.debug(f"{self.gav}: importing BOM {bom_gav}")
 
-            # Load the POM to import.
+            # Load the POM to import, and fully build the BOM's model,
+            # agnostic of this one.
             bom_project = self.context.project(dep.groupId, dep.artifactId)
-            bom_pom = bom_project.at_version(dep.version).pom()
-
-            # Fully build the BOM's model, agnostic of this one.
-            bom_model = Model(
-                bom_pom, self.context, profile_constraints=self.profile_constraints
-            )
+            bom_component = bom_project.at_version(dep.version)
+            if self.models is not None:
+                bom_model = self.models.model(
+                    bom_component, None, self.profile_constraints
+                )
+            else:
+                bom_model = Model(
+                    bom_component.pom(),
+                    self.context,
+                    profile_constraints=self.profile_constraints,
+                )
+            self.platform_fields |= bom_model.platform_fields
 
             # Count how many managed deps we're importing
             before_count = len(self.dep_mgmt)
@@ -483,18 +563,10 @@ class Model:
         target = self.dep_mgmt if managed else self.deps
         for dep in source:
             # Interpolate coordinates early using available properties
-            g = Model._evaluate(dep.groupId, self.props) if dep.groupId else dep.groupId
-            a = (
-                Model._evaluate(dep.artifactId, self.props)
-                if dep.artifactId
-                else dep.artifactId
-            )
-            c = (
-                Model._evaluate(dep.classifier, self.props)
-                if dep.classifier
-                else dep.classifier
-            )
-            t = Model._evaluate(dep.type, self.props) if dep.type else dep.type
+            g = self._interpolate(dep.groupId) if dep.groupId else dep.groupId
+            a = self._interpolate(dep.artifactId) if dep.artifactId else dep.artifactId
+            c = self._interpolate(dep.classifier) if dep.classifier else dep.classifier
+            t = self._interpolate(dep.type) if dep.type else dep.type
 
             # Update dep coordinates if interpolation changed them
             if g != dep.groupId:
@@ -514,6 +586,40 @@ class Model:
         for k, v in source.items():
             if v is not None and k not in self.props:
                 self.props[k] = v
+                self._raw_props[k] = v
+
+    def _interpolate(self, expression: str) -> str:
+        """
+        Evaluate ${...} expressions in a dependency coordinate, recording in
+        platform_fields the profile constraints its value depends on.
+        """
+        self.platform_fields |= self._reference_fields(expression)
+        return Model._evaluate(expression, self.props)
+
+    def _reference_fields(
+        self, expression: str, seen: set[str] | None = None
+    ) -> set[str]:
+        """
+        Find the ProfileConstraints fields an expression's value depends on.
+
+        A property defined (so far) only by the constraints, or by none at all,
+        depends on the corresponding field; one defined by the POMs depends
+        on the properties it refers to, and on the activation of the profiles
+        defining it.
+        """
+        if seen is None:
+            seen = set()
+        fields: set[str] = set()
+        for name in findall(r"\${([^}]*)}", expression):
+            if name in seen:
+                continue
+            seen.add(name)
+            fields |= self._prop_fields.get(name, set())
+            if name in self._injected or name not in self._raw_props:
+                fields.add(_INJECTED_FIELDS.get(name, _PROPERTY_FIELD + name))
+            else:
+                fields |= self._reference_fields(self._raw_props[name], seen)
+        return fields
 
     def _merge(self, pom: POM) -> None:
         """
@@ -545,11 +651,11 @@ class Model:
         Activate and inject profiles from the given POM.
         """
         # Compute active profiles.
-        active_profiles = [
-            profile
-            for profile in pom.elements("profiles/profile")
-            if self._is_active_profile(profile)
-        ]
+        active_profiles = []
+        for profile in pom.elements("profiles/profile"):
+            if self._is_active_profile(profile):
+                active_profiles.append(profile)
+            self._record_activation_fields(profile)
 
         # Merge values from the active profiles into the model.
         for profile in active_profiles:
@@ -573,6 +679,40 @@ class Model:
             }
             self._merge_props(profile_props)
 
+    def _record_activation_fields(self, profile) -> None:
+        """
+        Record which profile constraints can activate the given profile,
+        whether it is active under the current ones or not: the dependencies
+        it adds depend on them, and so do the properties it sets.
+        """
+        fields: set[str] = set()
+        activation = profile.find("activation")
+        for condition in activation if activation is not None else ():
+            if condition.tag == "jdk":
+                fields.add("jdk")
+            elif condition.tag == "os":
+                fields.update(
+                    _OS_FIELDS[c.tag] for c in condition if c.tag in _OS_FIELDS
+                )
+            elif condition.tag == "property":
+                name = condition.findtext("name")
+                if name:
+                    fields.add(_PROPERTY_FIELD + name)
+            elif condition.tag == "file":
+                fields.add("file_exists")
+                for tag in ("exists", "missing"):
+                    path = condition.findtext(tag)
+                    if path:
+                        fields |= self._reference_fields(path)
+        if not fields:
+            return
+        if profile.find("dependencies") is not None or (
+            profile.find("dependencyManagement") is not None
+        ):
+            self.platform_fields |= fields
+        for el in profile.findall("properties/*"):
+            self._prop_fields.setdefault(el.tag, set()).update(fields)
+
     def _interpolate_deps(self, deps: dict[GACT, Dependency]) -> dict[GACT, Dependency]:
         """
         Interpolate ${...} expressions in dependency coordinates.
@@ -584,19 +724,11 @@ class Model:
         new_deps = {}
         for old_gact, dep in deps.items():
             # Interpolate each coordinate field
-            g = Model._evaluate(dep.groupId, self.props) if dep.groupId else dep.groupId
-            a = (
-                Model._evaluate(dep.artifactId, self.props)
-                if dep.artifactId
-                else dep.artifactId
-            )
-            c = (
-                Model._evaluate(dep.classifier, self.props)
-                if dep.classifier
-                else dep.classifier
-            )
-            t = Model._evaluate(dep.type, self.props) if dep.type else dep.type
-            v = Model._evaluate(dep.version, self.props) if dep.version else dep.version
+            g = self._interpolate(dep.groupId) if dep.groupId else dep.groupId
+            a = self._interpolate(dep.artifactId) if dep.artifactId else dep.artifactId
+            c = self._interpolate(dep.classifier) if dep.classifier else dep.classifier
+            t = self._interpolate(dep.type) if dep.type else dep.type
+            v = self._interpolate(dep.version) if dep.version else dep.version
 
             # Mutate the underlying artifact/component to match interpolated values
             # (This is what set_version() does for the version field)
@@ -843,3 +975,84 @@ class Model:
         evaluated = Model._evaluate(expression, props, visited)
         props[propname] = evaluated
         return evaluated
+
+
+class ModelCache:
+    """
+    Models shared between resolutions under different ProfileConstraints.
+
+    Each Model records in platform_fields which constraint fields can change
+    its dependencies. A model built under one set of constraints is reused
+    under any other set agreeing on those fields, so that resolving for
+    several platforms builds the platform-independent models (typically most
+    of them) once, and only the platform-dependent ones once per platform.
+    """
+
+    def __init__(self):
+        # (G, A, V, root dependency management) -> models built for it
+        self._models: dict[tuple, list[Model]] = {}
+        self._fingerprints: dict[int, tuple[dict, frozenset]] = {}
+        self.built = 0
+        self.reused = 0
+
+    def model(
+        self,
+        component: Component,
+        root_dep_mgmt: dict[GACT, Dependency] | None,
+        profile_constraints: ProfileConstraints | None,
+    ) -> Model:
+        """
+        Get the model of a component, building it if no cached one applies.
+
+        Args:
+            component: Component whose POM to build the model from
+            root_dep_mgmt: Dependency management from the root project
+            profile_constraints: Constraints the model must be valid for
+
+        Returns:
+            A model equivalent to one built under profile_constraints
+        """
+        key = (
+            component.groupId,
+            component.artifactId,
+            component.version,
+            self._fingerprint(root_dep_mgmt),
+        )
+        candidates = self._models.setdefault(key, [])
+        for model in candidates:
+            if all(
+                _field_value(model.profile_constraints, name)
+                == _field_value(profile_constraints, name)
+                for name in model.platform_fields
+            ):
+                self.reused += 1
+                return model
+        model = Model(
+            component.pom(),
+            component.context,
+            root_dep_mgmt,
+            profile_constraints,
+            models=self,
+        )
+        self.built += 1
+        candidates.append(model)
+        return model
+
+    def _fingerprint(self, dep_mgmt: dict[GACT, Dependency] | None) -> frozenset:
+        """Summarize dependency management by value, to compare roots."""
+        if not dep_mgmt:
+            return frozenset()
+        cached = self._fingerprints.get(id(dep_mgmt))
+        if cached is not None and cached[0] is dep_mgmt:
+            return cached[1]
+        fingerprint = frozenset(
+            (
+                gact,
+                dep.version,
+                dep.scope,
+                tuple((e.groupId, e.artifactId) for e in dep.exclusions),
+            )
+            for gact, dep in dep_mgmt.items()
+        )
+        self._fingerprints[id(dep_mgmt)] = (dep_mgmt, fingerprint)
+        return fingerprint
@@ -0,0 +1,359 @@
+"""
+Bookkeeping about remote Maven repositories.
+
+* Negative lookup cache: which repositories recently answered "not found"
+  for a file, in the spirit of Maven's *.lastUpdated files, so that cold
+  builds do not ask them again until the repository's update policy says so.
+* Routes: which repositories to ask first for a groupId, from configured
+  rules (e.g. "org.scijava.* -> scijava") and from which repository last
+  served each groupId.
+* Floating versions: what RELEASE and LATEST recently resolved to, so that
+  warm runs of e.g. "g:a" need not read any maven-metadata.xml.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ..util.io import read_json, write_json
+from ..util.locks import file_lock
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from ._metadata import UpdatePolicy
+
+_log = logging.getLogger(__name__)
+
+MISSES_SUFFIX = ".misses.json"
+ROUTES_FILE = ".jgo-routes.json"
+FLOATING_FILE = ".jgo-floating.json"
+
+
+def _merge_json(path: Path, updates: dict) -> dict:
+    """
+    Add entries to the JSON object at path, and return the merged object.
+
+    The read-merge-write is done under a file lock, so that processes
+    sharing the file do not lose each other's entries; entries already on
+    disk are kept unless updates replaces them.
+
+    Raises:
+        OSError: If the file cannot be locked or written
+    """
+    with file_lock(path.with_name(path.name + ".lock")):
+        data = read_json(path)
+        data.update(updates)
+        write_json(path, data)
+    return data
+
+
+# -- Negative lookup cache --
+
+
+def misses_path(cached_file: Path) -> Path:
+    """
+    Get the sidecar file recording repository misses for a cached file.
+
+    E.g. foo-1.0.jar -> foo-1.0.jar.misses.json
+    """
+    return cached_file.with_name(cached_file.name + MISSES_SUFFIX)
+
+
+def read_misses(cached_file: Path) -> dict[str, float]:
+    """
+    Get the recorded misses for a file that is not in the local cache yet.
+
+    Args:
+        cached_file: Where the file would live in the local repository cache
+
+    Returns:
+        Dict of repository URL -> epoch seconds of the last "not found" answer
+    """
+    return {
+        url: when
+        for url, when in read_json(misses_path(cached_file)).items()
+        if isinstance(when, (int, float))
+    }
+
+
+def record_misses(
+    cached_file: Path, repo_urls: Iterable[str], now: float | None = None
+) -> None:
+    """
+    Remember that repositories do not have a file.
+
+    Args:
+        cached_file: Where the file would live in the local repository cache
+        repo_urls: Base URLs of the repositories that answered "not found"
+        now: Time of the answers (defaults to time.time())
+    """
+    repo_urls = list(repo_urls)
+    if not repo_urls:
+        return
+    if now is None:
+        now = time.time()
+    misses = read_misses(cached_file)
+    misses.update({url: now for url in repo_urls})
+    try:
+        write_json(misses_path(cached_file), misses)
+    except OSError as e:
+        _log.debug(f"Could not record misses for {cached_file}: {e}")
+
+
+def clear_misses(cached_file: Path) -> None:
+    """Forget recorded misses for a file, e.g. once it has been downloaded."""
+    misses_path(cached_file).unlink(missing_ok=True)
+
+
+# -- Routes --
+
+
+def group_pattern_matches(pattern: str, groupId: str) -> bool:
+    """
+    Check whether a routing pattern applies to a groupId.
+
+    Patterns are an exact groupId ("org.scijava"), a groupId prefix
+    ("org.scijava.*", which also matches "org.scijava" itself), or "*".
+
+    Args:
+        pattern: Routing pattern
+        groupId: The groupId being looked up
+
+    Returns:
+        True if the pattern matches
+    """
+    if pattern == "*":
+        return True
+    if pattern.endswith(".*"):
+        base = pattern[:-2]
+        return groupId == base or groupId.startswith(base + ".")
+    return groupId == pattern
+
+
+def _specificity(pattern: str) -> tuple[int, bool]:
+    """Sort key ranking more specific patterns higher."""
+    if pattern == "*":
+        return (-1, False)
+    if pattern.endswith(".*"):
+        return (len(pattern) - 2, False)
+    return (len(pattern), True)
+
+
+class RouteTable:
+    """
+    groupId -> repository routes, configured and learned.
+
+    Configured rules map groupId patterns to repository names; the most
+    specific matching rule wins. Learned routes record which repository
+    last served each groupId; they are stored as JSON in the local
+    repository cache and shared by all threads using the same MavenContext.
+
+    Routes only change the order in which repositories are asked; a lookup
+    still falls back to every other repository.
+    """
+
+    def __init__(self, path: Path, rules: dict[str, str | list[str]] | None = None):
+        """
+        Create a route table backed by a JSON file.
+
+        Args:
+            path: File the learned routes are stored in
+            rules: Configured routes, groupId pattern -> repository name(s).
+                A string may list several comma-separated repository names.
+        """
+        self.path = path
+        self.rules: dict[str, list[str]] = {}
+        for pattern, repos in (rules or {}).items():
+            if isinstance(repos, str):
+                repos = repos.split(",")
+            self.rules[pattern.strip()] = [r.strip() for r in repos if r.strip()]
+        self._lock = threading.Lock()
+        self._learned: dict[str, str] | None = None
+
+    def configured(self, groupId: str) -> list[str]:
+        """
+        Get the repositories named by the best configured rule for a groupId.
+
+        Args:
+            groupId: The groupId being looked up
+
+        Returns:
+            Repository names, or an empty list if no rule matches
+        """
+        matching = [p for p in self.rules if group_pattern_matches(p, groupId)]
+        if not matching:
+            return []
+        return self.rules[max(matching, key=_specificity)]
+
+    @property
+    def learned(self) -> dict[str, str]:
+        """Learned groupId -> repository name routes."""
+        with self._lock:
+            if self._learned is None:
+                self._learned = {
+                    g: r for g, r in read_json(self.path).items() if isinstance(r, str)
+                }
+            return self._learned
+
+    def lookup(self, groupId: str) -> str | None:
+        """
+        Get the repository that last served a groupId.
+
+        Args:
+            groupId: The groupId to look up
+
+        Returns:
+            Repository name, or None if no route is known
+        """
+        return self.learned.get(groupId)
+
+    def learn(self, groupId: str, repo_name: str) -> None:
+        """
+        Remember that a repository served an artifact of a groupId.
+
+        Args:
+            groupId: The groupId of the served artifact
+            repo_name: Name of the repository that served it
+        """
+        if self.learned.get(groupId) == repo_name:
+            return
+        with self._lock:
+            assert self._learned is not None
+            self._learned[groupId] = repo_name
+            try:
+                # Also picks up routes learned by other processes meanwhile
+                merged = _merge_json(self.path, {groupId: repo_name})
+            except OSError as e:
+                _log.debug(f"Could not save repository routes to {self.path}: {e}")
+                return
+            self._learned = {g: r for g, r in merged.items() if isinstance(r, str)}
+
+    def order(self, groupId: str, repo_names: Iterable[str]) -> list[str]:
+        """
+        Order repositories for a lookup, routed repositories first.
+
+        Args:
+            groupId: The groupId being looked up
+            repo_names: Repository names in configured priority order
+
+        Returns:
+            The same names: those of the matching configured rule first, then
+            the learned route, then the rest in their original order
+        """
+        names = list(repo_names)
+        routed = [*self.configured(groupId), self.lookup(groupId)]
+        first = list(dict.fromkeys(r for r in routed if r in names))
+        return first + [n for n in names if n not in first]
+
+
+# -- Floating versions --
+
+
+class FloatingVersionIndex:
+    """
+    Recent resolutions of RELEASE and LATEST versions.
+
+    Each entry maps G:A:RELEASE or G:A:LATEST to the version it resolved to
+    and when, for a given set of repositories. Entries are reused until the
+    index's update policy says they are due, like cached maven-metadata.xml;
+    they are stored as JSON in the local repository cache.
+    """
+
+    def __init__(self, path: Path, policy: UpdatePolicy):
+        """
+        Create a floating version index backed by a JSON file.
+
+        Args:
+            path: File the index is stored in
+            policy: When a resolution is due to be redone
+        """
+        self.path = path
+        self.policy = policy
+        self._lock = threading.Lock()
+        self._entries: dict | None = None
+
+    @staticmethod
+    def _key(groupId: str, artifactId: str, version: str) -> str:
+        return f"{groupId}:{artifactId}:{version}"
+
+    def lookup(
+        self,
+        groupId: str,
+        artifactId: str,
+        version: str,
+        repos: Iterable[str],
+        now: float | None = None,
+    ) -> str | None:
+        """
+        Get a recent resolution of a floating version.
+
+        Args:
+            groupId, artifactId: Coordinates of the project
+            version: RELEASE or LATEST
+            repos: Repositories the version would be resolved against
+            now: Current epoch seconds (defaults to time.time())
+
+        Returns:
+            The resolved version, or None if unknown, for other repositories,
+            or due to be resolved again
+        """
+        if self.policy.spec == "always":
+            return None
+        with self._lock:
+            if self._entries is None:
+                self._entries = read_json(self.path)
+            entry = self._entries.get(self._key(groupId, artifactId, version))
+        if not isinstance(entry, dict) or entry.get("repos") != sorted(repos):
+            return None
+        resolved, when = entry.get("version"), entry.get("resolved_at")
+        if not isinstance(resolved, str) or not isinstance(when, (int, float)):
+            return None
+        if self.policy.is_due(when, now):
+            return None
+        return resolved
+
+    def record(
+        self,
+        groupId: str,
+        artifactId: str,
+        version: str,
+        repos: Iterable[str],
+        resolved: str,
+        now: float | None = None,
+    ) -> None:
+        """
+        Remember what a floating version resolved to.
+
+        With the "always" policy, the index is never consulted, so nothing is
+        written, except to refresh an entry left by another policy (e.g. by
+        runs before an --update), which would otherwise go stale.
+
+        Args:
+            groupId, artifactId: Coordinates of the project
+            version: RELEASE or LATEST
+            repos: Repositories the version was resolved against
+            resolved: The version it resolved to
+            now: Time of the resolution (defaults to time.time())
+        """
+        entry = {
+            "version": resolved,
+            "resolved_at": time.time() if now is None else now,
+            "repos": sorted(repos),
+        }
+        key = self._key(groupId, artifactId, version)
+        with self._lock:
+            if self._entries is None:
+                self._entries = read_json(self.path)
+            if self.policy.spec == "always" and key not in self._entries:
+                return
+            self._entries[key] = entry
+            try:
+                # Also picks up resolutions recorded by other processes meanwhile
+                self._entries = _merge_json(self.path, {key: entry})
+            except OSError as e:
+                _log.debug(f"Could not save floating versions to {self.path}: {e}")
@@ -6,6 +6,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import tempfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from functools import partial
+from pathlib import Path
 from subprocess import run
 from typing import TYPE_CHECKING
 
@@ -14,15 +20,24 @@ import requests
 from ..parse import Coordinate
 from . import Resolver
 from ._core import Dependency, DependencyNode, create_pom
-from ._model import Model, ProfileConstraints
+from ._model import Model, ModelCache, ProfileConstraints
 from ._pom import write_temp_pom
+from ._remote import clear_misses, read_misses, record_misses
+from ._scheduler import (
+    DEFAULT_MAX_DOWNLOADS,
+    LARGE_FILE_SIZE,
+    DownloadScheduler,
+    RateLimiter,
+    batch_progress,
+)
+from ._transport import RequestsTransport
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
     from contextlib import AbstractContextManager
-    from pathlib import Path
 
-    from ._core import Artifact, Component
+    from ._core import Artifact, Component, MavenContext
+    from ._transport import Transport
 
     # Type for progress callback:
     # Receives (filename, total_size) and returns a context manager
@@ -34,6 +49,15 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Seconds to wait for a repository before also asking the next one
+DEFAULT_HEDGE_DELAY = 0.25
+
+# Suffix of interrupted downloads kept in the local repository cache
+PART_SUFFIX = ".part"
+
+# How many times a download is attempted when its connection breaks
+DOWNLOAD_ATTEMPTS = 3
+
 
 def _build_dependency_list(
     input_deps: list[Dependency], resolved_transitive: list[Dependency]
@@ -155,23 +179,31 @@ def _resolve_component_inputs(
 
 
 def _verify_remote_sha1(
-    artifact_url: str, actual_sha1: str, filename: str, timeout: int
-) -> None:
+    artifact_url: str,
+    actual_sha1: str,
+    filename: str,
+    timeout: int,
+    transport: Transport | None = None,
+) -> bool:
     """
     Verify a downloaded artifact against the remote SHA1 checksum file.
 
     Silently skips if the checksum file is unavailable (many repos don't publish them).
     Warns if the checksum is present but does not match.
+
+    Returns:
+        False if the checksum is present but does not match, True otherwise
     """
     try:
-        response = requests.get(f"{artifact_url}.sha1", timeout=timeout)
+        transport = transport or RequestsTransport()
+        response = transport.get(f"{artifact_url}.sha1", timeout=timeout)
     except requests.RequestException as e:
         _log.debug(f"Could not fetch checksum for {filename}: {e}")
-        return
+        return True
 
     if response.status_code != 200:
         _log.debug(f"No remote checksum for {filename} (HTTP {response.status_code})")
-        return
+        return True
 
     # SHA1 files are either bare hex or "hex  filename"
     expected_sha1 = response.text.strip().split()[0]
@@ -180,8 +212,143 @@ def _verify_remote_sha1(
             f"Checksum mismatch for {filename}: "
             f"expected {expected_sha1}, got {actual_sha1}"
         )
-    else:
-        _log.debug(f"Checksum verified: {filename}")
+        return False
+    _log.debug(f"Checksum verified: {filename}")
+    return True
+
+
+def partial_path(cached_file: Path) -> Path:
+    """
+    Get where an interrupted download of a cached file is kept for resuming.
+
+    E.g. foo-1.0.jar -> foo-1.0.jar.part
+    """
+    return cached_file.with_name(cached_file.name + PART_SUFFIX)
+
+
+def _claim_partial(cached_file: Path) -> Path:
+    """
+    Create a private temporary file to download a cached file into.
+
+    If an earlier download was interrupted, its partial file is moved into
+    the temporary file so that the download can resume. The move is atomic,
+    so of several processes downloading the same file at most one resumes it.
+    """
+    fd, name = tempfile.mkstemp(
+        dir=cached_file.parent, prefix=f".{cached_file.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    temp = Path(name)
+    try:
+        os.replace(partial_path(cached_file), temp)
+        _log.debug(f"Resuming download of {cached_file.name}")
+    except FileNotFoundError:
+        pass
+    return temp
+
+
+def _release_partial(temp: Path, cached_file: Path) -> None:
+    """Keep what an unfinished download received, for a later attempt to resume."""
+    try:
+        if temp.stat().st_size > 0:
+            os.replace(temp, partial_path(cached_file))
+        else:
+            temp.unlink()
+    except OSError as e:
+        _log.debug(f"Could not keep partial download of {cached_file.name}: {e}")
+
+
+def _ignore_progress(count: int) -> None:
+    """Progress update function for downloads that report no progress."""
+
+
+def _range_headers(offset: int) -> dict[str, str] | None:
+    """HTTP headers requesting the rest of a file from offset on."""
+    return {"Range": f"bytes={offset}-"} if offset else None
+
+
+def _content_range_start(response: requests.Response) -> int | None:
+    """Get the first byte position of a 206 response, e.g. "bytes 100-199/200"."""
+    content_range = response.headers.get("content-range", "")
+    try:
+        return int(content_range.split()[1].split("-")[0])
+    except (IndexError, ValueError):
+        return None
+
+
+def _close_response(future) -> None:
+    """Release the connection of a response nobody is going to read."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+def _first_available(
+    urls: list[str],
+    timeout: float,
+    hedge_delay: float,
+    headers: dict[str, str] | None = None,
+    transport: Transport | None = None,
+) -> tuple[tuple[str, requests.Response] | None, list[str]]:
+    """
+    Find the first URL that serves a file, asking repositories in priority order.
+
+    Requests are hedged: the next URL is requested as soon as the previous
+    one misses, or once it has not answered within hedge_delay seconds.
+    A slow repository then costs at most hedge_delay, and a run of misses
+    costs their latencies rather than the full timeout of each.
+    The first 200 (or 206) response wins; its body has not been read yet
+    (stream=True).
+
+    Args:
+        urls: Candidate URLs, highest priority first
+        timeout: HTTP timeout for each request
+        hedge_delay: Seconds to wait before hedging to the next URL
+        headers: Extra HTTP headers to send, e.g. a Range header
+        transport: Transport to send the requests with (default: requests)
+
+    Returns:
+        Tuple of (winner, missed) where winner is (url, response), or None if
+        no URL has the file, and missed lists the URLs that answered 404
+    """
+    transport = transport or RequestsTransport()
+    pool = ThreadPoolExecutor(max_workers=len(urls))
+    pending: dict = {}
+    winner = None
+    missed: list[str] = []
+    try:
+        remaining = list(urls)
+        while winner is None and (remaining or pending):
+            if remaining:
+                url = remaining.pop(0)
+                _log.debug(f"Trying {url}")
+                future = pool.submit(
+                    transport.get, url, stream=True, timeout=timeout, headers=headers
+                )
+                pending[future] = url
+            done, _ = wait(
+                pending,
+                timeout=hedge_delay if remaining else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                url = pending.pop(future)
+                try:
+                    response = future.result()
+                except requests.RequestException as e:
+                    _log.debug(f"Failed to fetch {url}: {e}")
+                    continue
+                if response.status_code in (200, 206) and winner is None:
+                    winner = url, response
+                else:
+                    if response.status_code == 404:
+                        missed.append(url)
+                    response.close()
+    finally:
+        # Losing requests finish in the background; drop their connections
+        for future in pending:
+            future.add_done_callback(_close_response)
+        pool.shutdown(wait=False)
+    return winner, missed
 
 
 class PythonResolver(Resolver):
@@ -194,6 +361,10 @@ class PythonResolver(Resolver):
         self,
         profile_constraints: ProfileConstraints | None = None,
         progress_callback: ProgressCallback | None = None,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        max_downloads: int = DEFAULT_MAX_DOWNLOADS,
+        rate_limit: float | None = None,
+        large_file_size: int = LARGE_FILE_SIZE,
     ):
         """
         Initialize Python resolver.
@@ -203,9 +374,33 @@ class PythonResolver(Resolver):
             progress_callback: Optional callback for download progress reporting.
                 Receives (filename, total_size) and returns a context manager
                 that yields an update function accepting bytes_count.
+            hedge_delay: Seconds to wait for a remote repository to answer an
+                artifact request before also asking the next repository.
+            max_downloads: Maximum number of concurrent downloads in prefetch().
+            rate_limit: Optional cap on the combined download rate of this
+                resolver, in bytes per second.
+            large_file_size: Size in bytes from which prefetch() counts a file
+                as large (see DownloadScheduler).
         """
         self.profile_constraints = profile_constraints
         self.progress_callback = progress_callback
+        self.hedge_delay = hedge_delay
+        self.max_downloads = max_downloads
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.large_file_size = large_file_size
+
+    def prefetch(self, artifacts: Iterable[Artifact]) -> list[Path]:
+        """
+        Download artifacts concurrently, ordered by size (see DownloadScheduler).
+
+        Progress is reported for the batch as a whole rather than per file.
+        """
+        scheduler = DownloadScheduler(
+            max_workers=self.max_downloads,
+            progress_callback=self.progress_callback,
+            large_file_size=self.large_file_size,
+        )
+        return scheduler.fetch(artifacts)
 
     def download(self, artifact: Artifact) -> Path | None:
         # For SNAPSHOT versions, ensure we have the metadata first
@@ -224,59 +419,219 @@ class PythonResolver(Resolver):
                     "Attempting download with SNAPSHOT version..."
                 )
 
-        for remote_repo in artifact.context.remote_repos.values():
-            # Convert Path to forward-slash string for URL
-            path_str = str(artifact.component.path_prefix).replace("\\", "/")
-            url = f"{remote_repo}/{path_str}/{artifact.filename}"
-            _log.debug(f"Trying {url}")
+        cached_file = artifact.cached_path
+        assert cached_file is not None
+
+        # Convert Path to forward-slash string for URL
+        path_str = str(artifact.component.path_prefix).replace("\\", "/")
+
+        # Skip repositories that recently answered "not found" for this file,
+        # until their update policy says to ask again
+        context = artifact.context
+        misses = read_misses(cached_file)
+        candidates = {
+            f"{repo_url}/{path_str}/{artifact.filename}": (name, repo_url)
+            for name, repo_url in context.ordered_repos(artifact.groupId)
+            if repo_url not in misses
+            or context.update_policy_for(name).is_due(misses[repo_url])
+        }
+        if not candidates:
+            hint = " (cached; use --update to check again)" if misses else ""
+            raise RuntimeError(
+                f"Artifact {artifact} not found in remote repositories "
+                f"{context.remote_repos}{hint}"
+            )
 
-            # Use streaming to enable progress bar
-            response: requests.Response = requests.get(
-                url, stream=True, timeout=artifact.context.timeout
+        if cached_file.exists():
+            # Another process finished downloading it meanwhile
+            return cached_file
+        cached_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Download into a private temporary file, resuming an interrupted
+        # download if there is one, and move it into place once complete.
+        # Readers of the cache thus never see a partial file.
+        temp = _claim_partial(cached_file)
+        try:
+            urls = list(candidates)
+            offset = temp.stat().st_size
+            found, missed = _first_available(
+                urls,
+                context.timeout,
+                self.hedge_delay,
+                _range_headers(offset),
+                context.transport,
             )
-            if response.status_code == 200:
-                # Remote artifact accessed successfully
-                cached_file = artifact.cached_path
-                assert cached_file is not None
-                assert not cached_file.exists()
-                cached_file.parent.mkdir(parents=True, exist_ok=True)
-
-                # Get total size from Content-Length header
-                total_size = int(response.headers.get("content-length", 0))
-
-                # Hash while streaming to avoid re-reading the file for checksum verification
-                sha1 = hashlib.sha1()
-
-                # Use progress callback if provided and size is known
-                if self.progress_callback and total_size > 0:
-                    with self.progress_callback(
-                        artifact.filename, total_size
-                    ) as update_progress:
-                        with open(cached_file, "wb") as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                                sha1.update(chunk)
-                                update_progress(len(chunk))
-                else:
-                    with open(cached_file, "wb") as f:
+            if found is None and offset:
+                # E.g. 416 Range Not Satisfiable for a stale partial file
+                offset = 0
+                temp.write_bytes(b"")
+                urls = [url for url in urls if url not in missed]
+                found, more_missed = _first_available(
+                    urls, context.timeout, self.hedge_delay, None, context.transport
+                )
+                missed += more_missed
+            record_misses(cached_file, [candidates[url][1] for url in missed])
+            if found is None:
+                raise RuntimeError(
+                    f"Artifact {artifact} not found in remote repositories "
+                    f"{artifact.context.remote_repos}"
+                )
+            url, response = found
+            sha1, resumed = self._receive(
+                url, response, temp, offset, artifact.filename, context
+            )
+        except BaseException:
+            _release_partial(temp, cached_file)
+            raise
+
+        try:
+            verify = partial(
+                _verify_remote_sha1,
+                filename=artifact.filename,
+                timeout=context.timeout,
+                transport=context.transport,
+            )
+            verified = verify(url, sha1)
+            if not verified and resumed:
+                # The pieces of a resumed download may not belong together
+                _log.warning(f"Downloading {artifact.filename} again in full")
+                response = context.transport.get(
+                    url, stream=True, timeout=context.timeout
+                )
+                sha1, _ = self._receive(
+                    url, response, temp, 0, artifact.filename, context
+                )
+                verified = verify(url, sha1)
+            if not verified:
+                # Never let a corrupt file into the cache, where it would be
+                # taken for good by every later resolution
+                raise RuntimeError(
+                    f"Checksum mismatch for {artifact.filename} from {url}"
+                )
+            if cached_file.exists():
+                # First writer wins; the other download is identical
+                temp.unlink()
+            else:
+                os.replace(temp, cached_file)
+        except BaseException:
+            temp.unlink(missing_ok=True)
+            raise
+
+        clear_misses(cached_file)
+        context.routes.learn(artifact.groupId, candidates[url][0])
+
+        if is_snapshot:
+            _log.info(f"Downloaded SNAPSHOT {artifact} to {cached_file}")
+        else:
+            _log.debug(f"Downloaded {artifact} to {cached_file}")
+        return cached_file
+
+    def _receive(
+        self,
+        url: str,
+        response: requests.Response,
+        temp: Path,
+        offset: int,
+        filename: str,
+        context: MavenContext,
+    ) -> tuple[str, bool]:
+        """
+        Stream a response body into a file, resuming if the connection breaks.
+
+        Args:
+            url: URL the response came from
+            response: Unread 200 or 206 response
+            temp: File to write into
+            offset: Bytes of the file already in temp
+            filename: File name, for progress reporting and log messages
+            context: The Maven context
+
+        Returns:
+            Tuple of (sha1, resumed): the SHA1 hex digest of the whole file, and
+            whether the file was assembled from more than one response
+        """
+        resumed = offset > 0
+        # Hash while streaming to avoid re-reading the file for checksum verification
+        sha1 = hashlib.sha1()
+        if offset:
+            with open(temp, "rb") as f:
+                for block in iter(lambda: f.read(1 << 16), b""):
+                    sha1.update(block)
+        attempt = 1
+        while True:
+            with response:
+                if response.status_code == 200:
+                    # The server sent the whole file
+                    offset = 0
+                    sha1 = hashlib.sha1()
+                elif (
+                    response.status_code != 206
+                    or _content_range_start(response) != offset
+                ):
+                    raise RuntimeError(
+                        f"Failed to download {url}: HTTP {response.status_code} "
+                        f"{response.headers.get('content-range', '')}".rstrip()
+                    )
+                total_size = offset + int(response.headers.get("content-length", 0))
+                mode = "ab" if offset else "wb"
+                progress = self._progress(filename, total_size)
+                try:
+                    with open(temp, mode) as f, progress as update:
+                        update(offset)
                         for chunk in response.iter_content(chunk_size=8192):
                             f.write(chunk)
                             sha1.update(chunk)
+                            offset += len(chunk)
+                            update(len(chunk))
+                    return sha1.hexdigest(), resumed
+                except requests.RequestException as e:
+                    if attempt == DOWNLOAD_ATTEMPTS:
+                        raise
+                    _log.info(
+                        f"Download of {filename} interrupted after {offset} bytes "
+                        f"({e}); resuming"
+                    )
+            attempt += 1
+            resumed = True
+            response = context.transport.get(
+                url,
+                stream=True,
+                timeout=context.timeout,
+                headers=_range_headers(offset),
+            )
+
+    @contextmanager
+    def _progress(self, filename: str, total_size: int):
+        """
+        Report download progress through progress_callback, if any.
 
-                _verify_remote_sha1(
-                    url, sha1.hexdigest(), artifact.filename, artifact.context.timeout
+        Downloads of a prefetch() batch report to the batch's aggregate
+        progress instead. Reported bytes also count against the rate limit.
+        """
+        batch = batch_progress()
+        with ExitStack() as stack:
+            if batch is not None:
+                update_progress = batch
+            elif self.progress_callback and total_size > 0:
+                update_progress = stack.enter_context(
+                    self.progress_callback(filename, total_size)
                 )
+            else:
+                update_progress = _ignore_progress
+            yield stack.enter_context(self._rate_limited(update_progress))
 
-                if is_snapshot:
-                    _log.info(f"Downloaded SNAPSHOT {artifact} to {cached_file}")
-                else:
-                    _log.debug(f"Downloaded {artifact} to {cached_file}")
-                return cached_file
+    @contextmanager
+    def _rate_limited(self, update_progress: Callable[[int], None]):
+        limiter = self.rate_limiter
+        if limiter is None:
+            yield update_progress
+            return
 
-        raise RuntimeError(
-            f"Artifact {artifact} not found in remote repositories "
-            f"{artifact.context.remote_repos}"
-        )
+        def update(count: int) -> None:
+            limiter.consume(count)
+            update_progress(count)
+
+        yield update
 
     def resolve(
         self,
@@ -299,12 +654,67 @@ class PythonResolver(Resolver):
         """
         if not dependencies:
             raise ValueError("At least one dependency is required")
+        return self._resolve(
+            dependencies, self.profile_constraints, transitive, optional_depth
+        )
+
+    def resolve_platforms(
+        self,
+        dependencies: list[Dependency],
+        platforms: dict[str, ProfileConstraints],
+        transitive: bool = True,
+        optional_depth: int = 0,
+    ) -> dict[str, tuple[list[Dependency], list[Dependency]]]:
+        """
+        Resolve the given input dependencies for several platforms in one pass.
 
+        Each platform is resolved as resolve() would under its constraints,
+        but the models of POMs are shared between platforms wherever profile
+        activation and interpolation come out the same (see ModelCache):
+        only POMs whose dependencies depend on the platform, e.g. natives
+        classifiers such as natives-${os.arch}, are built once per platform.
+
+        Args:
+            dependencies: List of input dependencies
+            platforms: Profile constraints of each platform, by platform name
+            transitive: Whether to include transitive dependencies
+            optional_depth: Maximum depth at which to include optional dependencies
+
+        Returns:
+            (resolved_inputs, resolved_transitive) of each platform, as
+            returned by resolve(), by platform name
+        """
+        if not dependencies:
+            raise ValueError("At least one dependency is required")
+        models = ModelCache()
+        results = {
+            name: self._resolve(
+                dependencies, constraints, transitive, optional_depth, models
+            )
+            for name, constraints in platforms.items()
+        }
+        _log.debug(
+            f"Resolved {len(platforms)} platforms: built {models.built} models, "
+            f"reused {models.reused}"
+        )
+        return results
+
+    def _resolve(
+        self,
+        dependencies: list[Dependency],
+        profile_constraints: ProfileConstraints | None,
+        transitive: bool,
+        optional_depth: int,
+        models: ModelCache | None = None,
+    ) -> tuple[list[Dependency], list[Dependency]]:
         boms = _compute_boms(dependencies)
 
         pom = create_pom(dependencies, boms)
         model = Model(
-            pom, dependencies[0].context, profile_constraints=self.profile_constraints
+            pom,
+            dependencies[0].context,
+            profile_constraints=profile_constraints,
+            models=models,
         )
         # When transitive=False, set max_depth=1 to get one level of dependencies
         # from the synthetic wrapper (i.e., the direct dependencies of the components)
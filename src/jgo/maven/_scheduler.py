@@ -0,0 +1,255 @@
+"""
+Scheduling of many artifact downloads over a limited number of connections.
+
+Downloads are ordered by size, learned from Content-Length via HEAD requests:
+small files are fetched first (smallest first) so their consumers can make
+progress quickly, while a few connections are reserved for the large files
+(largest first) so that they start early and run side by side rather than
+queueing up at the end. An optional RateLimiter caps the bytes per second
+across all connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+import requests
+
+from ._remote import read_misses, record_misses
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from pathlib import Path
+
+    from ._core import Artifact
+    from ._resolver import ProgressCallback
+
+_log = logging.getLogger(__name__)
+
+# Concurrent downloads per batch
+DEFAULT_MAX_DOWNLOADS = 8
+
+# Files at least this large (bytes) go to the large-file connections
+LARGE_FILE_SIZE = 4 * 1024 * 1024
+
+# Assumed sizes for files whose size could not be probed
+_GUESSED_SIZES = {"pom": 16 * 1024}
+_GUESSED_SIZE = 256 * 1024
+
+# Per-thread aggregate progress of the batch a download belongs to
+_batch = threading.local()
+
+
+class RateLimiter:
+    """
+    Token bucket capping the combined transfer rate of many threads.
+    """
+
+    def __init__(self, bytes_per_second: float):
+        """
+        Create a rate limiter.
+
+        Args:
+            bytes_per_second: Maximum average transfer rate; bursts of up to
+                one second's worth of bytes are allowed
+        """
+        if bytes_per_second <= 0:
+            raise ValueError(f"Invalid rate limit: {bytes_per_second}")
+        self.rate = float(bytes_per_second)
+        self._allowance = self.rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, count: int) -> None:
+        """Account for count transferred bytes, sleeping to stay within the rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(
+                self.rate, self._allowance + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._allowance -= count
+            delay = -self._allowance / self.rate if self._allowance < 0 else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+
+def batch_progress() -> Callable[[int], None] | None:
+    """
+    Get the aggregate progress update function of the current download batch.
+
+    Returns:
+        Update function accepting bytes_count, or None outside a batch
+    """
+    return getattr(_batch, "update", None)
+
+
+def probe_size(artifact: Artifact) -> int | None:
+    """
+    Ask the remote repositories how large an artifact is, via HEAD requests.
+
+    Like downloads, probes skip repositories that recently answered "not
+    found" for the file (see read_misses), and record new such answers.
+
+    Args:
+        artifact: The artifact to probe
+
+    Returns:
+        Content-Length in bytes, or None if no repository reported one
+    """
+    context = artifact.context
+    cached_file = artifact.cached_path
+    misses = read_misses(cached_file) if cached_file else {}
+    missed = []
+    path_str = str(artifact.component.path_prefix).replace("\\", "/")
+    try:
+        for name, repo_url in context.ordered_repos(artifact.groupId):
+            if repo_url in misses and not context.update_policy_for(name).is_due(
+                misses[repo_url]
+            ):
+                continue
+            url = f"{repo_url}/{path_str}/{artifact.filename}"
+            try:
+                response = context.transport.head(url, timeout=context.timeout)
+            except requests.RequestException as e:
+                _log.debug(f"Could not probe {url}: {e}")
+                continue
+            if response.status_code == 200:
+                length = response.headers.get("content-length")
+                return int(length) if length and length.isdigit() else None
+            if response.status_code == 404:
+                missed.append(repo_url)
+        return None
+    finally:
+        if cached_file:
+            record_misses(cached_file, missed)
+
+
+class DownloadScheduler:
+    """
+    Downloads a batch of artifacts concurrently, ordered by size.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_DOWNLOADS,
+        progress_callback: ProgressCallback | None = None,
+        probe_sizes: bool = True,
+        large_file_size: int = LARGE_FILE_SIZE,
+    ):
+        """
+        Create a download scheduler.
+
+        Args:
+            max_workers: Maximum number of concurrent downloads
+            progress_callback: Optional callback reporting the aggregate
+                progress of each batch, with the same contract as
+                PythonResolver's (called once per batch with a summary name
+                and the total size)
+            probe_sizes: Whether to learn file sizes with HEAD requests; if
+                False, sizes are guessed from the packaging
+            large_file_size: Size in bytes from which a file counts as large
+        """
+        self.max_workers = max(1, max_workers)
+        self.progress_callback = progress_callback
+        self.probe_sizes = probe_sizes
+        self.large_file_size = large_file_size
+
+    def fetch(self, artifacts: Iterable[Artifact]) -> list[Path]:
+        """
+        Make artifacts available locally, downloading those not cached yet.
+
+        Args:
+            artifacts: The artifacts to resolve
+
+        Returns:
+            Local paths of the artifacts, in the order given
+        """
+        artifacts = list(artifacts)
+        missing = {
+            a.key: a
+            for a in artifacts
+            if not (a.cached_path and a.cached_path.exists())
+        }
+        if missing:
+            self._download(list(missing.values()))
+        return [a.resolve() for a in artifacts]
+
+    def _sizes(self, artifacts: list[Artifact]) -> list[int | None]:
+        if not self.probe_sizes:
+            return [None] * len(artifacts)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(probe_size, artifacts))
+
+    def _download(self, artifacts: list[Artifact]) -> None:
+        sizes = self._sizes(artifacts)
+        work = sorted(
+            (
+                size
+                if size is not None
+                else _GUESSED_SIZES.get(a.packaging, _GUESSED_SIZE),
+                i,
+                a,
+            )
+            for i, (a, size) in enumerate(zip(artifacts, sizes))
+        )
+        small = [a for size, _, a in work if size < self.large_file_size]
+        large = [a for size, _, a in reversed(work) if size >= self.large_file_size]
+
+        # A quarter of the connections start on the large files, the rest on
+        # the small ones; each helps with the other queue once its own is empty
+        workers = min(self.max_workers, len(artifacts))
+        large_workers = (
+            min(len(large), max(1, workers // 4)) if large and workers > 1 else 0
+        )
+        queues = [(large, small)] * large_workers + [(small, large)] * (
+            workers - large_workers
+        )
+        lock = threading.Lock()
+        _log.debug(
+            f"Downloading {len(artifacts)} files ({len(large)} large) "
+            f"over {workers} connections"
+        )
+
+        def next_artifact(first: list, then: list) -> Artifact | None:
+            with lock:
+                if first:
+                    return first.pop(0)
+                if then:
+                    return then.pop(0)
+                return None
+
+        total_size = sum(size for size, _, _ in work)
+        with self._progress(f"{len(artifacts)} files", total_size) as update:
+
+            def worker(first: list, then: list) -> None:
+                _batch.update = update
+                try:
+                    while (artifact := next_artifact(first, then)) is not None:
+                        artifact.resolve()
+                finally:
+                    _batch.update = None
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(worker, *q) for q in queues]
+                for future in futures:
+                    future.result()
+
+    @contextmanager
+    def _progress(self, name: str, total_size: int) -> Iterator[Callable[[int], None]]:
+        if self.progress_callback is None or total_size <= 0:
+            yield lambda count: None
+            return
+        lock = threading.Lock()
+        with self.progress_callback(name, total_size) as update_progress:
+
+            def update(count: int) -> None:
+                with lock:
+                    update_progress(count)
+
+            yield update
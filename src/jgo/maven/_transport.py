@@ -0,0 +1,176 @@
+"""
+HTTP transports used to talk to remote Maven repositories.
+
+A MavenContext performs all of its HTTP requests through a Transport, so
+that connection handling can be swapped out: e.g. a pooled requests.Session,
+or a stand-in serving a synthetic repository in tests and benchmarks.
+
+Responses follow the subset of the requests.Response API that jgo uses:
+status_code, headers, content, text, iter_content(chunk_size) and close(),
+and they are context managers. Failures to connect or transfer are raised
+as requests.RequestException.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
+
+import requests
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class Transport(ABC):
+    """
+    Performs HTTP requests on behalf of a MavenContext.
+    """
+
+    @abstractmethod
+    def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """
+        Send a GET request.
+
+        Args:
+            url: URL to fetch
+            headers: Extra HTTP headers, e.g. Range or If-None-Match
+            stream: If True, the body is read lazily via iter_content
+            timeout: Seconds to wait for the server
+
+        Returns:
+            The response, for any HTTP status
+        """
+        ...
+
+    @abstractmethod
+    def head(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """
+        Send a HEAD request, following redirects.
+
+        Args:
+            url: URL to ask about
+            headers: Extra HTTP headers
+            timeout: Seconds to wait for the server
+
+        Returns:
+            The response, for any HTTP status
+        """
+        ...
+
+
+class RequestsTransport(Transport):
+    """
+    Transport using the requests library (the default).
+    """
+
+    def __init__(self, session: requests.Session | None = None):
+        """
+        Create a requests-based transport.
+
+        Args:
+            session: Optional session, to reuse connections across requests.
+                Without one, each request uses its own connection.
+        """
+        self.session = session
+
+    def get(self, url, *, headers=None, stream=False, timeout=None):
+        http = self.session or requests
+        return http.get(url, headers=headers, stream=stream, timeout=timeout)
+
+    def head(self, url, *, headers=None, timeout=None):
+        http = self.session or requests
+        return http.head(url, headers=headers, timeout=timeout, allow_redirects=True)
+
+
+class AsyncTransport(ABC):
+    """
+    Performs HTTP requests from asyncio code, e.g. backed by httpx or aiohttp.
+
+    Same contract as Transport, with coroutine methods; bodies are read
+    before the response is returned.
+    """
+
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """Send a GET request; see Transport.get."""
+        ...
+
+    @abstractmethod
+    async def head(
+        self,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """Send a HEAD request; see Transport.head."""
+        ...
+
+    async def get_many(
+        self, urls: Iterable[str], timeout: float | None = None
+    ) -> list[requests.Response | requests.RequestException]:
+        """
+        GET many URLs concurrently.
+
+        Args:
+            urls: URLs to fetch
+            timeout: Seconds to wait for each server
+
+        Returns:
+            For each URL in order, its response or the request error that
+            prevented one; other errors are raised
+        """
+
+        async def get(url: str) -> requests.Response | requests.RequestException:
+            try:
+                return await self.get(url, timeout=timeout)
+            except requests.RequestException as e:
+                return e
+
+        return await asyncio.gather(*(get(url) for url in urls))
+
+
+class ThreadedAsyncTransport(AsyncTransport):
+    """
+    AsyncTransport running the requests of a synchronous Transport in threads.
+    """
+
+    def __init__(self, transport: Transport):
+        """
+        Wrap a synchronous transport.
+
+        Args:
+            transport: The transport performing the actual requests
+        """
+        self.transport = transport
+
+    async def get(self, url, *, headers=None, timeout=None):
+        return await asyncio.to_thread(
+            self.transport.get, url, headers=headers, timeout=timeout
+        )
+
+    async def head(self, url, *, headers=None, timeout=None):
+        return await asyncio.to_thread(
+            self.transport.head, url, headers=headers, timeout=timeout
+        )
@@ -9,12 +9,15 @@ This module provides three levels of version handling:
 
 2. Maven Version Comparison (non-SemVer)
    - MavenVersion class - Parsed version with comparison operators
+   - parse_maven_version() - Interned (LRU-cached) MavenVersion constructor
    - compare_versions() - Compare two version strings
+   - max_version() / sort_versions() - Key-based ordering of many versions
 
 3. Maven Version Ranges
    - VersionRange class - Parsed range with bounds
-   - parse_version_range() - Parse "[1.0,2.0)" style ranges
+   - parse_version_range() - Parse "[1.0,2.0)" style ranges (cached)
    - version_in_range() - Check if version satisfies range
+   - VersionIndex class - Sorted versions answering range queries by bisection
 
 Reference: https://maven.apache.org/pom.html#version-order-specification
 
@@ -24,11 +27,15 @@ See also the more general Java version handling in jgo.util.java.
 from __future__ import annotations
 
 import re
-from functools import total_ordering
-from typing import NamedTuple
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, total_ordering
+from typing import TYPE_CHECKING, NamedTuple
 
 import semver
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 # ============================================================
 # SECTION 1: SEMVER COMPARISON
 #
@@ -93,7 +100,13 @@ def compare_semver(v1: str, v2: str) -> int:
     Raises:
         ValueError: If either version is not valid SemVer
     """
-    return semver.Version.parse(v1).compare(semver.Version.parse(v2))
+    return _parse_semver(v1).compare(_parse_semver(v2))
+
+
+@lru_cache(maxsize=4096)
+def _parse_semver(version: str) -> semver.Version:
+    """Parse a SemVer string, caching the result."""
+    return semver.Version.parse(version)
 
 
 # ============================================================
@@ -324,6 +337,18 @@ def compare_tokens(
         return -1
 
 
+def _token_key(token: Token) -> tuple:
+    """
+    Map a token to a tuple ordered the same way as compare_tokens().
+
+    Qualifiers sort below -numbers, which sort below .numbers; qualifiers
+    ignore their separator, per the rules in compare_tokens().
+    """
+    if isinstance(token.value, int):
+        return (2 if token.separator == "." else 1, token.value)
+    return (0, *_qualifier_priority(token.value))
+
+
 @total_ordering
 class MavenVersion:
     """
@@ -339,6 +364,9 @@ class MavenVersion:
         True
         >>> MavenVersion("1.0") == MavenVersion("1.0.0")
         True
+
+    Comparisons go through sort_key(), which is computed once per instance.
+    Use parse_maven_version() to share instances for repeated versions.
     """
 
     def __init__(self, version_string: str):
@@ -350,6 +378,7 @@ class MavenVersion:
         """
         self._original = version_string
         self._tokens = _trim_nulls(_tokenize(version_string))
+        self._sort_key: tuple | None = None
 
     @property
     def tokens(self) -> list[Token]:
@@ -365,37 +394,66 @@ class MavenVersion:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, MavenVersion):
             return NotImplemented
-        return self._compare(other) == 0
+        return self.sort_key() == other.sort_key()
 
     def __lt__(self, other: MavenVersion) -> bool:
         if not isinstance(other, MavenVersion):
             return NotImplemented
-        return self._compare(other) < 0
+        return self.sort_key() < other.sort_key()
 
     def __hash__(self) -> int:
-        # Hash based on trimmed tokens for consistency with __eq__
-        return hash(tuple(self._tokens))
+        # Hash based on the sort key for consistency with __eq__
+        return hash(self.sort_key())
 
-    def _compare(self, other: MavenVersion) -> int:
-        """Compare with another MavenVersion. Returns -1, 0, or 1."""
-        tokens_a = self._tokens
-        tokens_b = other._tokens
-        max_len = max(len(tokens_a), len(tokens_b))
+    def sort_key(self) -> tuple:
+        """
+        Get a tuple that orders this version among other Maven versions.
 
-        for i in range(max_len):
-            tok_a = tokens_a[i] if i < len(tokens_a) else None
-            tok_b = tokens_b[i] if i < len(tokens_b) else None
+        Comparing two keys with the built-in tuple operators gives the same
+        result as comparing the versions token by token, including padding
+        the shorter version with separator-dependent null tokens: each
+        position records whether the rest of the version is above or below
+        plain padding, and the version ends with a (0,) terminator that
+        falls between the two.
 
-            # Padding separator comes from the corresponding position in the
-            # longer version (per Maven spec)
-            pad_sep_a = tokens_b[i].separator if i < len(tokens_b) else "."
-            pad_sep_b = tokens_a[i].separator if i < len(tokens_a) else "."
+        The key is computed on first use and cached on the instance.
 
-            result = compare_tokens(tok_a, tok_b, pad_sep_a, pad_sep_b)
-            if result != 0:
-                return result
+        Returns:
+            A totally ordered tuple; equal versions have equal keys
+        """
+        if self._sort_key is None:
+            parts: list[tuple] = []
+            tail = 0
+            for token in reversed(self._tokens):
+                # How this token compares against the padding that would stand
+                # in for it in a shorter version; ties defer to the tail.
+                # Qualifiers ignore their separator, so they always compare
+                # against the empty qualifier ("1.sp" == "1-sp" > "1").
+                pad_sep = token.separator if isinstance(token.value, int) else "-"
+                pad = compare_tokens(token, None, pad_sep_b=pad_sep)
+                tail = pad or tail
+                parts.append((tail, _token_key(token)))
+            parts.reverse()
+            parts.append((0,))
+            self._sort_key = tuple(parts)
+        return self._sort_key
+
+
+@lru_cache(maxsize=4096)
+def parse_maven_version(version: str) -> MavenVersion:
+    """
+    Parse a Maven version string, reusing instances for repeated strings.
 
-        return 0
+    Resolution compares the same handful of version strings many times;
+    interning them means each is tokenized and keyed only once.
+
+    Args:
+        version: Maven version string
+
+    Returns:
+        Shared MavenVersion instance for the string
+    """
+    return MavenVersion(version)
 
 
 def compare_versions(v1: str, v2: str) -> int:
@@ -422,14 +480,55 @@ def compare_versions(v1: str, v2: str) -> int:
         return compare_semver(v1, v2)
 
     # Fall back to Maven comparison
-    mv1 = MavenVersion(v1)
-    mv2 = MavenVersion(v2)
+    k1 = parse_maven_version(v1).sort_key()
+    k2 = parse_maven_version(v2).sort_key()
+    return (k1 > k2) - (k1 < k2)
 
-    if mv1 < mv2:
-        return -1
-    elif mv1 > mv2:
-        return 1
-    return 0
+
+def _ordering_key(versions: list[str]):
+    """
+    Choose a sort key function for a collection of version strings.
+
+    Mirrors compare_versions(): SemVer ordering when every version is
+    SemVer 1.x, Maven ordering otherwise.
+    """
+    if versions and all(is_semver_1x(v) for v in versions):
+        return lambda v: _parse_semver(v.strip())
+    return lambda v: parse_maven_version(v.strip()).sort_key()
+
+
+def max_version(versions: Iterable[str]) -> str | None:
+    """
+    Find the highest of the given version strings.
+
+    Each version is parsed once, so this is much cheaper than
+    max() with functools.cmp_to_key(compare_versions).
+
+    Args:
+        versions: Version strings
+
+    Returns:
+        The highest version string, or None if there are none
+    """
+    versions = list(versions)
+    if not versions:
+        return None
+    return max(versions, key=_ordering_key(versions))
+
+
+def sort_versions(versions: Iterable[str], reverse: bool = False) -> list[str]:
+    """
+    Sort version strings from lowest to highest.
+
+    Args:
+        versions: Version strings
+        reverse: If True, sort from highest to lowest
+
+    Returns:
+        New sorted list of version strings
+    """
+    versions = list(versions)
+    return sorted(versions, key=_ordering_key(versions), reverse=reverse)
 
 
 # ============================================================
@@ -455,7 +554,20 @@ class VersionRange(NamedTuple):
     lower_inclusive: bool
     upper_inclusive: bool
 
+    def contains(self, version: str) -> bool:
+        """
+        Check if version satisfies this range.
+
+        Args:
+            version: Version string to check
+
+        Returns:
+            True if version is within range, False otherwise
+        """
+        return version_in_range(version, self)
+
 
+@lru_cache(maxsize=1024)
 def parse_version_range(range_spec: str) -> VersionRange:
     """
     Parse Maven version range specification.
@@ -469,6 +581,9 @@ def parse_version_range(range_spec: str) -> VersionRange:
         - Exact version: "[1.0]" (equivalent to "[1.0,1.0]")
         - Soft requirement: "1.0" (returns unbounded range, caller handles)
 
+    Results are cached, so the same VersionRange is returned for repeated
+    specifications.
+
     Args:
         range_spec: Maven-style version range string
 
@@ -544,10 +659,7 @@ def version_in_range(version: str, range_spec: str | VersionRange) -> bool:
     Returns:
         True if version is within range, False otherwise
     """
-    if isinstance(range_spec, str):
-        vr = parse_version_range(range_spec)
-    else:
-        vr = range_spec
+    vr = _as_range(range_spec)
 
     # Unbounded range (soft requirement) matches everything
     if vr.lower is None and vr.upper is None:
@@ -574,3 +686,120 @@ def version_in_range(version: str, range_spec: str | VersionRange) -> bool:
                 return False
 
     return True
+
+
+class VersionIndex:
+    """
+    A set of version strings kept in order for fast range queries.
+
+    Each version is parsed and keyed once when the index is built; queries
+    then locate range bounds by binary search over the precomputed keys.
+    Ordering is the one of max_version() and sort_versions(): SemVer when
+    every indexed version is SemVer 1.x, Maven ordering otherwise.
+
+    Examples:
+        >>> index = VersionIndex(["1.0", "1.5", "2.0", "2.1"])
+        >>> index.matching("[1.2,2.0]")
+        ['1.5', '2.0']
+        >>> index.highest("[1.0,2.0)")
+        '1.5'
+    """
+
+    def __init__(self, versions: Iterable[str]):
+        """
+        Build an index over the given versions.
+
+        Args:
+            versions: Version strings; duplicates and blanks are dropped
+        """
+        unique = list({v.strip() for v in versions if v and v.strip()})
+        self._semver = bool(unique) and all(is_semver_1x(v) for v in unique)
+        self._key = _ordering_key(unique)
+        entries = sorted((self._key(v), v) for v in unique)
+        self._keys = [key for key, _ in entries]
+        self._versions = [version for _, version in entries]
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __iter__(self):
+        return iter(self._versions)
+
+    def _span(self, vr: VersionRange) -> tuple[int, int] | None:
+        """
+        Index bounds [lo, hi) of the versions inside the range.
+
+        Returns None if the range cannot be bisected: compare_versions()
+        compares a non-SemVer bound with SemVer versions the Maven way, an
+        order that need not agree with the SemVer order of the index.
+        """
+        bounds = [b.strip() for b in (vr.lower, vr.upper) if b is not None]
+        if self._semver and not all(is_semver_1x(b) for b in bounds):
+            return None
+        lo, hi = 0, len(self._keys)
+        if vr.lower is not None:
+            key = self._key(vr.lower)
+            bisect = bisect_left if vr.lower_inclusive else bisect_right
+            lo = bisect(self._keys, key)
+        if vr.upper is not None:
+            key = self._key(vr.upper)
+            bisect = bisect_right if vr.upper_inclusive else bisect_left
+            hi = bisect(self._keys, key)
+        return lo, max(lo, hi)
+
+    def _candidates(self, vr: VersionRange) -> list[str]:
+        """The indexed versions inside the range, lowest first."""
+        span = self._span(vr)
+        if span is None:
+            return [v for v in self._versions if version_in_range(v, vr)]
+        lo, hi = span
+        return self._versions[lo:hi]
+
+    def matching(
+        self, range_spec: str | VersionRange, snapshots: bool = True
+    ) -> list[str]:
+        """
+        Get all indexed versions inside a range, lowest first.
+
+        Args:
+            range_spec: Range specification string or VersionRange object
+            snapshots: If False, skip versions ending in -SNAPSHOT
+
+        Returns:
+            Matching version strings in ascending order
+        """
+        return [
+            v
+            for v in self._candidates(_as_range(range_spec))
+            if snapshots or not v.endswith("-SNAPSHOT")
+        ]
+
+    def highest(
+        self, range_spec: str | VersionRange | None = None, snapshots: bool = True
+    ) -> str | None:
+        """
+        Get the highest indexed version inside a range.
+
+        Args:
+            range_spec: Range specification string or VersionRange object,
+                or None for no restriction
+            snapshots: If False, skip versions ending in -SNAPSHOT
+
+        Returns:
+            The highest matching version string, or None if none match
+        """
+        if range_spec is None:
+            candidates = self._versions
+        else:
+            candidates = self._candidates(_as_range(range_spec))
+        for version in reversed(candidates):
+            if snapshots or not version.endswith("-SNAPSHOT"):
+                return version
+        return None
+
+
+def _as_range(range_spec: str | VersionRange) -> VersionRange:
+    """Parse a range specification unless it is already a VersionRange."""
+    if isinstance(range_spec, str):
+        return parse_version_range(range_spec)
+    return range_spec
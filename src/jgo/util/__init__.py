@@ -2,12 +2,13 @@
 Utility modules for jgo.
 """
 
-from . import compat, io, java, logging, mvn, platform, serialization, toml
+from . import compat, io, java, locks, logging, mvn, platform, serialization, toml
 
 __all__ = [
     "compat",
     "io",
     "java",
+    "locks",
     "logging",
     "mvn",
     "platform",
@@ -2,6 +2,9 @@
 Utility functions for file I/O.
 """
 
+import json
+import os
+import tempfile
 from pathlib import Path
 
 
@@ -15,3 +18,36 @@ def binary(p: Path) -> bytes:
     """Read a binary file."""
     with open(p, "rb") as f:
         return f.read()
+
+
+def write_atomic(p: Path, data: bytes) -> None:
+    """
+    Replace a file with new content atomically.
+
+    The content is written to a temporary file next to p, then renamed over
+    p, so that concurrent readers see either the old or the new content,
+    never a partial file.
+    """
+    p.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, p)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def read_json(p: Path) -> dict:
+    """Read a JSON object from a file, or an empty dict if missing or invalid."""
+    try:
+        data = json.loads(p.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def write_json(p: Path, data: dict) -> None:
+    """Atomically replace a file with the JSON encoding of an object."""
+    write_atomic(p, json.dumps(data, indent=2, sort_keys=True).encode())
@@ -0,0 +1,113 @@
+"""
+Advisory file locks shared between jgo processes.
+
+Locks are held with flock(2) on POSIX and msvcrt.locking on Windows. The
+operating system releases them when the holding process exits, so a crashed
+process never leaves a stale lock behind. Lock files are normally left in
+place; a holder may delete or move its lock file (e.g. along with the
+directory it guards), in which case waiters notice once they get the lock
+and take the lock on whatever file is at the path by then instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+_log = logging.getLogger(__name__)
+
+# Seconds between attempts to take a lock held by another process
+POLL_INTERVAL = 0.1
+
+if sys.platform == "win32":
+    import msvcrt
+
+    def _try_lock(fd: int) -> bool:
+        os.lseek(fd, 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _unlock(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fd: int) -> bool:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+
+    def _unlock(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float | None = None) -> Iterator[int]:
+    """
+    Hold an exclusive advisory lock on a file for the duration of a with block.
+
+    The lock also excludes other threads of the same process, as long as
+    each takes it through its own file_lock call.
+
+    Args:
+        path: Lock file; it and its parent directories are created as needed
+        timeout: Seconds to wait for the lock, or None to wait indefinitely
+
+    Yields:
+        Descriptor of the locked file, e.g. to hand the lock on to a process
+        started with exec
+
+    Raises:
+        TimeoutError: If the lock could not be taken within timeout seconds
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    waiting = False
+    while True:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            while not _try_lock(fd):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for lock {path}")
+                if not waiting:
+                    _log.info(f"Waiting for another jgo process ({path.name})")
+                    waiting = True
+                time.sleep(POLL_INTERVAL)
+        except BaseException:
+            os.close(fd)
+            raise
+        if _is_current(fd, path):
+            break
+        # The previous holder removed the file: lock the one there now
+        _unlock(fd)
+        os.close(fd)
+    try:
+        yield fd
+    finally:
+        try:
+            _unlock(fd)
+        finally:
+            os.close(fd)
+
+
+def _is_current(fd: int, path: Path) -> bool:
+    """Check that an open lock file is still the one at its path."""
+    try:
+        return os.path.samestat(os.fstat(fd), os.stat(path))
+    except FileNotFoundError:
+        return False
@@ -58,10 +58,10 @@ Test --color with different commands.
   │                                                    on unresolved             │
   │                                                    dependencies. [env var:   │
   │                                                    JGO_LENIENT]              │
-  │ --links                 [hard|soft|copy|auto]      How to link JARs: hard,   │
-  │                                                    soft, copy, or auto       │
-  │                                                    (default: from config or  │
-  │                                                    auto)                     │
+  │ --links                 [hard|soft|copy|reflink|a  How to link JARs: hard,   │
+  │                         uto]                       soft, copy, reflink, or   │
+  │                                                    auto (default: from       │
+  │                                                    config or auto)           │
   │ --property          -D  KEY=VALUE                  Set property for profile  │
   │                                                    activation.               │
   │ --os-version            VERSION                    Set OS version for        │
@@ -123,6 +123,15 @@ Test --color with different commands.
   │                                                    cache. [env var: M2_REPO] │
   │ --cache-dir             PATH                       Override cache directory. │
   │                                                    [env var: JGO_CACHE_DIR]  │
+  │ --rate-limit            SIZE                       Cap the combined download │
+  │                                                    rate, in bytes per second │
+  │                                                    (e.g. 10M). [env var:     │
+  │                                                    JGO_RATE_LIMIT]           │
+  │ --max-downloads         N [x>=1]                   Maximum number of         │
+  │                                                    concurrent artifact       │
+  │                                                    downloads (default: 8).   │
+  │                                                    [env var:                 │
+  │                                                    JGO_MAX_DOWNLOADS]        │
   │ --timeout               SECONDS                    HTTP timeout for artifact │
   │                                                    downloads and metadata    │
   │                                                    fetches (default: 10).    │
@@ -174,6 +183,7 @@ Test --color with different commands.
   ╰──────────────────────────────────────────────────────────────────────────────╯
   ╭─ Commands ───────────────────────────────────────────────────────────────────╮
   │ add      Add dependencies to jgo.toml.                                       │
+  │ cache    Manage the jgo cache.                                               │
   │ config   Manage jgo configuration.                                           │
   │ help     Show help for jgo or a specific command.                            │
   │ info     Show information about environment or artifact.                     │
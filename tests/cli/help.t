@@ -30,10 +30,10 @@ Test main help output.
   │                                                    on unresolved             │
   │                                                    dependencies. [env var:   │
   │                                                    JGO_LENIENT]              │
-  │ --links                 [hard|soft|copy|auto]      How to link JARs: hard,   │
-  │                                                    soft, copy, or auto       │
-  │                                                    (default: from config or  │
-  │                                                    auto)                     │
+  │ --links                 [hard|soft|copy|reflink|a  How to link JARs: hard,   │
+  │                         uto]                       soft, copy, reflink, or   │
+  │                                                    auto (default: from       │
+  │                                                    config or auto)           │
   │ --property          -D  KEY=VALUE                  Set property for profile  │
   │                                                    activation.               │
   │ --os-version            VERSION                    Set OS version for        │
@@ -95,6 +95,15 @@ Test main help output.
   │                                                    cache. [env var: M2_REPO] │
   │ --cache-dir             PATH                       Override cache directory. │
   │                                                    [env var: JGO_CACHE_DIR]  │
+  │ --rate-limit            SIZE                       Cap the combined download │
+  │                                                    rate, in bytes per second │
+  │                                                    (e.g. 10M). [env var:     │
+  │                                                    JGO_RATE_LIMIT]           │
+  │ --max-downloads         N [x>=1]                   Maximum number of         │
+  │                                                    concurrent artifact       │
+  │                                                    downloads (default: 8).   │
+  │                                                    [env var:                 │
+  │                                                    JGO_MAX_DOWNLOADS]        │
   │ --timeout               SECONDS                    HTTP timeout for artifact │
   │                                                    downloads and metadata    │
   │                                                    fetches (default: 10).    │
@@ -146,6 +155,7 @@ Test main help output.
   ╰──────────────────────────────────────────────────────────────────────────────╯
   ╭─ Commands ───────────────────────────────────────────────────────────────────╮
   │ add      Add dependencies to jgo.toml.                                       │
+  │ cache    Manage the jgo cache.                                               │
   │ config   Manage jgo configuration.                                           │
   │ help     Show help for jgo or a specific command.                            │
   │ info     Show information about environment or artifact.                     │
@@ -177,15 +187,21 @@ Test help for specific commands.
   │                  Example: -- -Xmx2G -- script.py                             │
   ╰──────────────────────────────────────────────────────────────────────────────╯
   ╭─ Options ────────────────────────────────────────────────────────────────────╮
-  │ --main-class     CLASS  Main class to run (supports auto-completion for      │
-  │                         simple names)                                        │
-  │ --entrypoint     NAME   Run specific entrypoint from jgo.toml                │
-  │ --add-classpath  PATH   Append to classpath (JARs, directories, etc.)        │
-  │ --global                Ignore jgo.toml and use global configuration only    │
-  │                         (endpoint mode).                                     │
-  │ --local                 Force jgo.toml project mode even when an             │
-  │                         endpoint-like argument is present.                   │
-  │ --help                  Show this message and exit.                          │
+  │ --main-class          CLASS  Main class to run (supports auto-completion for │
+  │                              simple names)                                   │
+  │ --entrypoint          NAME   Run specific entrypoint from jgo.toml           │
+  │ --add-classpath       PATH   Append to classpath (JARs, directories, etc.)   │
+  │ --explicit-classpath         List JARs individually on the classpath, in     │
+  │                              dependency resolution order (instead of         │
+  │                              directory wildcards)                            │
+  │ --global                     Ignore jgo.toml and use global configuration    │
+  │                              only (endpoint mode).                           │
+  │ --local                      Force jgo.toml project mode even when an        │
+  │                              endpoint-like argument is present.              │
+  │ --exec/--no-exec             Replace the jgo process with the JVM instead of │
+  │                              waiting for it as a child process (default:     │
+  │                              --exec on POSIX systems)                        │
+  │ --help                       Show this message and exit.                     │
   ╰──────────────────────────────────────────────────────────────────────────────╯
                                                                                   
    TIP: Use jgo --dry-run run to see the command without executing it.            
@@ -287,8 +303,9 @@ Test help for specific commands.
    Resolve dependencies and build environment.                                    
                                                                                   
   ╭─ Options ────────────────────────────────────────────────────────────────────╮
-  │ --force  Force rebuild even if cached                                        │
-  │ --help   Show this message and exit.                                         │
+  │ --force   Force rebuild even if cached                                       │
+  │ --frozen  Install exactly what jgo.lock.toml lists, without resolving        │
+  │ --help    Show this message and exit.                                        │
   ╰──────────────────────────────────────────────────────────────────────────────╯
 
   $ jgo help lock
@@ -298,8 +315,10 @@ Test help for specific commands.
    Update jgo.lock.toml without building environment.                             
                                                                                   
   ╭─ Options ────────────────────────────────────────────────────────────────────╮
-  │ --check  Check if lock file is up to date                                    │
-  │ --help   Show this message and exit.                                         │
+  │ --check            Check if lock file is up to date                          │
+  │ --platforms  LIST  Lock for these platforms together, e.g.                   │
+  │                    linux-x64,macos-arm64                                     │
+  │ --help             Show this message and exit.                               │
   ╰──────────────────────────────────────────────────────────────────────────────╯
 
   $ jgo help update
@@ -371,6 +390,7 @@ Test help for specific commands.
   │ classpath        Show classpath.                                             │
   │ deplist          Show flat list of dependencies.                             │
   │ deptree          Show dependency tree.                                       │
+  │ duplicates       Show classes duplicated across JARs.                        │
   │ entrypoints      Show entrypoints from jgo.toml.                             │
   │ envdir           Show environment directory path.                            │
   │ jars             Show all JAR paths (classpath + module-path).               │
@@ -537,10 +557,10 @@ Test no-argument help (should show main help).
   │                                                    on unresolved             │
   │                                                    dependencies. [env var:   │
   │                                                    JGO_LENIENT]              │
-  │ --links                 [hard|soft|copy|auto]      How to link JARs: hard,   │
-  │                                                    soft, copy, or auto       │
-  │                                                    (default: from config or  │
-  │                                                    auto)                     │
+  │ --links                 [hard|soft|copy|reflink|a  How to link JARs: hard,   │
+  │                         uto]                       soft, copy, reflink, or   │
+  │                                                    auto (default: from       │
+  │                                                    config or auto)           │
   │ --property          -D  KEY=VALUE                  Set property for profile  │
   │                                                    activation.               │
   │ --os-version            VERSION                    Set OS version for        │
@@ -653,6 +673,7 @@ Test no-argument help (should show main help).
   ╰──────────────────────────────────────────────────────────────────────────────╯
   ╭─ Commands ───────────────────────────────────────────────────────────────────╮
   │ add      Add dependencies to jgo.toml.                                       │
+  │ cache    Manage the jgo cache.                                               │
   │ config   Manage jgo configuration.                                           │
   │ help     Show help for jgo or a specific command.                            │
   │ info     Show information about environment or artifact.                     │
@@ -699,10 +720,10 @@ Test --help flag on main command.
   │                                                    on unresolved             │
   │                                                    dependencies. [env var:   │
   │                                                    JGO_LENIENT]              │
-  │ --links                 [hard|soft|copy|auto]      How to link JARs: hard,   │
-  │                                                    soft, copy, or auto       │
-  │                                                    (default: from config or  │
-  │                                                    auto)                     │
+  │ --links                 [hard|soft|copy|reflink|a  How to link JARs: hard,   │
+  │                         uto]                       soft, copy, reflink, or   │
+  │                                                    auto (default: from       │
+  │                                                    config or auto)           │
   │ --property          -D  KEY=VALUE                  Set property for profile  │
   │                                                    activation.               │
   │ --os-version            VERSION                    Set OS version for        │
@@ -764,6 +785,15 @@ Test --help flag on main command.
   │                                                    cache. [env var: M2_REPO] │
   │ --cache-dir             PATH                       Override cache directory. │
   │                                                    [env var: JGO_CACHE_DIR]  │
+  │ --rate-limit            SIZE                       Cap the combined download │
+  │                                                    rate, in bytes per second │
+  │                                                    (e.g. 10M). [env var:     │
+  │                                                    JGO_RATE_LIMIT]           │
+  │ --max-downloads         N [x>=1]                   Maximum number of         │
+  │                                                    concurrent artifact       │
+  │                                                    downloads (default: 8).   │
+  │                                                    [env var:                 │
+  │                                                    JGO_MAX_DOWNLOADS]        │
   │ --timeout               SECONDS                    HTTP timeout for artifact │
   │                                                    downloads and metadata    │
   │                                                    fetches (default: 10).    │
@@ -815,6 +845,7 @@ Test --help flag on main command.
   ╰──────────────────────────────────────────────────────────────────────────────╯
   ╭─ Commands ───────────────────────────────────────────────────────────────────╮
   │ add      Add dependencies to jgo.toml.                                       │
+  │ cache    Manage the jgo cache.                                               │
   │ config   Manage jgo configuration.                                           │
   │ help     Show help for jgo or a specific command.                            │
   │ info     Show information about environment or artifact.                     │
@@ -15,6 +15,7 @@ Test info with no subcommand shows help.
   │ classpath        Show classpath.                                             │
   │ deplist          Show flat list of dependencies.                             │
   │ deptree          Show dependency tree.                                       │
+  │ duplicates       Show classes duplicated across JARs.                        │
   │ entrypoints      Show entrypoints from jgo.toml.                             │
   │ envdir           Show environment directory path.                            │
   │ jars             Show all JAR paths (classpath + module-path).               │
@@ -15,8 +15,10 @@ Test lock --help shows usage.
    Update jgo.lock.toml without building environment.                             
                                                                                   
   ╭─ Options ────────────────────────────────────────────────────────────────────╮
-  │ --check  Check if lock file is up to date                                    │
-  │ --help   Show this message and exit.                                         │
+  │ --check            Check if lock file is up to date                          │
+  │ --platforms  LIST  Lock for these platforms together, e.g.                   │
+  │                    linux-x64,macos-arm64                                     │
+  │ --help             Show this message and exit.                               │
   ╰──────────────────────────────────────────────────────────────────────────────╯
 
 Test lock with existing jgo.toml.
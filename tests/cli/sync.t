@@ -15,8 +15,9 @@ Test sync --help shows usage.
    Resolve dependencies and build environment.                                    
                                                                                   
   ╭─ Options ────────────────────────────────────────────────────────────────────╮
-  │ --force  Force rebuild even if cached                                        │
-  │ --help   Show this message and exit.                                         │
+  │ --force   Force rebuild even if cached                                       │
+  │ --frozen  Install exactly what jgo.lock.toml lists, without resolving        │
+  │ --help    Show this message and exit.                                        │
   ╰──────────────────────────────────────────────────────────────────────────────╯
 
 Test sync with existing jgo.toml.
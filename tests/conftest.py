@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from jgo.util.mvn import ensure_maven_available
+from tests.fixtures.fakerepo import FakeMavenRepository, synthetic_repository
 from tests.fixtures.thicket import DEFAULT_SEED, generate_thicket
 
 
@@ -77,3 +78,33 @@ def m2_repo(tmp_path_factory):
     shutil.copytree(cache_dir, test_repo, dirs_exist_ok=True)
 
     return test_repo
+
+
+@pytest.fixture
+def fake_maven_repo():
+    """
+    Provide an empty fake Maven repository served over local HTTP.
+
+    Returns:
+        FakeMavenRepository: Started repository; add content with add_artifact()
+    """
+    with FakeMavenRepository() as repo:
+        yield repo
+
+
+@pytest.fixture(scope="session")
+def synthetic_maven_repo():
+    """
+    Provide a synthetic 200-artifact Maven repository served over local HTTP.
+
+    The repository is generated once per session with a fixed seed; its root
+    org.fake:root:1.0 depends (transitively) on all other artifacts. Requests
+    accumulate across tests, so compare request counts before and after.
+    It is kept small for the unit tests; benchmarks can generate larger ones
+    with synthetic_repository().
+
+    Returns:
+        FakeMavenRepository: Started repository
+    """
+    with synthetic_repository(200) as repo:
+        yield repo
@@ -0,0 +1,17 @@
+"""
+In-process fake Maven repository served over HTTP.
+
+Serves a synthetic repository from memory on a local port, so that
+parallelism, retry and caching behaviour of the Maven layer can be tested
+and benchmarked deterministically without network access.
+
+Usage:
+    from tests.fixtures.fakerepo import FakeMavenRepository, synthetic_repository
+
+    with synthetic_repository(1000) as repo:
+        context = MavenContext(remote_repos={"fake": repo.url}, ...)
+"""
+
+from .server import FakeMavenRepository, make_jar, synthetic_repository
+
+__all__ = ["FakeMavenRepository", "make_jar", "synthetic_repository"]
@@ -0,0 +1,296 @@
+"""
+A fake Maven repository: files kept in memory, served by a local HTTP server.
+
+Supports what jgo's transports rely on: GET and HEAD, Range requests (206 and
+416), ETag / If-None-Match (304), plus fault injection: a fixed latency per
+request and connections dropped partway through a body.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import random
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Interface the repository listens on
+_HOST = "127.0.0.1"
+
+POM_TEMPLATE = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <modelVersion>4.0.0</modelVersion>
+  <groupId>{groupId}</groupId>
+  <artifactId>{artifactId}</artifactId>
+  <version>{version}</version>
+  <dependencies>
+{dependencies}
+  </dependencies>
+</project>
+"""
+
+DEPENDENCY_TEMPLATE = """\
+    <dependency>
+      <groupId>{groupId}</groupId>
+      <artifactId>{artifactId}</artifactId>
+      <version>{version}</version>
+    </dependency>"""
+
+METADATA_TEMPLATE = """\
+<?xml version="1.0" encoding="UTF-8"?>
+<metadata>
+  <groupId>{groupId}</groupId>
+  <artifactId>{artifactId}</artifactId>
+  <versioning>
+    <release>{release}</release>
+    <latest>{release}</latest>
+    <versions>
+{versions}
+    </versions>
+  </versioning>
+</metadata>
+"""
+
+
+def make_jar(size: int, rng: random.Random) -> bytes:
+    """Build a valid JAR of roughly the given size, padded with random bytes."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as jar:
+        jar.writestr("META-INF/MANIFEST.MF", "Manifest-Version: 1.0\n")
+        jar.writestr("pad.bin", rng.randbytes(max(0, size - 200)))
+    return buffer.getvalue()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    server_version = "FakeMaven/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_HEAD(self):
+        self._serve(body=False)
+
+    def do_GET(self):
+        self._serve(body=True)
+
+    def _serve(self, body: bool):
+        repo = self.server.repo
+        path = self.path.lstrip("/")
+        repo._record(self.command, path, dict(self.headers))
+        if repo.latency:
+            time.sleep(repo.latency)
+
+        content = repo.files.get(path)
+        if content is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and range_header.startswith("bytes="):
+            start = int(range_header[6:].split("-")[0])
+            if start >= len(content):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(content)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}"
+            )
+        else:
+            self.send_response(200)
+        payload = content[start:]
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        if not body:
+            return
+
+        cut = repo._take_interruption(path) if self.command == "GET" else None
+        if cut is not None:
+            # Drop the connection partway through the body
+            self.wfile.write(payload[:cut])
+            self.close_connection = True
+            return
+        self.wfile.write(payload)
+
+
+class _Server(ThreadingHTTPServer):
+    repo: FakeMavenRepository
+    daemon_threads = True
+    # Room for many simultaneous connections; the default backlog of 5 makes
+    # bursts of connections wait for SYN retransmission
+    request_queue_size = 256
+
+
+class FakeMavenRepository:
+    """
+    A Maven repository held in memory and served from a local HTTP server.
+
+    Use as a context manager, or call start() and stop().
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Create an empty repository.
+
+        Args:
+            latency: Seconds each request waits before it is answered
+        """
+        self.files: dict[str, bytes] = {}
+        self.latency = latency
+        self.requests: list[tuple[str, str, dict]] = []
+        self._interruptions: dict[str, list[int]] = {}
+        self._versions: dict[tuple[str, str], list[str]] = {}
+        self._lock = threading.Lock()
+        self._server: _Server | None = None
+        self._thread: threading.Thread | None = None
+
+    # -- Content --
+
+    def add_file(self, path: str, content: bytes) -> None:
+        """Serve content at path, along with its .sha1 checksum."""
+        self.files[path] = content
+        self.files[f"{path}.sha1"] = hashlib.sha1(content).hexdigest().encode()
+
+    def add_artifact(
+        self,
+        groupId: str,
+        artifactId: str,
+        version: str,
+        dependencies=(),
+        jar: bytes = b"",
+    ) -> None:
+        """
+        Publish a component: its POM, JAR and maven-metadata.xml.
+
+        Args:
+            groupId, artifactId, version: Coordinates of the component
+            dependencies: (groupId, artifactId, version) triples it depends on
+            jar: Content of its JAR
+        """
+        prefix = f"{groupId.replace('.', '/')}/{artifactId}"
+        base = f"{prefix}/{version}/{artifactId}-{version}"
+        deps = "\n".join(
+            DEPENDENCY_TEMPLATE.format(groupId=g, artifactId=a, version=v)
+            for g, a, v in dependencies
+        )
+        pom = POM_TEMPLATE.format(
+            groupId=groupId, artifactId=artifactId, version=version, dependencies=deps
+        )
+        self.add_file(f"{base}.pom", pom.encode())
+        self.add_file(f"{base}.jar", jar)
+
+        versions = self._versions.setdefault((groupId, artifactId), [])
+        versions.append(version)
+        metadata = METADATA_TEMPLATE.format(
+            groupId=groupId,
+            artifactId=artifactId,
+            release=version,
+            versions="\n".join(f"      <version>{v}</version>" for v in versions),
+        )
+        self.add_file(f"{prefix}/maven-metadata.xml", metadata.encode())
+
+    def interrupt(self, path: str, after: int, times: int = 1) -> None:
+        """Make the next GETs of path drop the connection after some bytes."""
+        self._interruptions.setdefault(path, []).extend([after] * times)
+
+    # -- Inspection --
+
+    def count(self, method: str | None = None, suffix: str = "") -> int:
+        """Count the requests received, optionally by method and path suffix."""
+        with self._lock:
+            return sum(
+                1
+                for m, path, _ in self.requests
+                if (method is None or m == method) and path.endswith(suffix)
+            )
+
+    def _record(self, method: str, path: str, headers: dict) -> None:
+        with self._lock:
+            self.requests.append((method, path, headers))
+
+    def _take_interruption(self, path: str) -> int | None:
+        with self._lock:
+            cuts = self._interruptions.get(path)
+            return cuts.pop(0) if cuts else None
+
+    # -- Server --
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running repository."""
+        assert self._server is not None, "repository is not started"
+        return f"http://{_HOST}:{self._server.server_port}"
+
+    def start(self) -> FakeMavenRepository:
+        server = _Server((_HOST, 0), _Handler)
+        server.repo = self
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def synthetic_repository(
+    count: int = 1000,
+    seed: int = 42,
+    fanout: int = 3,
+    latency: float = 0.0,
+) -> FakeMavenRepository:
+    """
+    Generate a repository of count artifacts forming a random dependency DAG.
+
+    Artifacts are org.fake.g<i % 20>:artifact<i>:1.0; each depends on up to
+    fanout artifacts with lower indices. org.fake:root:1.0 depends on every
+    artifact nothing else depends on, so its dependency closure is the whole
+    repository. JARs are mostly a few KiB, with every 50th one 256 KiB.
+
+    Args:
+        count: Number of artifacts (besides the root)
+        seed: Random seed, for reproducible repositories
+        fanout: Maximum number of dependencies per artifact
+        latency: Seconds each request waits before it is answered
+
+    Returns:
+        The repository (not started yet)
+    """
+    rng = random.Random(seed)
+    repo = FakeMavenRepository(latency=latency)
+    coords = [(f"org.fake.g{i % 20}", f"artifact{i}", "1.0") for i in range(count)]
+    depended_on = set()
+    for i, (g, a, v) in enumerate(coords):
+        deps = sorted(set(rng.sample(range(i), min(i, rng.randint(0, fanout)))))
+        depended_on.update(deps)
+        size = 256 * 1024 if i % 50 == 49 else rng.randint(512, 8 * 1024)
+        repo.add_artifact(g, a, v, [coords[j] for j in deps], jar=make_jar(size, rng))
+    roots = [coords[i] for i in range(count) if i not in depended_on]
+    repo.add_artifact("org.fake", "root", "1.0", roots, jar=make_jar(512, rng))
+    return repo
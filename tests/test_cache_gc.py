@@ -0,0 +1,222 @@
+"""
+Tests for garbage collection of the jgo cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import subprocess
+import sys
+import time
+
+from jgo.env import Environment, JarStore, collect_garbage
+from jgo.env._collect import TRASH_DIR, format_size
+from jgo.util.locks import file_lock
+
+NOW = 1_000_000_000.0
+DAY = 24 * 60 * 60
+
+
+def make_env(cache_dir, name, size, last_used, jars=("lib-1.0.jar",)):
+    """Create an environment of size bytes per JAR, last used at last_used."""
+    env = Environment(cache_dir / "envs" / "org" / "example" / name / "0123abcd")
+    env.jars_dir.mkdir(parents=True)
+    lines = ["[metadata]", 'link_strategy = "HARD"', ""]
+    for jar in jars:
+        (env.jars_dir / jar).write_bytes(b"x" * size)
+        artifact_id, version = jar[: -len(".jar")].rsplit("-", 1)
+        lines += [
+            "[[dependencies]]",
+            'groupId = "org.example"',
+            f'artifactId = "{artifact_id}"',
+            f'version = "{version}"',
+            f'filename = "{jar}"',
+            "",
+        ]
+    env.lock_path.write_text("\n".join(lines))
+    env.touch()
+    os.utime(env.last_used_path, (last_used, last_used))
+    return env
+
+
+def make_metadata(cache_dir, artifact_id, version):
+    entry = (
+        cache_dir
+        / "info"
+        / "org"
+        / "example"
+        / artifact_id
+        / version
+        / f"{artifact_id}-{version}.jar.json"
+    )
+    entry.parent.mkdir(parents=True)
+    entry.write_text("{}")
+    return entry
+
+
+def test_evicts_least_recently_used(tmp_path):
+    """Environments are removed oldest first until the cache fits the budget."""
+    old = make_env(tmp_path, "old", 1000, NOW - 3 * DAY)
+    middle = make_env(tmp_path, "middle", 1000, NOW - 2 * DAY)
+    new = make_env(tmp_path, "new", 1000, NOW - DAY)
+
+    report = collect_garbage(tmp_path, max_size=2500, now=NOW)
+
+    assert [e.path for e in report.removed] == [old.path]
+    assert not old.path.exists()
+    assert middle.path.exists() and new.path.exists()
+    assert report.reclaimed_bytes >= 1000
+    # Empty parent directories go too, and nothing is left in the trash
+    assert not old.path.parent.exists()
+    assert not any((tmp_path / TRASH_DIR).iterdir())
+
+
+def test_max_age(tmp_path):
+    old = make_env(tmp_path, "old", 10, NOW - 40 * DAY)
+    new = make_env(tmp_path, "new", 10, NOW - 10 * DAY)
+
+    report = collect_garbage(tmp_path, max_age=30 * DAY, now=NOW)
+
+    assert [e.path for e in report.removed] == [old.path]
+    assert new.path.exists()
+
+
+def test_hard_linked_jars_do_not_count(tmp_path):
+    """JARs shared with another environment free nothing when removed."""
+    a = make_env(tmp_path, "a", 1000, NOW - 2 * DAY)
+    b = Environment(tmp_path / "envs" / "org" / "example" / "b" / "0123abcd")
+    b.jars_dir.mkdir(parents=True)
+    os.link(a.jars_dir / "lib-1.0.jar", b.jars_dir / "lib-1.0.jar")
+
+    report = collect_garbage(tmp_path, dry_run=True, now=NOW)
+
+    assert all(e.size < 1000 for e in report.kept)
+
+
+def test_grace_period(tmp_path):
+    """A recently used environment is kept even when over budget."""
+    env = make_env(tmp_path, "recent", 1000, NOW - 60)
+
+    report = collect_garbage(tmp_path, max_size=0, grace_period=600, now=NOW)
+
+    assert report.removed == []
+    assert [e.path for e in report.in_use] == [env.path]
+    assert env.path.exists()
+
+
+def test_leased_environment_is_kept(tmp_path):
+    """An environment with a live lease (e.g. a running JVM) is never removed."""
+    env = make_env(tmp_path, "running", 1000, NOW - 3 * DAY)
+
+    with env.lease():
+        report = collect_garbage(tmp_path, max_size=0, now=NOW)
+        assert report.removed == []
+        assert env.path.exists()
+
+    # Once the lease is released, the environment can go
+    report = collect_garbage(tmp_path, max_size=0, now=NOW)
+    assert [e.path for e in report.removed] == [env.path]
+
+
+def test_lease_of_another_process(tmp_path):
+    env = make_env(tmp_path, "running", 1000, NOW - 3 * DAY)
+    code = (
+        "import sys, pathlib\n"
+        "from jgo.env import Environment\n"
+        "with Environment(pathlib.Path(sys.argv[1])).lease():\n"
+        "    print('ready', flush=True)\n"
+        "    sys.stdin.read()\n"
+    )
+    child = subprocess.Popen(
+        [sys.executable, "-c", code, str(env.path)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert child.stdout.readline().strip() == "ready"
+        report = collect_garbage(tmp_path, max_size=0, now=NOW)
+        assert report.removed == []
+        assert env.path.exists()
+    finally:
+        child.communicate("")
+
+    report = collect_garbage(tmp_path, max_size=0, now=NOW)
+    assert [e.path for e in report.removed] == [env.path]
+
+
+def test_environment_being_built_is_kept(tmp_path):
+    env = make_env(tmp_path, "building", 1000, NOW - 3 * DAY)
+
+    with file_lock(env.build_lock_path):
+        report = collect_garbage(tmp_path, max_size=0, now=NOW)
+
+    assert report.removed == []
+    assert env.path.exists()
+
+
+def test_orphaned_metadata(tmp_path):
+    make_env(tmp_path, "kept", 10, NOW - DAY, jars=("kept-1.0.jar",))
+    make_env(tmp_path, "gone", 10, NOW - 40 * DAY, jars=("gone-1.0.jar",))
+    kept_info = make_metadata(tmp_path, "kept", "1.0")
+    gone_info = make_metadata(tmp_path, "gone", "1.0")
+    orphan_info = make_metadata(tmp_path, "orphan", "2.0")
+
+    report = collect_garbage(tmp_path, max_age=30 * DAY, now=NOW)
+
+    assert report.metadata_removed == 2
+    assert kept_info.exists()
+    assert not gone_info.exists()
+    assert not orphan_info.exists()
+    assert not (tmp_path / "info" / "org" / "example" / "orphan").exists()
+
+
+def test_dry_run(tmp_path):
+    env = make_env(tmp_path, "old", 1000, NOW - 40 * DAY)
+    info = make_metadata(tmp_path, "lib", "1.0")
+
+    report = collect_garbage(tmp_path, max_age=30 * DAY, dry_run=True, now=NOW)
+
+    assert [e.path for e in report.removed] == [env.path]
+    assert report.metadata_removed == 1
+    assert env.path.exists()
+    assert info.exists()
+
+
+def test_last_used_is_touched(tmp_path):
+    env = make_env(tmp_path, "env", 10, NOW - DAY)
+    before = env.last_used_path.stat().st_mtime
+    env.touch()
+    assert env.last_used_path.stat().st_mtime > before
+    assert env.last_used_path.stat().st_mtime >= time.time() - 60
+
+
+def test_format_size():
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KiB"
+    assert format_size(3 * 1024**3) == "3.0 GiB"
+
+
+def test_jar_store(tmp_path):
+    """Stored JARs count towards the environments using them, and are pruned."""
+    store = JarStore.for_cache(tmp_path)
+    source = tmp_path / "lib-1.0.jar"
+    source.write_bytes(b"x" * 1000)
+    sha256 = hashlib.sha256(source.read_bytes()).hexdigest()
+    unused = tmp_path / "unused.jar"
+    unused.write_bytes(b"y" * 10)
+    store.add(unused, hashlib.sha256(b"y" * 10).hexdigest())
+
+    old = Environment(tmp_path / "envs" / "org" / "example" / "old" / "0123abcd")
+    old.jars_dir.mkdir(parents=True)
+    assert store.link(source, sha256, old.jars_dir / source.name)
+    os.utime(old.path, (NOW - 3 * DAY, NOW - 3 * DAY))
+
+    report = collect_garbage(tmp_path, max_size=500, now=NOW)
+
+    assert [e.path for e in report.removed] == [old.path]
+    assert report.removed[0].size == 1000
+    assert report.store_removed == 2
+    assert report.reclaimed_bytes == 1010
+    assert store.stats().jars == 0
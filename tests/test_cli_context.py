@@ -1,13 +1,21 @@
 from unittest.mock import MagicMock
 
+import pytest
+
 from jgo.cli._args import (
     PLATFORM_ALIASES,
     PLATFORMS,
     build_parsed_args,
     detect_os_properties,
     expand_platform,
+    platform_names,
+)
+from jgo.cli._context import (
+    create_maven_context,
+    create_profile_constraints,
+    find_lock_file,
+    lock_file_path,
 )
-from jgo.cli._context import create_maven_context
 from jgo.maven._resolver import PythonResolver
 
 
@@ -61,6 +69,79 @@ def test_create_maven_context_auto_resolver_constraints():
     assert constraints.os_family is None
 
 
+def test_create_maven_context_download_settings():
+    args = MagicMock()
+    args.resolver = "python"
+    args.properties = {}
+    args.repo_cache = None
+    args.repositories = {}
+    args.max_downloads = None
+    args.rate_limit = "2M"
+
+    config = {"max_downloads": 3, "rate_limit": "1M", "large_file_size": "1M"}
+
+    resolver = create_maven_context(args, config).resolver
+
+    assert isinstance(resolver, PythonResolver)
+    assert resolver.max_downloads == 3
+    # Command line options override the settings
+    assert resolver.rate_limiter is not None
+    assert resolver.rate_limiter.rate == 2 * 1024 * 1024
+    assert resolver.large_file_size == 1024 * 1024
+
+
+def test_create_profile_constraints_for_platform():
+    args = MagicMock()
+    args.java_version = 21
+    args.os_name = "Linux"
+    args.os_family = "unix"
+    args.os_arch = "amd64"
+    args.os_version = "6.1"
+    args.properties = {"foo": "bar"}
+    args.lenient = False
+
+    constraints = create_profile_constraints(args, "macos-arm64")
+
+    assert constraints.jdk == "21"
+    assert constraints.os_name == "Mac OS X"
+    assert constraints.os_family == "mac"
+    assert constraints.os_arch == "aarch64"
+    assert constraints.os_version is None
+    assert constraints.properties == {"foo": "bar"}
+
+    host_arch = detect_os_properties()[2]
+    assert create_profile_constraints(args, "linux").os_arch == host_arch
+    with pytest.raises(ValueError):
+        create_profile_constraints(args, "plan9")
+
+
+def test_find_lock_file_for_platform(tmp_path):
+    spec_file = tmp_path / "jgo.toml"
+    args = MagicMock()
+    args.os_name = "Linux"
+    args.os_arch = "aarch64"
+
+    assert find_lock_file(args, spec_file) == tmp_path / "jgo.lock.toml"
+
+    # Lock files of other platforms are never taken
+    lock_file_path(spec_file, "linux-x64").touch()
+    lock_file_path(spec_file, "macos-arm64").touch()
+    assert find_lock_file(args, spec_file) == tmp_path / "jgo.lock.toml"
+
+    lock_file_path(spec_file, "linux-arm64").touch()
+    assert find_lock_file(args, spec_file) == tmp_path / "jgo.lock.linux-arm64.toml"
+
+
+def test_platform_names():
+    host_arch = detect_os_properties()[2]
+    names = platform_names("Linux", "amd64")
+    assert names[0] == "linux-x64"
+    assert "linux64" in names
+    assert ("linux" in names) == (host_arch == "amd64")
+    assert platform_names("Windows", "x86") == ["windows-x32", "win32"]
+    assert platform_names("Plan 9", "amd64") == []
+
+
 # Platform expansion tests
 
 
@@ -130,3 +130,102 @@ custom_repo = https://custom.example.com/maven2
     assert config.cache_dir == custom_cache_path
     assert "custom_repo" in config.repositories
     assert config.repositories["custom_repo"] == "https://custom.example.com/maven2"
+
+
+def test_update_policies(tmp_path):
+    """Test that metadata update policies are loaded from the config file."""
+    custom_config = tmp_path / "my-custom-config"
+    custom_config.write_text("""[settings]
+update_policy = interval:60
+
+[update_policies]
+scijava = always
+""")
+
+    config = GlobalSettings.load(settings_file=custom_config)
+
+    assert config.update_policy == "interval:60"
+    assert config.update_policies == {"scijava": "always"}
+    assert config.to_dict()["update_policies"] == {"scijava": "always"}
+    assert config.floating_policy is None
+
+
+def test_floating_policy(tmp_path):
+    """Test that the floating version policy is loaded and saved."""
+    custom_config = tmp_path / "my-custom-config"
+    custom_config.write_text("""[settings]
+floating_policy = interval:30
+""")
+
+    config = GlobalSettings.load(settings_file=custom_config)
+    assert config.floating_policy == "interval:30"
+    assert config.to_dict()["floating_policy"] == "interval:30"
+
+    config.save(custom_config)
+    assert "floating_policy = interval:30" in custom_config.read_text()
+
+
+def test_jar_store(tmp_path):
+    """Test that the JAR store setting is loaded, validated and saved."""
+    import pytest
+
+    custom_config = tmp_path / "my-custom-config"
+    custom_config.write_text("""[settings]
+jar_store = yes
+""")
+
+    config = GlobalSettings.load(settings_file=custom_config)
+    assert config.jar_store is True
+    assert config.to_dict()["jar_store"] is True
+
+    config.save(custom_config)
+    assert "jar_store = true" in custom_config.read_text()
+
+    config.set_setting("jar_store", "off")
+    assert config.jar_store is False
+    with pytest.raises(ValueError):
+        config.set_setting("jar_store", "sometimes")
+
+
+def test_download_settings(tmp_path):
+    """Test that the download scheduling settings are loaded and saved."""
+    import pytest
+
+    custom_config = tmp_path / "my-custom-config"
+    custom_config.write_text("""[settings]
+max_downloads = 4
+rate_limit = 10M
+large_file_size = lots
+""")
+
+    config = GlobalSettings.load(settings_file=custom_config)
+    assert config.max_downloads == 4
+    assert config.to_dict()["rate_limit"] == "10M"
+    # Invalid sizes are ignored
+    assert config.large_file_size is None
+
+    config.set_setting("large_file_size", "1M")
+    config.save(custom_config)
+    assert "large_file_size = 1M" in custom_config.read_text()
+    with pytest.raises(ValueError):
+        config.set_setting("rate_limit", "fast")
+
+    config.unset_setting("max_downloads")
+    assert config.max_downloads is None
+
+
+def test_routes(tmp_path):
+    """Test that groupId routes are loaded from the config file."""
+    custom_config = tmp_path / "my-custom-config"
+    custom_config.write_text("""[routes]
+org.scijava.* = scijava
+com.mycorp.* = internal, central
+""")
+
+    config = GlobalSettings.load(settings_file=custom_config)
+
+    assert config.routes == {
+        "org.scijava.*": "scijava",
+        "com.mycorp.*": "internal, central",
+    }
+    assert config.to_dict()["routes"] == config.routes
@@ -6,7 +6,15 @@ Unit tests for the Environment layer.
 import tempfile
 from pathlib import Path
 
-from jgo.env import Environment, EnvironmentBuilder, LinkStrategy, LockFile
+import pytest
+
+from jgo.env import (
+    Environment,
+    EnvironmentBuilder,
+    LinkStrategy,
+    LockedDependency,
+    LockFile,
+)
 from jgo.env._linking import link_file
 from jgo.maven import Dependency, MavenContext
 
@@ -42,6 +50,43 @@ def test_environment_classpath():
         assert classpath[0] == fake_jar
 
 
+def test_environment_ordered_jars():
+    """JARs are listed in lock file (resolution) order, unknown ones last."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env_path = Path(tmp_dir) / "test_env"
+        jars_dir = env_path / "jars"
+        modules_dir = env_path / "modules"
+        jars_dir.mkdir(parents=True)
+        modules_dir.mkdir()
+        for name in ("a-1.0.jar", "z-1.0.jar", "extra.jar"):
+            (jars_dir / name).touch()
+        (modules_dir / "m-1.0.jar").touch()
+
+        LockFile(
+            dependencies=[
+                LockedDependency("g", "z", "1.0", filename="z-1.0.jar"),
+                LockedDependency("g", "m", "1.0", filename="m-1.0.jar"),
+                LockedDependency("g", "a", "1.0", filename="a-1.0.jar"),
+                LockedDependency("g", "gone", "1.0", filename="gone-1.0.jar"),
+            ]
+        ).save(env_path / "jgo.lock.toml")
+
+        env = Environment(env_path)
+        assert [p.name for p in env.ordered_jars()] == [
+            "z-1.0.jar",
+            "m-1.0.jar",
+            "a-1.0.jar",
+            "extra.jar",
+        ]
+        assert [p.name for p in env.ordered_jars([jars_dir])] == [
+            "z-1.0.jar",
+            "a-1.0.jar",
+            "extra.jar",
+        ]
+        # Filenames survive the lock file round trip
+        assert env.lockfile.dependencies[0].filename == "z-1.0.jar"
+
+
 def test_environment_main_class():
     """Test main_class property."""
     with tempfile.TemporaryDirectory() as tmp_dir:
@@ -109,6 +154,7 @@ def test_link_strategy_enum():
     assert LinkStrategy.HARD.value == "hard"
     assert LinkStrategy.SOFT.value == "soft"
     assert LinkStrategy.COPY.value == "copy"
+    assert LinkStrategy.REFLINK.value == "reflink"
     assert LinkStrategy.AUTO.value == "auto"
 
 
@@ -132,6 +178,103 @@ def test_link_file():
             pass
 
 
+def test_reflink(tmp_path):
+    """REFLINK clones or fails cleanly; COPY and AUTO fall back when it fails."""
+    source = tmp_path / "source.jar"
+    source.write_bytes(b"content" * 1000)
+
+    clone = tmp_path / "clone.jar"
+    try:
+        link_file(source, clone, LinkStrategy.REFLINK)
+    except OSError:
+        # Filesystem without reflink support: nothing is left behind
+        assert not clone.exists()
+    else:
+        assert clone.read_bytes() == source.read_bytes()
+        assert clone.stat().st_ino != source.stat().st_ino
+
+    copy = tmp_path / "copy.jar"
+    link_file(source, copy, LinkStrategy.COPY)
+    assert copy.read_bytes() == source.read_bytes()
+    assert copy.stat().st_ino != source.stat().st_ino
+
+
+def test_link_strategies_benchmark(tmp_path):
+    """Time linking a 300-JAR environment with each link strategy."""
+    import random
+    import time
+
+    from jgo.env._linking import reflink
+    from tests.fixtures.fakerepo import make_jar
+
+    rng = random.Random(0)
+    repo = tmp_path / "m2"
+    repo.mkdir()
+    sources = []
+    for i in range(300):
+        # Mostly small JARs, with every 50th one 1 MiB
+        size = 1024 * 1024 if i % 50 == 49 else rng.randint(4 * 1024, 64 * 1024)
+        source = repo / f"lib{i}-1.0.jar"
+        source.write_bytes(make_jar(size, rng))
+        sources.append(source)
+
+    try:
+        reflink(sources[0], tmp_path / "probe.jar")
+        reflinks = True
+    except OSError:
+        reflinks = False
+
+    timings = {}
+    for strategy in LinkStrategy:
+        if strategy == LinkStrategy.REFLINK and not reflinks:
+            continue
+        env = tmp_path / strategy.value
+        env.mkdir()
+        start = time.perf_counter()
+        for source in sources:
+            link_file(source, env / source.name, strategy)
+        timings[strategy.value] = time.perf_counter() - start
+        assert len(list(env.iterdir())) == len(sources)
+        assert (env / sources[-1].name).read_bytes() == sources[-1].read_bytes()
+
+    print(f"\nLinking 300 JARs{'' if reflinks else ' (no reflink support)'}:")
+    for name, elapsed in timings.items():
+        print(f"  {name:8} {elapsed * 1000:8.1f} ms")
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_link_files(tmp_path, workers):
+    """Links are created and stale entries removed in one batch."""
+    from jgo.env._linking import link_files
+
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    sources = []
+    for i in range(20):
+        source = repo / f"lib{i}.jar"
+        source.write_bytes(str(i).encode())
+        sources.append(source)
+    env = tmp_path / "env"
+    env.mkdir()
+    (env / "stale.jar").write_bytes(b"stale")
+    (env / "lib0.jar").write_bytes(b"outdated")
+
+    link_files(
+        [(source, env / source.name) for source in sources],
+        LinkStrategy.HARD,
+        remove=[env / "stale.jar", env / "lib0.jar"],
+        workers=workers,
+    )
+
+    assert sorted(p.name for p in env.iterdir()) == sorted(s.name for s in sources)
+    assert (env / "lib0.jar").read_bytes() == b"0"
+    assert (env / "lib7.jar").stat().st_ino == sources[7].stat().st_ino
+
+    # Errors surface from worker threads too
+    with pytest.raises(FileExistsError):
+        link_files([(sources[1], env / "lib1.jar")], LinkStrategy.HARD, workers=workers)
+
+
 def test_environment_min_java_version():
     """Test min_java_version property with bytecode detection."""
     import struct
@@ -324,3 +467,375 @@ def test_lockfile_staleness_detection():
         finally:
             # Ensure we change back to original directory before temp cleanup
             os.chdir(original_cwd)
+
+
+def test_incremental_rebuild(fake_maven_repo, tmp_path, monkeypatch):
+    """Rebuilding from a lockfile relinks only the JARs that changed."""
+    import random
+
+    import jgo.env._builder as builder_module
+    from jgo.parse import Coordinate
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    hashed = []
+    compute_sha256 = builder_module.compute_sha256
+
+    def counting_sha256(path):
+        hashed.append(path.name)
+        return compute_sha256(path)
+
+    monkeypatch.setattr(builder_module, "compute_sha256", counting_sha256)
+
+    rng = random.Random(0)
+    for name in ("kept", "dropped", "added"):
+        fake_maven_repo.add_artifact(
+            "org.example", name, "1.0", jar=make_jar(1024, rng)
+        )
+    maven = MavenContext(
+        repo_cache=tmp_path / "m2", remote_repos={"fake": fake_maven_repo.url}
+    )
+    builder = EnvironmentBuilder(
+        context=maven,
+        cache_dir=tmp_path / "cache",
+        link_strategy=LinkStrategy.COPY,
+        link_workers=4,
+    )
+    env = Environment(tmp_path / "env")
+
+    def build(*names):
+        coords = [Coordinate.parse(f"org.example:{n}:1.0") for n in names]
+        deps = builder._coordinates_to_dependencies(coords)
+        locked, _ = builder._build_environment(env, deps, None)
+        LockFile(dependencies=locked, link_strategy="COPY").save(env.lock_path)
+        env._lockfile = None
+        return sorted(p.name for p in env.path.glob("*/*.jar"))
+
+    assert build("kept", "dropped") == ["dropped-1.0.jar", "kept-1.0.jar"]
+    kept = env.path / "jars" / "kept-1.0.jar"
+    kept_inode = kept.stat().st_ino
+
+    # JARs not in the new resolution go, whoever put them there
+    (env.path / "modules" / "stray.jar").write_bytes(b"")
+    hashed.clear()
+    assert build("kept", "added") == ["added-1.0.jar", "kept-1.0.jar"]
+    assert hashed == ["added-1.0.jar"]
+    assert kept.stat().st_ino == kept_inode
+    locked = {dep.artifactId: dep for dep in env.lockfile.dependencies}
+    assert locked["kept"].sha256 and locked["added"].sha256
+
+    # A different link strategy starts over
+    builder.link_strategy = LinkStrategy.HARD
+    hashed.clear()
+    build("kept", "added")
+    assert sorted(hashed) == ["added-1.0.jar", "kept-1.0.jar"]
+
+
+def test_duplicate_class_warning(fake_maven_repo, tmp_path, monkeypatch, caplog):
+    """Shadowed classes are reported when the class-path JARs change."""
+    import io
+    import zipfile
+
+    import jgo.env._builder as builder_module
+    from jgo.parse import Coordinate
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    for name in ("first", "second", "other"):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as jar:
+            jar.writestr("com/example/Shared.class", b"\xca\xfe\xba\xbe")
+            jar.writestr(f"com/example/{name}/Own.class", b"\xca\xfe\xba\xbe")
+        fake_maven_repo.add_artifact("org.example", name, "1.0", jar=buffer.getvalue())
+    maven = MavenContext(
+        repo_cache=tmp_path / "m2", remote_repos={"fake": fake_maven_repo.url}
+    )
+    builder = EnvironmentBuilder(context=maven, cache_dir=tmp_path / "cache")
+    env = Environment(tmp_path / "env")
+
+    def build(*names):
+        caplog.clear()
+        coords = [Coordinate.parse(f"org.example:{n}:1.0") for n in names]
+        deps = builder._coordinates_to_dependencies(coords)
+        locked, _ = builder._build_environment(env, deps, None)
+        LockFile(dependencies=locked, link_strategy="AUTO").save(env.lock_path)
+        env._lockfile = None
+        return [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+
+    assert build("first", "second") == [
+        (
+            "1 duplicate classes in second-1.0.jar are shadowed by first-1.0.jar "
+            "(e.g. com.example.Shared)"
+        )
+    ]
+    # An unchanged class-path is not checked again
+    assert build("first", "second") == []
+    assert len(build("first", "other")) == 1
+
+
+def test_staged_build(fake_maven_repo, tmp_path, monkeypatch):
+    """Builds are staged and swapped in; a failed build leaves no trace."""
+    import random
+
+    import jgo.env._builder as builder_module
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    jar = make_jar(1024, random.Random(0))
+    fake_maven_repo.add_artifact("org.example", "app", "1.0", jar=jar)
+    maven = MavenContext(
+        repo_cache=tmp_path / "m2", remote_repos={"fake": fake_maven_repo.url}
+    )
+    builder = EnvironmentBuilder(context=maven, cache_dir=tmp_path / "cache")
+
+    env = builder.from_endpoint("org.example:app:1.0")
+    assert [jar.name for jar in env.classpath] == ["app-1.0.jar"]
+    assert env.lockfile is not None
+    assert not env.staging_path.exists()
+    assert builder._is_environment_valid(env, update=False)
+
+    # A rebuild that fails midway leaves the environment as it was
+    def failing_build(environment, dependencies, main_class):
+        (environment.jars_dir / "app-1.0.jar").unlink()
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(builder, "_build_environment", failing_build)
+    with pytest.raises(KeyboardInterrupt):
+        builder.from_endpoint("org.example:app:1.0", update=True)
+    assert [jar.name for jar in env.classpath] == ["app-1.0.jar"]
+    assert env.lock_path.exists()
+    assert not env.staging_path.exists()
+
+    # Environments missing a JAR listed in the lockfile are rebuilt
+    (env.jars_dir / "app-1.0.jar").rename(env.jars_dir / "other.jar")
+    assert not builder._is_environment_valid(Environment(env.path), update=False)
+
+
+def test_environment_manifest(fake_maven_repo, tmp_path, monkeypatch):
+    """Cached environments are checked against the manifest written at build."""
+    import random
+
+    import jgo.env._builder as builder_module
+    from jgo.env._manifest import check_manifest
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    rng = random.Random(0)
+    fake_maven_repo.add_artifact("org.example", "app", "1.0", jar=make_jar(1024, rng))
+    maven = MavenContext(
+        repo_cache=tmp_path / "m2", remote_repos={"fake": fake_maven_repo.url}
+    )
+    builder = EnvironmentBuilder(
+        context=maven, cache_dir=tmp_path / "cache", link_strategy=LinkStrategy.SOFT
+    )
+    env = builder.from_endpoint("org.example:app:1.0")
+    assert env.manifest_path.exists()
+    assert check_manifest(env) is True
+    assert builder._is_environment_valid(env, update=False)
+
+    # A lockfile from another link strategy does not match
+    builder.link_strategy = LinkStrategy.COPY
+    assert not builder._is_environment_valid(env, update=False)
+    builder.link_strategy = LinkStrategy.SOFT
+
+    # An extra JAR, or a lockfile edited since the build, invalidate it
+    (env.jars_dir / "extra.jar").write_bytes(b"")
+    assert check_manifest(env) is False
+    (env.jars_dir / "extra.jar").unlink()
+    assert check_manifest(env) is True
+    env.lock_path.write_text(env.lock_path.read_text() + "\n")
+    assert check_manifest(env) is False
+
+    # So does a symlinked JAR whose target was removed from the Maven cache
+    env = builder.from_endpoint("org.example:app:1.0", update=True)
+    assert check_manifest(env) is True
+    (env.jars_dir / "app-1.0.jar").resolve().unlink()
+    assert not builder._is_environment_valid(env, update=False)
+
+
+def test_manifest_edited_spec(fake_maven_repo, tmp_path, monkeypatch):
+    """A project environment with a manifest is rebuilt once jgo.toml changes."""
+    import random
+
+    import jgo.env._builder as builder_module
+    from jgo.env import EnvironmentSpec
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    monkeypatch.chdir(tmp_path)
+    rng = random.Random(0)
+    fake_maven_repo.add_artifact("org.example", "app", "1.0", jar=make_jar(512, rng))
+    fake_maven_repo.add_artifact("org.example", "lib", "1.0", jar=make_jar(512, rng))
+    maven = MavenContext(
+        repo_cache=tmp_path / "m2", remote_repos={"fake": fake_maven_repo.url}
+    )
+    builder = EnvironmentBuilder(context=maven, cache_dir=tmp_path / ".jgo")
+
+    spec = EnvironmentSpec(name="project", coordinates=["org.example:app:1.0"])
+    spec.save(tmp_path / "jgo.toml")
+    env = builder.from_spec(spec)
+    assert env.manifest_path.exists()
+    assert builder._is_environment_valid(env, update=False, check_staleness=True)
+
+    spec.coordinates.append("org.example:lib:1.0")
+    spec.save(tmp_path / "jgo.toml")
+    assert not builder._is_environment_valid(env, update=False, check_staleness=True)
+    env = builder.from_spec(spec)
+    assert sorted(jar.name for jar in env.classpath) == ["app-1.0.jar", "lib-1.0.jar"]
+
+
+def test_jar_store(fake_maven_repo, tmp_path, monkeypatch):
+    """With a JAR store, environments share one copy of each JAR."""
+    import random
+    import shutil
+
+    import jgo.env._builder as builder_module
+    from jgo.env import JarStore
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    rng = random.Random(0)
+    lib = ("org.example", "lib", "1.0")
+    fake_maven_repo.add_artifact(*lib, jar=make_jar(4096, rng))
+    for name in ("one", "two", "three"):
+        fake_maven_repo.add_artifact(
+            "org.example", name, "1.0", [lib], jar=make_jar(1024, rng)
+        )
+    maven = MavenContext(
+        repo_cache=tmp_path / "m2", remote_repos={"fake": fake_maven_repo.url}
+    )
+    store = JarStore.for_cache(tmp_path / "cache")
+    builder = EnvironmentBuilder(
+        context=maven,
+        cache_dir=tmp_path / "cache",
+        link_strategy=LinkStrategy.COPY,
+        jar_store=store,
+    )
+
+    one = builder.from_endpoint("org.example:one:1.0")
+    two = builder.from_endpoint("org.example:two:1.0")
+    lib_inode = (one.jars_dir / "lib-1.0.jar").stat().st_ino
+    assert (two.jars_dir / "lib-1.0.jar").stat().st_ino == lib_inode
+    sha256 = {dep.artifactId: dep.sha256 for dep in one.lockfile.dependencies}
+    assert store.path_for(sha256["lib"]).stat().st_ino == lib_inode
+
+    stats = store.stats()
+    assert stats.jars == 3
+    assert stats.links == 4
+    assert stats.saved_bytes == (one.jars_dir / "lib-1.0.jar").stat().st_size
+
+    # The store outlives the local Maven repository
+    shutil.rmtree(tmp_path / "m2")
+    three = builder.from_endpoint("org.example:three:1.0")
+    assert (three.jars_dir / "lib-1.0.jar").stat().st_ino == lib_inode
+    assert store.stats().jars == 4
+
+
+def test_resolve_lockfiles(tmp_path, monkeypatch):
+    """One resolution pass yields a lockfile per platform, with its natives."""
+    import random
+
+    import jgo.env._builder as builder_module
+    from jgo.env import EnvironmentSpec
+    from jgo.maven import ProfileConstraints
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    monkeypatch.chdir(tmp_path)
+    rng = random.Random(0)
+    natives = (
+        "<dependencies><dependency><groupId>org.example</groupId>"
+        "<artifactId>natives</artifactId><version>1.0</version>"
+        "<classifier>natives-${os.arch}</classifier>"
+        "</dependency></dependencies>"
+    )
+    for artifact_id, body, classifiers in (
+        ("app", natives, [""]),
+        ("natives", "", ["natives-amd64", "natives-aarch64"]),
+    ):
+        version_dir = tmp_path / "m2" / "org" / "example" / artifact_id / "1.0"
+        version_dir.mkdir(parents=True)
+        (version_dir / f"{artifact_id}-1.0.pom").write_text(
+            "<project><groupId>org.example</groupId>"
+            f"<artifactId>{artifact_id}</artifactId><version>1.0</version>"
+            f"{body}</project>"
+        )
+        for classifier in classifiers:
+            suffix = f"-{classifier}" if classifier else ""
+            jar = version_dir / f"{artifact_id}-1.0{suffix}.jar"
+            jar.write_bytes(make_jar(256, rng))
+    maven = MavenContext(repo_cache=tmp_path / "m2", remote_repos={})
+    builder = EnvironmentBuilder(context=maven, cache_dir=tmp_path / "cache")
+    spec = EnvironmentSpec(coordinates=["org.example:app:1.0"])
+
+    lockfiles = builder.resolve_lockfiles(
+        spec,
+        {
+            "linux-x64": ProfileConstraints(os_arch="amd64"),
+            "linux-arm64": ProfileConstraints(os_arch="aarch64"),
+        },
+    )
+
+    for name, arch in (("linux-x64", "amd64"), ("linux-arm64", "aarch64")):
+        lockfile = lockfiles[name]
+        assert lockfile.platform == name
+        assert [(dep.artifactId, dep.classifier) for dep in lockfile.dependencies] == [
+            ("app", ""),
+            ("natives", f"natives-{arch}"),
+        ]
+        lockfile.save(tmp_path / f"{name}.toml")
+        assert LockFile.load(tmp_path / f"{name}.toml").platform == name
+
+
+def test_from_lockfile(fake_maven_repo, tmp_path, monkeypatch):
+    """A frozen install links the locked JARs without building any model."""
+    import random
+
+    import jgo.env._builder as builder_module
+    from jgo.env import EnvironmentSpec
+    from jgo.maven import Model
+    from tests.fixtures.fakerepo import make_jar
+
+    monkeypatch.setattr(builder_module, "get_baseline_jar_tool", lambda: None)
+    monkeypatch.chdir(tmp_path)
+    rng = random.Random(0)
+    fake_maven_repo.add_artifact("org.example", "lib", "1.0", jar=make_jar(512, rng))
+    fake_maven_repo.add_artifact(
+        "org.example",
+        "app",
+        "1.0",
+        [("org.example", "lib", "1.0")],
+        jar=make_jar(512, rng),
+    )
+    spec = EnvironmentSpec(coordinates=["org.example:app:1.0"])
+
+    def builder(repo_cache):
+        maven = MavenContext(
+            repo_cache=tmp_path / repo_cache,
+            remote_repos={"fake": fake_maven_repo.url},
+        )
+        return EnvironmentBuilder(context=maven, cache_dir=tmp_path / "cache")
+
+    lockfile = builder("m2").resolve_lockfile(spec)
+
+    # On a fresh machine: only the locked JARs are fetched
+    frozen = builder("m2-ci")
+
+    def no_model(*args, **kwargs):
+        raise AssertionError("Frozen installs build no models")
+
+    monkeypatch.setattr(Model, "__init__", no_model)
+    poms_before = fake_maven_repo.count("GET", ".pom")
+    env = frozen.from_lockfile(spec, lockfile)
+
+    assert sorted(jar.name for jar in env.classpath) == ["app-1.0.jar", "lib-1.0.jar"]
+    assert fake_maven_repo.count("GET", ".pom") == poms_before
+    assert env.lockfile.link_strategy == frozen.link_strategy.name
+    assert frozen.from_lockfile(spec, lockfile).path == env.path
+
+    # A JAR that does not match its checksum is refused
+    lockfile.dependencies[1].sha256 = "0" * 64
+    with pytest.raises(RuntimeError, match="Checksum mismatch"):
+        frozen.from_lockfile(spec, lockfile)
+    lockfile.dependencies[1].sha256 = None
+    with pytest.raises(ValueError, match="no checksum"):
+        frozen.from_lockfile(spec, lockfile)
@@ -2,14 +2,17 @@
 Tests for the execution layer (jgo.exec).
 """
 
+import asyncio
+import os
 import subprocess
 import sys
+import time
 from pathlib import Path
 
 import pytest
 
 from jgo.env import Environment
-from jgo.env._lockfile import LockFile
+from jgo.env._lockfile import LockedDependency, LockFile
 from jgo.exec import JavaLocator, JavaRunner, JavaSource, JVMConfig
 from jgo.util.java import JavaVersion
 
@@ -388,6 +391,246 @@ class TestJavaRunner:
             runner.run(simple_environment, print_command=True)
 
 
+class TestArgfile:
+    """Tests for passing long class-paths via @argfiles."""
+
+    @pytest.fixture
+    def jar_environment(self, tmp_path, monkeypatch):
+        """Create an environment with a few (empty) JARs and a fake Java 17."""
+        monkeypatch.setattr(sys, "platform", "linux")
+        monkeypatch.setattr(
+            JavaLocator, "locate", lambda self, min_version=None: Path("java")
+        )
+        monkeypatch.setattr(
+            JavaLocator, "_get_java_version", lambda self, p: JavaVersion(17, 0, 0)
+        )
+        env_path = tmp_path / "env"
+        jars_dir = env_path / "jars"
+        jars_dir.mkdir(parents=True)
+        for name in ("b.jar", "a.jar"):
+            (jars_dir / name).touch()
+        env = Environment(env_path)
+        LockFile(
+            dependencies=[],
+            entrypoints={"main": "org.example.Main"},
+            default_entrypoint="main",
+        ).save(env.lock_path)
+        return Environment(env_path)
+
+    def test_invalid_mode(self):
+        with pytest.raises(ValueError, match="Invalid argfile mode"):
+            JavaRunner(argfile="sometimes")
+
+    def test_short_classpath_stays_in_argv(self, jar_environment):
+        cmd, _ = JavaRunner()._build_command(jar_environment)
+        assert "-cp" in cmd
+        assert not any(arg.startswith("@") for arg in cmd)
+        assert not jar_environment.argfiles_dir.exists()
+
+    def test_always_writes_argfile(self, jar_environment):
+        cmd, _ = JavaRunner(argfile="always")._build_command(
+            jar_environment, app_args=["x"]
+        )
+        assert "-cp" not in cmd
+        argfile_args = [arg for arg in cmd if arg.startswith("@")]
+        assert len(argfile_args) == 1
+        assert cmd[-2:] == ["org.example.Main", "x"]
+
+        argfile = Path(argfile_args[0][1:])
+        assert argfile.parent == jar_environment.argfiles_dir
+        lines = argfile.read_text().splitlines()
+        jars = jar_environment.jars_dir
+        # Wildcards are expanded, in a stable order
+        assert lines == ['"-cp"', f'"{jars / "a.jar"}:{jars / "b.jar"}"']
+
+    def test_argfile_is_reused(self, jar_environment):
+        runner = JavaRunner(argfile="always")
+        cmd1, _ = runner._build_command(jar_environment)
+        mtime = Path(cmd1[-2][1:]).stat().st_mtime_ns
+        cmd2, _ = runner._build_command(jar_environment)
+        assert cmd1 == cmd2
+        assert Path(cmd2[-2][1:]).stat().st_mtime_ns == mtime
+        assert len(list(jar_environment.argfiles_dir.iterdir())) == 1
+
+    def test_auto_uses_argfile_for_long_classpath(self, jar_environment):
+        extra = [f"/opt/lib/dependency-{i:04d}.jar" for i in range(400)]
+        cmd, _ = JavaRunner()._build_command(
+            jar_environment, additional_classpath=extra
+        )
+        assert "-cp" not in cmd
+        assert any(arg.startswith("@") for arg in cmd)
+
+    def test_never_and_java8_use_argv(self, jar_environment, monkeypatch):
+        extra = [f"/opt/lib/dependency-{i:04d}.jar" for i in range(400)]
+        cmd, _ = JavaRunner(argfile="never")._build_command(
+            jar_environment, additional_classpath=extra
+        )
+        assert "-cp" in cmd
+
+        monkeypatch.setattr(
+            JavaLocator, "_get_java_version", lambda self, p: JavaVersion(8, 0, 0)
+        )
+        cmd, _ = JavaRunner(argfile="always")._build_command(jar_environment)
+        assert "-cp" in cmd
+
+    def test_explicit_classpath_uses_resolution_order(self, jar_environment):
+        LockFile(
+            dependencies=[
+                LockedDependency("g", "b", "1", filename="b.jar"),
+                LockedDependency("g", "a", "1", filename="a.jar"),
+            ],
+            entrypoints={"main": "org.example.Main"},
+            default_entrypoint="main",
+        ).save(jar_environment.lock_path)
+        env = Environment(jar_environment.path)
+
+        cmd, _ = JavaRunner(explicit_classpath=True)._build_command(env)
+        jars = env.jars_dir
+        assert cmd[cmd.index("-cp") + 1] == f"{jars / 'b.jar'}:{jars / 'a.jar'}"
+
+    def test_quoting(self):
+        from jgo.exec._runner import _quote_argfile_arg
+
+        assert _quote_argfile_arg("plain") == '"plain"'
+        assert _quote_argfile_arg("with space") == '"with space"'
+        assert _quote_argfile_arg('C:\\dir\\"x"') == '"C:\\\\dir\\\\\\"x\\""'
+
+
+class TestExecJava:
+    """Tests for replacing the Python process with the JVM."""
+
+    @pytest.fixture
+    def environment(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(
+            JavaLocator, "locate", lambda self, min_version=None: Path("/jdk/java")
+        )
+        monkeypatch.setattr(
+            JavaLocator, "_get_java_version", lambda self, p: JavaVersion(17, 0, 0)
+        )
+        env_path = tmp_path / "env"
+        (env_path / "jars").mkdir(parents=True)
+        (env_path / "jars" / "a.jar").touch()
+        return Environment(env_path)
+
+    @pytest.mark.skipif(os.name != "posix", reason="exec is only used on POSIX")
+    def test_exec_replaces_process(self, environment, monkeypatch):
+        calls = []
+
+        def fake_execvp(file, args):
+            calls.append((file, args))
+            raise SystemExit(0)
+
+        monkeypatch.setattr(os, "execvp", fake_execvp)
+        monkeypatch.setattr(
+            subprocess, "run", lambda *a, **kw: pytest.fail("subprocess used")
+        )
+        with pytest.raises(SystemExit):
+            JavaRunner().run(environment, main_class="Main", exec_java=True)
+
+        assert len(calls) == 1
+        file, args = calls[0]
+        assert file == "/jdk/java"
+        assert args[0] == "/jdk/java"
+        assert args[-1] == "Main"
+
+    def test_exec_not_used_for_dry_run(self, environment, monkeypatch):
+        monkeypatch.setattr(
+            os, "execvp", lambda *a: pytest.fail("exec used for dry run")
+        )
+        result = JavaRunner().run(
+            environment, main_class="Main", exec_java=True, dry_run=True
+        )
+        assert result.returncode == 0
+
+    @pytest.mark.skipif(os.name != "posix", reason="exec is only used on POSIX")
+    def test_exec_failure_raises_runtime_error(self, environment, monkeypatch):
+        def fake_execvp(file, args):
+            raise FileNotFoundError(file)
+
+        monkeypatch.setattr(os, "execvp", fake_execvp)
+        with pytest.raises(RuntimeError, match="Java executable not found"):
+            JavaRunner().run(environment, main_class="Main", exec_java=True)
+
+
+class TestAsyncRunner:
+    """Tests for the asyncio API (arun/astream), using Python in place of java."""
+
+    @staticmethod
+    def _runner(monkeypatch, script: str) -> JavaRunner:
+        cmd = [sys.executable, "-c", script]
+        monkeypatch.setattr(
+            JavaRunner, "_build_command", lambda self, env, **kw: (cmd, Path(cmd[0]))
+        )
+        return JavaRunner()
+
+    @staticmethod
+    async def _collect(agen) -> list:
+        return [item async for item in agen]
+
+    def test_arun_returns_process(self, monkeypatch):
+        runner = self._runner(monkeypatch, "print('hello')")
+
+        async def main():
+            process = await runner.arun(None)
+            lines = [line async for line in process.stdout]
+            return lines, await process.wait()
+
+        lines, returncode = asyncio.run(main())
+        assert lines == [b"hello\n"]
+        assert returncode == 0
+
+    def test_astream_lines(self, monkeypatch):
+        runner = self._runner(
+            monkeypatch,
+            "import sys\n"
+            "print('out1'); sys.stdout.flush()\n"
+            "print('err1', file=sys.stderr); sys.stderr.flush()\n"
+            "print('out2')",
+        )
+        items = asyncio.run(self._collect(runner.astream(None)))
+        assert [d for n, d in items if n == "stdout"] == [b"out1\n", b"out2\n"]
+        assert [d for n, d in items if n == "stderr"] == [b"err1\n"]
+
+    def test_astream_chunks(self, monkeypatch):
+        runner = self._runner(monkeypatch, "import sys; sys.stdout.write('x' * 10000)")
+        items = asyncio.run(self._collect(runner.astream(None, chunk_size=1024)))
+        assert all(len(d) <= 1024 for _, d in items)
+        assert b"".join(d for _, d in items) == b"x" * 10000
+
+    def test_astream_check(self, monkeypatch):
+        runner = self._runner(monkeypatch, "import sys; sys.exit(3)")
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            asyncio.run(self._collect(runner.astream(None)))
+        assert excinfo.value.returncode == 3
+        assert asyncio.run(self._collect(runner.astream(None, check=False))) == []
+
+    def test_astream_timeout_kills_process(self, monkeypatch):
+        runner = self._runner(monkeypatch, "import time; time.sleep(30)")
+        start = time.monotonic()
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(self._collect(runner.astream(None, timeout=0.5)))
+        assert time.monotonic() - start < 10
+
+    def test_astream_early_exit_kills_process(self, monkeypatch):
+        runner = self._runner(
+            monkeypatch,
+            "import sys, time\n"
+            "while True:\n"
+            "    print('tick'); sys.stdout.flush(); time.sleep(0.01)",
+        )
+
+        async def main():
+            stream = runner.astream(None)
+            async for _, data in stream:
+                assert data == b"tick\n"
+                break
+            await stream.aclose()
+
+        start = time.monotonic()
+        asyncio.run(main())
+        assert time.monotonic() - start < 10
+
+
 class TestIntegration:
     """Integration tests using real Java execution."""
 
@@ -8,8 +8,10 @@ import zipfile
 from jgo.env._jar import (
     ModuleInfo,
     detect_module_info,
+    find_duplicate_classes,
     get_automatic_module_name,
     get_module_info_paths,
+    group_shadowed_classes,
     has_module_info,
     has_toplevel_classes,
     parse_module_name_from_descriptor,
@@ -436,3 +438,46 @@ def test_has_toplevel_classes_bad_zip(tmp_path):
     bad = tmp_path / "bad.jar"
     bad.write_bytes(b"not a zip file")
     assert not has_toplevel_classes(bad)
+
+
+# =============================================================================
+# Tests for find_duplicate_classes
+# =============================================================================
+
+
+def test_find_duplicate_classes(tmp_path):
+    """Classes present in several JARs are reported in class-path order."""
+    a = tmp_path / "a.jar"
+    a.write_bytes(
+        make_jar_bytes(
+            {
+                "com/example/Shared.class": b"\xca\xfe\xba\xbe",
+                "com/example/OnlyA.class": b"\xca\xfe\xba\xbe",
+                "module-info.class": b"\xca\xfe\xba\xbe",
+            }
+        )
+    )
+    b = tmp_path / "b.jar"
+    b.write_bytes(
+        make_jar_bytes(
+            {
+                "com/example/Shared.class": b"\xca\xfe\xba\xbe",
+                "module-info.class": b"\xca\xfe\xba\xbe",
+                "META-INF/versions/9/com/example/OnlyA.class": b"\xca\xfe\xba\xbe",
+            }
+        )
+    )
+
+    assert find_duplicate_classes([b, a]) == {"com.example.Shared": [b, a]}
+    assert group_shadowed_classes(find_duplicate_classes([a, b])) == {
+        (a, b): ["com.example.Shared"]
+    }
+
+
+def test_find_duplicate_classes_none(tmp_path):
+    """Distinct JARs (and unreadable files) yield no duplicates."""
+    a = tmp_path / "a.jar"
+    a.write_bytes(make_jar_bytes({"com/example/A.class": b"\xca\xfe\xba\xbe"}))
+    bad = tmp_path / "bad.jar"
+    bad.write_bytes(b"not a zip file")
+    assert find_duplicate_classes([a, bad, tmp_path / "missing.jar"]) == {}
@@ -87,3 +87,22 @@ def main():
 
         traceback.print_exc()
         return 1
+
+
+def test_project_highest_in_range(tmp_path):
+    """Test range queries against a project's cached metadata."""
+    project_dir = tmp_path / "org" / "example" / "demo"
+    project_dir.mkdir(parents=True)
+    versions = "".join(
+        f"<version>{v}</version>" for v in ["1.0", "1.2", "1.3-SNAPSHOT", "2.0"]
+    )
+    (project_dir / "maven-metadata-central.xml").write_text(
+        "<metadata><groupId>org.example</groupId><artifactId>demo</artifactId>"
+        f"<versioning><versions>{versions}</versions></versioning></metadata>"
+    )
+    maven = MavenContext(repo_cache=tmp_path, remote_repos={})
+    project = maven.project("org.example", "demo")
+    assert project.highest_in_range("[1.0,2.0)") == "1.2"
+    assert project.highest_in_range("[1.0,2.0)", snapshots=True) == "1.3-SNAPSHOT"
+    assert project.highest_in_range("(2.0,)") is None
+    assert project.version_index is project.version_index
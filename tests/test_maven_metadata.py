@@ -2,9 +2,19 @@
 Tests for jgo.maven.metadata utility functions.
 """
 
+import time
 from datetime import datetime
+from unittest.mock import MagicMock, patch
 
-from jgo.maven._metadata import ts2dt
+import pytest
+
+from jgo.maven import MavenContext
+from jgo.maven._metadata import (
+    UpdatePolicy,
+    fetch_metadata,
+    metadata_status_path,
+    ts2dt,
+)
 
 
 def test_ts2dt_with_dot():
@@ -28,3 +38,106 @@ def test_ts2dt_invalid():
         assert False, "Should have raised ValueError"
     except ValueError as e:
         assert "Invalid timestamp" in str(e)
+
+
+def test_update_policy_parse():
+    """Test parsing of update policy strings."""
+    assert UpdatePolicy("Daily").spec == "daily"
+    assert UpdatePolicy("interval:30").interval == 1800
+    with pytest.raises(ValueError, match="Invalid update policy"):
+        UpdatePolicy("hourly")
+    with pytest.raises(ValueError, match="interval"):
+        UpdatePolicy("interval:soon")
+
+
+def test_update_policy_is_due():
+    """Test when each update policy wants a remote check."""
+    now = time.time()
+    for spec in ("always", "daily", "interval:5", "never"):
+        assert UpdatePolicy(spec).is_due(None, now)
+    assert UpdatePolicy("always").is_due(now, now)
+    assert not UpdatePolicy("never").is_due(0, now)
+    assert not UpdatePolicy("daily").is_due(now, now)
+    assert UpdatePolicy("daily").is_due(now - 2 * 86400, now)
+    assert not UpdatePolicy("interval:5").is_due(now - 60, now)
+    assert UpdatePolicy("interval:5").is_due(now - 600, now)
+
+
+def _response(status_code, content=b"", headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.headers = headers or {}
+    return response
+
+
+def test_fetch_metadata_conditional(tmp_path):
+    """Test that metadata is refetched with validators, and 304s keep the file."""
+    dest = tmp_path / "maven-metadata-central.xml"
+    url = "https://repo.example.com/g/a/maven-metadata.xml"
+    policy = UpdatePolicy("always")
+
+    first = _response(200, b"<metadata/>", {"ETag": '"abc"', "Last-Modified": "X"})
+    with patch("requests.get", return_value=first) as get:
+        assert fetch_metadata(url, dest, policy, timeout=5)
+    assert get.call_args.kwargs["headers"] == {}
+    assert dest.read_bytes() == b"<metadata/>"
+    assert metadata_status_path(dest).exists()
+
+    with patch("requests.get", return_value=_response(304)) as get:
+        assert fetch_metadata(url, dest, policy, timeout=5)
+    assert get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "X",
+    }
+    assert dest.read_bytes() == b"<metadata/>"
+
+    with patch("requests.get", return_value=_response(404)):
+        assert not fetch_metadata(url, dest, policy, timeout=5)
+
+
+def test_fetch_metadata_fresh_skips_request(tmp_path):
+    """Test that fresh metadata is not requested again, unless forced."""
+    dest = tmp_path / "maven-metadata-central.xml"
+    url = "https://repo.example.com/g/a/maven-metadata.xml"
+    policy = UpdatePolicy("daily")
+
+    with patch("requests.get", return_value=_response(200, b"<m/>")) as get:
+        assert fetch_metadata(url, dest, policy, timeout=5)
+        assert fetch_metadata(url, dest, policy, timeout=5)
+        assert get.call_count == 1
+        assert fetch_metadata(url, dest, policy, timeout=5, force=True)
+        assert get.call_count == 2
+
+
+def test_fetch_metadata_missing_is_cached(tmp_path):
+    """Test that a 404 is remembered until the policy makes it due again."""
+    dest = tmp_path / "maven-metadata-central.xml"
+    url = "https://repo.example.com/g/a/maven-metadata.xml"
+
+    with patch("requests.get", return_value=_response(404)) as get:
+        assert not fetch_metadata(url, dest, UpdatePolicy("daily"), timeout=5)
+        assert not fetch_metadata(url, dest, UpdatePolicy("daily"), timeout=5)
+        assert not fetch_metadata(url, dest, UpdatePolicy("never"), timeout=5)
+        assert get.call_count == 1
+    assert not dest.exists()
+    assert metadata_status_path(dest).exists()
+
+    # Once due, the repository is asked again, and may have the metadata now
+    with patch("requests.get", return_value=_response(200, b"<m/>")) as get:
+        assert fetch_metadata(url, dest, UpdatePolicy("always"), timeout=5)
+        assert get.call_args.kwargs["headers"] == {}
+        assert fetch_metadata(url, dest, UpdatePolicy("daily"), timeout=5)
+        assert get.call_count == 1
+
+
+def test_context_update_policy_per_repo(tmp_path):
+    """Test that repository-specific policies override the default."""
+    context = MavenContext(
+        repo_cache=tmp_path,
+        remote_repos={"central": "https://a", "snapshots": "https://b"},
+        update_policy="never",
+        update_policies={"snapshots": "always"},
+    )
+    assert context.update_policy_for("central") == UpdatePolicy("never")
+    assert context.update_policy_for("snapshots") == UpdatePolicy("always")
@@ -0,0 +1,433 @@
+"""
+Tests for how the Maven layer talks to multiple remote repositories.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from jgo.maven import MavenContext, PythonResolver
+from jgo.maven._metadata import UpdatePolicy
+from jgo.maven._remote import FloatingVersionIndex, RouteTable, read_misses
+from jgo.maven._resolver import _first_available, partial_path
+from jgo.maven._scheduler import probe_size
+
+
+def _fake_get(behavior):
+    """requests.get stand-in: behavior maps URL -> (delay, status_code)."""
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        delay, status = behavior[url]
+        time.sleep(delay)
+        response = MagicMock()
+        response.status_code = status
+        return response
+
+    return get, calls
+
+
+def test_first_available_prefers_priority_order():
+    get, calls = _fake_get({"a": (0, 200), "b": (0, 200)})
+    with patch("requests.get", get):
+        (url, _), _ = _first_available(["a", "b"], timeout=5, hedge_delay=1)
+    assert url == "a"
+    assert calls == ["a"]
+
+
+def test_first_available_skips_misses():
+    get, calls = _fake_get({"a": (0, 404), "b": (0, 404), "c": (0, 200)})
+    with patch("requests.get", get):
+        (url, _), _ = _first_available(["a", "b", "c"], timeout=5, hedge_delay=1)
+    assert url == "c"
+    assert calls == ["a", "b", "c"]
+
+
+def test_first_available_hedges_slow_repo():
+    get, _ = _fake_get({"slow": (1, 200), "fast": (0, 200)})
+    start = time.monotonic()
+    with patch("requests.get", get):
+        (url, _), _ = _first_available(["slow", "fast"], timeout=5, hedge_delay=0.05)
+    assert url == "fast"
+    assert time.monotonic() - start < 0.9
+
+
+def test_first_available_none():
+    get, _ = _fake_get({"a": (0, 404), "b": (0, 500)})
+    with patch("requests.get", get):
+        found, missed = _first_available(["a", "b"], timeout=5, hedge_delay=0.05)
+    assert found is None
+    assert missed == ["a"]
+
+
+def test_update_metadata_fans_out(tmp_path):
+    repos = {f"repo{i}": f"https://repo{i}.example.com" for i in range(4)}
+    context = MavenContext(repo_cache=tmp_path, remote_repos=repos)
+
+    def fetch(url, metadata_file, policy, timeout, force=False, transport=None):
+        time.sleep(0.2)
+        return "repo2" not in url
+
+    start = time.monotonic()
+    with patch("jgo.maven._core.fetch_metadata", fetch):
+        found = context.update_metadata(context.project("g", "a").path_prefix)
+    assert time.monotonic() - start < 0.6
+    assert found == ["repo0", "repo1", "repo3"]
+
+
+def _repo_get(hosts_with_file):
+    """requests.get stand-in serving b"jar" from the given hosts only."""
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        response = MagicMock()
+        served = any(url.startswith(h) for h in hosts_with_file)
+        response.status_code = 200 if served and not url.endswith(".sha1") else 404
+        response.headers = {}
+        response.iter_content.return_value = [b"jar"]
+        return response
+
+    return get, calls
+
+
+@pytest.fixture
+def three_repos(tmp_path):
+    repos = {name: f"https://{name}.example.com" for name in ("a", "b", "c")}
+    context = MavenContext(
+        resolver=PythonResolver(hedge_delay=1), repo_cache=tmp_path, remote_repos=repos
+    )
+    return context
+
+
+def test_download_records_misses(three_repos):
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    # Not yet available anywhere: all three repos miss
+    with patch("requests.get", _repo_get([])[0]), pytest.raises(RuntimeError):
+        three_repos.resolver.download(artifact)
+    assert set(read_misses(artifact.cached_path)) == set(
+        three_repos.remote_repos.values()
+    )
+
+    # Misses are remembered until the update policy (daily) says to check again
+    get, calls = _repo_get(["https://c."])
+    cached = "use --update"
+    with patch("requests.get", get), pytest.raises(RuntimeError, match=cached):
+        three_repos.resolver.download(artifact)
+    assert calls == []
+
+
+def test_download_retries_misses_when_due(three_repos, tmp_path):
+    context = MavenContext(
+        resolver=three_repos.resolver,
+        repo_cache=tmp_path,
+        remote_repos=three_repos.remote_repos,
+        update_policy="always",
+    )
+    artifact = context.project("org.example", "lib").at_version("1.0").artifact()
+    with patch("requests.get", _repo_get([])[0]), pytest.raises(RuntimeError):
+        context.resolver.download(artifact)
+    with patch("requests.get", _repo_get(["https://c."])[0]):
+        assert context.resolver.download(artifact).read_bytes() == b"jar"
+    assert read_misses(artifact.cached_path) == {}
+
+
+def test_probe_size_records_misses(three_repos):
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    probed = []
+
+    def head(url, **kwargs):
+        probed.append(url)
+        response = MagicMock()
+        response.status_code = 200 if url.startswith("https://c.") else 404
+        response.headers = {"content-length": "42"}
+        return response
+
+    with patch("requests.head", head):
+        assert probe_size(artifact) == 42
+        assert len(probed) == 3
+        # Repositories that missed are skipped, by probes and downloads alike
+        probed.clear()
+        assert probe_size(artifact) == 42
+    assert [url.split("/")[2] for url in probed] == ["c.example.com"]
+    assert set(read_misses(artifact.cached_path)) == {
+        "https://a.example.com",
+        "https://b.example.com",
+    }
+
+
+def test_download_learns_route(three_repos, tmp_path):
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    get, calls = _repo_get(["https://c."])
+    with patch("requests.get", get):
+        three_repos.resolver.download(artifact)
+    assert three_repos.routes.lookup("org.example") == "c"
+
+    # A fresh context reads the learned route and asks that repository first
+    context = MavenContext(
+        resolver=three_repos.resolver,
+        repo_cache=tmp_path,
+        remote_repos=three_repos.remote_repos,
+    )
+    assert [name for name, _ in context.ordered_repos("org.example")] == [
+        "c",
+        "a",
+        "b",
+    ]
+    other = context.project("org.example", "other").at_version("2.0").artifact()
+    get, calls = _repo_get(["https://c."])
+    with patch("requests.get", get):
+        context.resolver.download(other)
+    assert calls[0].startswith("https://c.")
+    assert not any(url.startswith("https://a.") for url in calls)
+
+
+def test_route_table_order(tmp_path):
+    routes = RouteTable(tmp_path / "routes.json")
+    assert routes.order("g", ["a", "b"]) == ["a", "b"]
+    routes.learn("g", "b")
+    assert RouteTable(tmp_path / "routes.json").order("g", ["a", "b"]) == ["b", "a"]
+    # Routes to repositories that are not configured are ignored
+    assert routes.order("g", ["a"]) == ["a"]
+
+
+def test_route_table_shared_by_processes(tmp_path):
+    """Routes learned elsewhere meanwhile are kept, not overwritten by stale ones."""
+    path = tmp_path / "routes.json"
+    RouteTable(path).learn("g1", "old")
+    stale = RouteTable(path)
+    assert stale.lookup("g1") == "old"
+    RouteTable(path).learn("g1", "new")
+
+    stale.learn("g2", "a")
+    assert stale.lookup("g1") == "new"
+    assert RouteTable(path).learned == {"g1": "new", "g2": "a"}
+
+    index = FloatingVersionIndex(tmp_path / "floating.json", UpdatePolicy("daily"))
+    other = FloatingVersionIndex(tmp_path / "floating.json", UpdatePolicy("daily"))
+    index.record("org.example", "lib", "RELEASE", ["r"], "1.0")
+    other.record("org.example", "lib", "RELEASE", ["r"], "1.1")
+    index.record("org.example", "app", "RELEASE", ["r"], "2.0")
+    assert index.lookup("org.example", "lib", "RELEASE", ["r"]) == "1.1"
+
+
+def test_route_table_configured_rules(tmp_path):
+    routes = RouteTable(
+        tmp_path / "routes.json",
+        {
+            "org.scijava.*": "scijava",
+            "org.scijava.legacy": "b, a",
+            "*": "central",
+        },
+    )
+    assert routes.configured("org.scijava") == ["scijava"]
+    assert routes.configured("org.scijava.foo") == ["scijava"]
+    assert routes.configured("org.scijava.legacy") == ["b", "a"]
+    assert routes.configured("org.scijavax") == ["central"]
+
+    names = ["central", "a", "b", "scijava"]
+    assert routes.order("org.scijava.foo", names) == ["scijava", "central", "a", "b"]
+    assert routes.order("org.scijava.legacy", names) == ["b", "a", "central", "scijava"]
+
+    # Configured rules come before learned routes
+    routes.learn("org.scijava.foo", "a")
+    assert routes.order("org.scijava.foo", names) == ["scijava", "a", "central", "b"]
+
+
+def test_floating_version_index(tmp_path):
+    path = tmp_path / ".jgo-floating.json"
+    index = FloatingVersionIndex(path, UpdatePolicy("interval:60"))
+    repos = ["https://b.example", "https://a.example"]
+    assert index.lookup("org.example", "lib", "RELEASE", repos) is None
+
+    index.record("org.example", "lib", "RELEASE", repos, "1.2", now=1000.0)
+    assert index.lookup("org.example", "lib", "RELEASE", repos, now=1100.0) == "1.2"
+    assert index.lookup("org.example", "lib", "LATEST", repos, now=1100.0) is None
+    # Other repositories may resolve differently
+    assert index.lookup("org.example", "lib", "RELEASE", repos[:1], now=1100.0) is None
+    # Due again after the policy interval
+    assert index.lookup("org.example", "lib", "RELEASE", repos, now=5000.0) is None
+
+    # Shared with other processes through the file
+    other = FloatingVersionIndex(path, UpdatePolicy("never"))
+    assert other.lookup("org.example", "lib", "RELEASE", reversed(repos)) == "1.2"
+    assert (
+        FloatingVersionIndex(path, UpdatePolicy("always")).lookup(
+            "org.example", "lib", "RELEASE", repos
+        )
+        is None
+    )
+
+
+def test_floating_version_index_always(tmp_path):
+    path = tmp_path / ".jgo-floating.json"
+    index = FloatingVersionIndex(path, UpdatePolicy("always"))
+    index.record("org.example", "lib", "RELEASE", ["r"], "1.0")
+    assert not path.exists()
+
+    # Entries used under other policies are kept up to date, e.g. by --update
+    daily = FloatingVersionIndex(path, UpdatePolicy("daily"))
+    daily.record("org.example", "lib", "RELEASE", ["r"], "1.0")
+    FloatingVersionIndex(path, UpdatePolicy("always")).record(
+        "org.example", "lib", "RELEASE", ["r"], "1.1"
+    )
+    assert (
+        FloatingVersionIndex(path, UpdatePolicy("daily")).lookup(
+            "org.example", "lib", "RELEASE", ["r"]
+        )
+        == "1.1"
+    )
+
+
+def test_download_follows_configured_route(tmp_path):
+    context = MavenContext(
+        resolver=PythonResolver(hedge_delay=10),
+        repo_cache=tmp_path,
+        remote_repos={
+            "a": "https://a.example.org",
+            "b": "https://b.example.org",
+            "c": "https://c.example.org",
+        },
+        routes={"org.example.*": "c"},
+    )
+    artifact = context.project("org.example.sub", "lib").at_version("1.0").artifact()
+    get, calls = _repo_get(["https://c."])
+    with patch("requests.get", get):
+        context.resolver.download(artifact)
+    assert calls[0].startswith("https://c.")
+    assert not any(url.startswith(("https://a.", "https://b.")) for url in calls)
+
+
+def _serving(content, breaks=()):
+    """
+    requests.get stand-in serving content with Range support.
+
+    breaks lists, per request, after how many body bytes the connection drops.
+    """
+    breaks = list(breaks)
+    requests_seen = []
+
+    def get(url, headers=None, **kwargs):
+        response = MagicMock()
+        if url.endswith(".sha1"):
+            response.status_code = 200
+            response.text = hashlib.sha1(content).hexdigest()
+            return response
+        requests_seen.append(headers)
+        start = 0
+        if headers and "Range" in headers:
+            start = int(headers["Range"].split("=")[1].rstrip("-"))
+        if start >= len(content):
+            response.status_code = 416
+            response.headers = {}
+            return response
+        body = content[start:]
+        response.status_code = 206 if start else 200
+        response.headers = {
+            "content-length": str(len(body)),
+            "content-range": f"bytes {start}-{len(content) - 1}/{len(content)}",
+        }
+        cut = breaks.pop(0) if breaks else None
+
+        def iter_content(chunk_size):
+            yield body[:cut]
+            if cut is not None:
+                raise requests.ConnectionError("connection reset")
+
+        response.iter_content.side_effect = iter_content
+        return response
+
+    return get, requests_seen
+
+
+def test_download_resumes_after_interruption(three_repos):
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    get, seen = _serving(b"0123456789", breaks=[4])
+    with patch("requests.get", get):
+        path = three_repos.resolver.download(artifact)
+    assert path.read_bytes() == b"0123456789"
+    assert seen == [None, {"Range": "bytes=4-"}]
+    assert not partial_path(path).exists()
+    assert list(path.parent.glob("*.tmp")) == []
+
+
+def test_download_keeps_partial_file(three_repos):
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    get, seen = _serving(b"0123456789", breaks=[2, 1, 1])
+    with patch("requests.get", get), pytest.raises(requests.ConnectionError):
+        three_repos.resolver.download(artifact)
+
+    # Nothing half-written in the cache, but the partial file is kept...
+    cached = artifact.cached_path
+    assert not cached.exists()
+    assert partial_path(cached).read_bytes() == b"0123"
+
+    # ...and resumed by the next attempt
+    get, seen = _serving(b"0123456789")
+    with patch("requests.get", get):
+        assert three_repos.resolver.download(artifact).read_bytes() == b"0123456789"
+    assert seen == [{"Range": "bytes=4-"}]
+    assert not partial_path(cached).exists()
+
+
+def test_download_discards_stale_partial_file(three_repos):
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    cached = artifact.cached_path
+    cached.parent.mkdir(parents=True)
+    partial_path(cached).write_bytes(b"too long to be a prefix")
+    get, seen = _serving(b"jar")
+    with patch("requests.get", get):
+        assert three_repos.resolver.download(artifact).read_bytes() == b"jar"
+    assert seen[-1] is None
+
+
+def test_download_rejects_checksum_mismatch(three_repos):
+    """A download that does not match its .sha1 is never cached."""
+    artifact = three_repos.project("org.example", "lib").at_version("1.0").artifact()
+    serve, _ = _serving(b"0123456789")
+
+    def get(url, headers=None, **kwargs):
+        response = serve(url, headers=headers, **kwargs)
+        if url.endswith(".sha1"):
+            response.text = "0" * 40
+        return response
+
+    mismatch = "Checksum mismatch"
+    with patch("requests.get", get), pytest.raises(RuntimeError, match=mismatch):
+        three_repos.resolver.download(artifact)
+    cached = artifact.cached_path
+    assert not cached.exists()
+    assert not partial_path(cached).exists()
+    assert list(cached.parent.glob("*.tmp")) == []
+
+    # Also after a resumed download was fetched again in full
+    partial_path(cached).write_bytes(b"0123")
+    with patch("requests.get", get), pytest.raises(RuntimeError, match=mismatch):
+        three_repos.resolver.download(artifact)
+    assert not cached.exists()
+
+
+def test_concurrent_resolve_downloads_once(tmp_path):
+    downloads = []
+
+    class SlowResolver(PythonResolver):
+        def download(self, artifact):
+            downloads.append(artifact)
+            time.sleep(0.05)
+            artifact.cached_path.parent.mkdir(parents=True, exist_ok=True)
+            artifact.cached_path.write_bytes(b"jar")
+            return artifact.cached_path
+
+    context = MavenContext(resolver=SlowResolver(), repo_cache=tmp_path)
+    artifact = context.project("org.example", "lib").at_version("1.0").artifact()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        paths = list(pool.map(lambda _: artifact.resolve(), range(4)))
+    assert len(downloads) == 1
+    assert set(paths) == {artifact.cached_path}
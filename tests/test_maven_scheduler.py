@@ -0,0 +1,121 @@
+"""
+Tests for the size-ordered download scheduler.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from jgo.maven import MavenContext, PythonResolver
+from jgo.maven._scheduler import DownloadScheduler, RateLimiter
+
+SIZES = {"tiny": 10, "small": 100, "medium": 1000, "huge": 10_000_000}
+
+
+def _head(url, **kwargs):
+    """requests.head stand-in reporting SIZES, or 10 bytes for other files."""
+    response = MagicMock()
+    name = url.rsplit("/", 1)[-1].split("-")[0]
+    response.status_code = 200
+    response.headers = {"content-length": str(SIZES.get(name, 10))}
+    return response
+
+
+class _RecordingResolver(PythonResolver):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.started = []
+        self.lock = threading.Lock()
+
+    def download(self, artifact):
+        with self.lock:
+            self.started.append(artifact.artifactId)
+        time.sleep(0.01)
+        artifact.cached_path.parent.mkdir(parents=True, exist_ok=True)
+        artifact.cached_path.write_bytes(b"jar")
+        return artifact.cached_path
+
+
+@pytest.fixture
+def context(tmp_path):
+    return MavenContext(resolver=_RecordingResolver(), repo_cache=tmp_path)
+
+
+def _artifacts(context, names):
+    return [
+        context.project("org.example", name).at_version("1.0").artifact()
+        for name in names
+    ]
+
+
+def test_small_files_first(context):
+    artifacts = _artifacts(context, ["huge", "medium", "tiny", "small"])
+    with patch("requests.head", _head):
+        paths = DownloadScheduler(max_workers=1).fetch(artifacts)
+    assert context.resolver.started == ["tiny", "small", "medium", "huge"]
+    assert paths == [a.cached_path for a in artifacts]
+
+
+def test_large_files_start_early(context):
+    names = ["huge"] + [f"tiny{i}" for i in range(20)]
+    artifacts = _artifacts(context, names)
+    with patch("requests.head", _head):
+        DownloadScheduler(max_workers=4).fetch(artifacts)
+    assert "huge" in context.resolver.started[:4]
+    assert sorted(context.resolver.started) == sorted(names)
+
+
+def test_cached_artifacts_are_not_downloaded(context):
+    artifacts = _artifacts(context, ["tiny", "small"])
+    artifacts[0].cached_path.parent.mkdir(parents=True)
+    artifacts[0].cached_path.write_bytes(b"jar")
+    with patch("requests.head", _head):
+        DownloadScheduler().fetch(artifacts)
+    assert context.resolver.started == ["small"]
+
+
+def test_aggregate_progress(tmp_path):
+    calls = []
+    received = []
+
+    @contextmanager
+    def progress(name, total_size):
+        calls.append((name, total_size))
+        yield received.append
+
+    def get(url, **kwargs):
+        response = MagicMock()
+        response.status_code = 404 if url.endswith(".sha1") else 200
+        response.headers = {"content-length": "3"}
+        response.iter_content.return_value = [b"jar"]
+        return response
+
+    def head(url, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {"content-length": "3"}
+        return response
+
+    resolver = PythonResolver(progress_callback=progress)
+    context = MavenContext(resolver=resolver, repo_cache=tmp_path)
+    artifacts = _artifacts(context, ["a", "b", "c"])
+    with patch("requests.get", get), patch("requests.head", head):
+        resolver.prefetch(artifacts)
+    assert calls == [("3 files", 9)]
+    assert sum(received) == 9
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(1000)
+    start = time.monotonic()
+    # One second's worth passes as a burst; the next 200 bytes take 0.2s
+    limiter.consume(1000)
+    limiter.consume(200)
+    assert time.monotonic() - start >= 0.15
+    with pytest.raises(ValueError):
+        RateLimiter(0)
@@ -0,0 +1,167 @@
+"""
+Tests for the Maven transport layer, against a fake repository over local HTTP.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+import requests
+
+from jgo.maven import (
+    MavenContext,
+    Project,
+    PythonResolver,
+    RequestsTransport,
+    Transport,
+)
+from jgo.maven._transport import ThreadedAsyncTransport
+
+
+def _context(repo, tmp_path, **kwargs):
+    return MavenContext(
+        repo_cache=tmp_path / "m2",
+        remote_repos={"fake": repo.url},
+        **kwargs,
+    )
+
+
+def test_requests_transport(fake_maven_repo):
+    fake_maven_repo.add_artifact("org.example", "lib", "1.0", jar=b"0123456789")
+    url = f"{fake_maven_repo.url}/org/example/lib/1.0/lib-1.0.jar"
+    transport = RequestsTransport(requests.Session())
+
+    response = transport.get(url)
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+
+    head = transport.head(url)
+    assert head.status_code == 200
+    assert head.headers["Content-Length"] == "10"
+
+    ranged = transport.get(url, headers={"Range": "bytes=4-"})
+    assert ranged.status_code == 206
+    assert ranged.content == b"456789"
+
+    etag = response.headers["ETag"]
+    assert transport.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert transport.get(f"{url}.missing").status_code == 404
+
+
+def test_async_transport(fake_maven_repo):
+    for i in range(5):
+        fake_maven_repo.add_artifact("org.example", f"lib{i}", "1.0", jar=bytes([i]))
+    transport = ThreadedAsyncTransport(RequestsTransport())
+    urls = [
+        f"{fake_maven_repo.url}/org/example/lib{i}/1.0/lib{i}-1.0.jar" for i in range(5)
+    ]
+    responses = asyncio.run(transport.get_many(urls + ["http://127.0.0.1:1/x"]))
+    assert [r.content for r in responses[:5]] == [bytes([i]) for i in range(5)]
+    assert isinstance(responses[5], requests.RequestException)
+
+
+def test_context_uses_its_transport(fake_maven_repo, tmp_path):
+    fake_maven_repo.add_artifact("org.example", "lib", "1.0", jar=b"jar")
+
+    class CountingTransport(RequestsTransport):
+        def __init__(self):
+            super().__init__()
+            self.urls = []
+
+        def get(self, url, **kwargs):
+            self.urls.append(url)
+            return super().get(url, **kwargs)
+
+    transport = CountingTransport()
+    context = _context(fake_maven_repo, tmp_path, transport=transport)
+    assert isinstance(context.transport, Transport)
+    path = context.project("org.example", "lib").at_version("1.0").artifact().resolve()
+    assert path.read_bytes() == b"jar"
+    assert any(url.endswith("lib-1.0.jar") for url in transport.urls)
+
+
+def test_download_resumes_over_http(fake_maven_repo, tmp_path):
+    jar = bytes(range(256)) * 256
+    fake_maven_repo.add_artifact("org.example", "lib", "1.0", jar=jar)
+    fake_maven_repo.interrupt("org/example/lib/1.0/lib-1.0.jar", after=40000)
+    context = _context(fake_maven_repo, tmp_path)
+    path = context.project("org.example", "lib").at_version("1.0").artifact().resolve()
+    assert path.read_bytes() == jar
+    ranges = [
+        headers.get("Range")
+        for method, p, headers in fake_maven_repo.requests
+        if method == "GET" and p.endswith(".jar")
+    ]
+    # The retry asks for the rest of the file only
+    assert len(ranges) == 2 and ranges[0] is None
+    assert ranges[1].startswith("bytes=") and ranges[1] != "bytes=0-"
+
+
+def test_synthetic_repository_resolve(synthetic_maven_repo, tmp_path):
+    """Resolve and download the whole synthetic graph, then again cached."""
+    repo = synthetic_maven_repo
+    context = _context(repo, tmp_path, resolver=PythonResolver(max_downloads=16))
+    root = context.create_dependency("org.fake:root:1.0")
+
+    start = time.monotonic()
+    _, deps = context.resolver.resolve([root])
+    assert len(deps) == 200
+    jars_before = repo.count("GET", ".jar")
+    paths = context.resolver.prefetch(dep.artifact for dep in deps)
+    elapsed = time.monotonic() - start
+    assert all(p.exists() for p in paths)
+    # Every JAR is downloaded exactly once
+    assert repo.count("GET", ".jar") - jars_before == 200
+    print(f"\nResolved and downloaded {len(deps)} artifacts in {elapsed:.2f}s")
+
+    # A second pass is served entirely from the local cache
+    requests_before = len(repo.requests)
+    context.resolver.prefetch(dep.artifact for dep in deps)
+    assert len(repo.requests) == requests_before
+
+
+@pytest.mark.parametrize("max_downloads", [1, 16])
+def test_prefetch_parallelism(fake_maven_repo, tmp_path, max_downloads):
+    """Downloads overlap: with latency, 16 connections beat one by far."""
+    fake_maven_repo.latency = 0.02
+    for i in range(32):
+        fake_maven_repo.add_artifact("org.example", f"lib{i}", "1.0", jar=b"jar")
+    context = _context(
+        fake_maven_repo, tmp_path, resolver=PythonResolver(max_downloads=max_downloads)
+    )
+    artifacts = [
+        context.project("org.example", f"lib{i}").at_version("1.0").artifact()
+        for i in range(32)
+    ]
+    start = time.monotonic()
+    context.resolver.prefetch(artifacts)
+    elapsed = time.monotonic() - start
+    # HEAD, GET and .sha1 per artifact
+    serial = 32 * 3 * fake_maven_repo.latency
+    if max_downloads == 1:
+        assert elapsed >= serial * 0.9
+    else:
+        assert elapsed < serial / 2
+
+
+def test_floating_version_skips_metadata(fake_maven_repo, tmp_path, monkeypatch):
+    fake_maven_repo.add_artifact("org.example", "lib", "1.0", jar=b"one")
+    context = _context(fake_maven_repo, tmp_path, floating_policy="interval:60")
+    component = context.project("org.example", "lib").at_version("RELEASE")
+    assert component.resolved_version == "1.0"
+
+    # Warm runs reuse the resolution without touching metadata at all
+    fake_maven_repo.add_artifact("org.example", "lib", "2.0", jar=b"two")
+    with monkeypatch.context() as m:
+        m.setattr(Project, "update", lambda self, force=False: pytest.fail())
+        context = _context(fake_maven_repo, tmp_path, floating_policy="interval:60")
+        component = context.project("org.example", "lib").at_version("RELEASE")
+        assert component.resolved_version == "1.0"
+    assert fake_maven_repo.count("GET", "maven-metadata.xml") == 1
+
+    # Forcing an update resolves again
+    context = _context(fake_maven_repo, tmp_path, update_policy="always")
+    component = context.project("org.example", "lib").at_version("RELEASE")
+    assert component.resolved_version == "2.0"
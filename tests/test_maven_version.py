@@ -5,13 +5,18 @@ import pytest
 from jgo.maven._version import (
     MavenVersion,
     Token,
+    VersionIndex,
     VersionRange,
     _tokenize,
     _trim_nulls,
     compare_semver,
+    compare_tokens,
     compare_versions,
     is_semver_1x,
+    max_version,
+    parse_maven_version,
     parse_version_range,
+    sort_versions,
     version_in_range,
 )
 
@@ -272,6 +277,89 @@ class TestCompareVersions:
         assert compare_versions("1.0.0-alpha", "1.0.0") < 0
 
 
+class TestSortKey:
+    """Test MavenVersion.sort_key() and the key-based helpers."""
+
+    VERSIONS = (
+        "1.0-alpha-1",
+        "1.0-beta-2",
+        "1.0-M1",
+        "1.0-rc1",
+        "1.0-SNAPSHOT",
+        "1",
+        "1.0.0",
+        "1.0.1",
+        "1.1",
+        "1.48q",
+        "1.54p",
+        "2.0.0.Beta1",
+        "2.0.0.Final",
+        "31.1-android",
+        "31.1-jre",
+    )
+
+    @staticmethod
+    def _positional_compare(a, b):
+        """Token-by-token comparison with separator-dependent padding."""
+        ta, tb = MavenVersion(a).tokens, MavenVersion(b).tokens
+        for i in range(max(len(ta), len(tb))):
+            tok_a = ta[i] if i < len(ta) else None
+            tok_b = tb[i] if i < len(tb) else None
+            pad_sep_a = tb[i].separator if i < len(tb) else "."
+            pad_sep_b = ta[i].separator if i < len(ta) else "."
+            result = compare_tokens(tok_a, tok_b, pad_sep_a, pad_sep_b)
+            if result:
+                return result
+        return 0
+
+    def test_matches_positional_compare(self):
+        for a in self.VERSIONS:
+            for b in self.VERSIONS:
+                ka = MavenVersion(a).sort_key()
+                kb = MavenVersion(b).sort_key()
+                expected = self._positional_compare(a, b)
+                assert ((ka > kb) - (ka < kb)) == expected, (a, b)
+
+    def test_padding_depends_on_separator(self):
+        # .0 pads as a number, -foo as a qualifier
+        assert MavenVersion("1.0-alpha") < MavenVersion("1") < MavenVersion("1-sp")
+        assert MavenVersion("1") < MavenVersion("1-5") < MavenVersion("1.0.1")
+
+    def test_total_order(self):
+        # Token-by-token comparison is not transitive here
+        # (1.0-alpha < 1 < 1-sp, yet .0 > -sp); the key must pick one order.
+        assert MavenVersion("1.0-alpha") < MavenVersion("1-sp")
+        assert MavenVersion("1.sp") == MavenVersion("1-sp") > MavenVersion("1")
+
+    def test_equal_versions_equal_keys(self):
+        assert MavenVersion("1-5").sort_key() == MavenVersion("1_5").sort_key()
+        assert hash(MavenVersion("1-5")) == hash(MavenVersion("1_5"))
+
+    def test_parse_interned(self):
+        assert parse_maven_version("1.2.3") is parse_maven_version("1.2.3")
+
+    def test_max_version(self):
+        assert max_version(["1.48q", "1.54p", "1.9"]) == "1.54p"
+        assert max_version(["1.0-SNAPSHOT", "1.0", "0.9"]) == "1.0"
+        assert max_version([]) is None
+
+    def test_sort_versions(self):
+        shuffled = list(reversed(self.VERSIONS))
+        ordered = sort_versions(shuffled)
+        for a, b in zip(ordered, ordered[1:]):
+            assert compare_versions(a, b) <= 0
+        assert sort_versions(["1.0", "2.0"], reverse=True) == ["2.0", "1.0"]
+
+    def test_sort_versions_semver(self):
+        # All SemVer: numeric prerelease identifiers sort below alphanumeric ones
+        versions = ["1.0.0-alpha.beta", "1.0.0", "1.0.0-alpha.1"]
+        assert sort_versions(versions) == [
+            "1.0.0-alpha.1",
+            "1.0.0-alpha.beta",
+            "1.0.0",
+        ]
+
+
 # ============================================================
 # SECTION 3: VERSION RANGE TESTS
 # ============================================================
@@ -368,3 +456,65 @@ class TestVersionInRange:
     def test_prerelease_in_range(self):
         # Important Maven caveat: 2.0-rc1 < 2.0, so [1.0,2.0) includes 2.0-rc1
         assert version_in_range("2.0-rc1", "[1.0,2.0)") is True
+
+
+class TestVersionIndex:
+    """Test VersionIndex range queries."""
+
+    VERSIONS = ("2.0", "1.0", "1.5-SNAPSHOT", "1.2", "1.10", "1.9", "2.1", "1.2")
+
+    def test_sorted_unique(self):
+        index = VersionIndex(self.VERSIONS)
+        assert list(index) == [
+            "1.0",
+            "1.2",
+            "1.5-SNAPSHOT",
+            "1.9",
+            "1.10",
+            "2.0",
+            "2.1",
+        ]
+        assert len(index) == 7
+
+    def test_matching_agrees_with_version_in_range(self):
+        index = VersionIndex(self.VERSIONS)
+        for spec in ["[1.2,2.0)", "(1.2,2.0]", "[1.9]", "(,1.9)", "[1.10,)", "1.0"]:
+            expected = [v for v in index if version_in_range(v, spec)]
+            assert index.matching(spec) == expected, spec
+
+    def test_highest(self):
+        index = VersionIndex(self.VERSIONS)
+        assert index.highest("[1.2,2.0)") == "1.10"
+        assert index.highest("[1.0,1.9)") == "1.5-SNAPSHOT"
+        assert index.highest("[1.0,1.9)", snapshots=False) == "1.2"
+        assert index.highest("[3.0,)") is None
+        assert index.highest() == "2.1"
+
+    def test_semver_agrees_with_max_version(self):
+        """All-SemVer versions are indexed in SemVer order, like max_version()."""
+        versions = ["1.0.0", "1.0.0-foo", "0.9.0", "1.1.0-rc.1"]
+        index = VersionIndex(versions)
+        assert list(index) == sort_versions(versions)
+        assert index.highest() == max_version(versions) == "1.1.0-rc.1"
+        for spec in ["[0.9.0,1.0.0]", "(0.9.0,1.0.0)", "[1.0.0]", "[1.0,1.1)", "(,1)"]:
+            expected = [v for v in sort_versions(versions) if version_in_range(v, spec)]
+            assert index.matching(spec) == expected, spec
+            assert index.highest(spec) == max_version(expected), spec
+
+    def test_empty_range(self):
+        index = VersionIndex(self.VERSIONS)
+        assert index.matching("[2.0,1.0]") == []
+        assert index.highest("[2.0,1.0]") is None
+
+    def test_range_reuse(self):
+        assert parse_version_range("[1.0,2.0)") is parse_version_range("[1.0,2.0)")
+        vr = VersionRange("1.0", "2.0", True, False)
+        assert vr.contains("1.5")
+        assert not vr.contains("2.0")
+        assert VersionIndex(self.VERSIONS).matching(vr) == [
+            "1.0",
+            "1.2",
+            "1.5-SNAPSHOT",
+            "1.9",
+            "1.10",
+        ]
@@ -1,6 +1,8 @@
 import xml.etree.ElementTree as ET
 
-from jgo.maven import MavenContext
+import pytest
+
+from jgo.maven import Component, MavenContext, PythonResolver
 from jgo.maven._model import Model, ProfileConstraints
 
 _ctx = MavenContext()
@@ -439,3 +441,153 @@ def test_profile_activation_file_basedir_default():
 
     # Should interpolate basedir to "."
     assert checked_path == "./pom.xml"
+
+
+# -- Resolution for several platforms --
+
+_PLATFORM_POMS = {
+    # Sets the platform family through OS-activated profiles, like pom-scijava
+    "parent": """
+      <packaging>pom</packaging>
+      <profiles>
+        <profile>
+          <id>linux</id>
+          <activation><os><family>unix</family></os></activation>
+          <properties><platform.family>linux</platform.family></properties>
+        </profile>
+        <profile>
+          <id>macos</id>
+          <activation><os><family>mac</family></os></activation>
+          <properties><platform.family>macos</platform.family></properties>
+        </profile>
+      </profiles>
+    """,
+    "app": """
+      <parent>
+        <groupId>org.example</groupId>
+        <artifactId>parent</artifactId>
+        <version>1.0</version>
+      </parent>
+      <properties><library.version>1.0</library.version></properties>
+      <dependencies>
+        <dependency>
+          <groupId>org.example</groupId>
+          <artifactId>core</artifactId>
+          <version>${library.version}</version>
+        </dependency>
+        <dependency>
+          <groupId>org.example</groupId>
+          <artifactId>natives</artifactId>
+          <version>1.0</version>
+          <classifier>natives-${platform.family}-${os.arch}</classifier>
+        </dependency>
+      </dependencies>
+    """,
+    "core": """
+      <parent>
+        <groupId>org.example</groupId>
+        <artifactId>parent</artifactId>
+        <version>1.0</version>
+      </parent>
+      <dependencies>
+        <dependency>
+          <groupId>org.example</groupId>
+          <artifactId>lib</artifactId>
+          <version>1.0</version>
+        </dependency>
+      </dependencies>
+    """,
+    "lib": "",
+    "natives": "",
+}
+
+
+@pytest.fixture
+def platform_repo(tmp_path):
+    """A local repository whose org.example:app:1.0 has natives per platform."""
+    for artifact_id, body in _PLATFORM_POMS.items():
+        pom_dir = tmp_path / "org" / "example" / artifact_id / "1.0"
+        pom_dir.mkdir(parents=True)
+        (pom_dir / f"{artifact_id}-1.0.pom").write_text(
+            "<project><modelVersion>4.0.0</modelVersion>"
+            "<groupId>org.example</groupId>"
+            f"<artifactId>{artifact_id}</artifactId><version>1.0</version>"
+            f"{body}</project>"
+        )
+    return MavenContext(repo_cache=tmp_path, remote_repos={})
+
+
+_PLATFORMS = {
+    "linux-x64": ProfileConstraints(os_family="unix", os_arch="amd64"),
+    "linux-arm64": ProfileConstraints(os_family="unix", os_arch="aarch64"),
+    "macos-arm64": ProfileConstraints(os_family="mac", os_arch="aarch64"),
+}
+
+
+def test_resolve_platforms(platform_repo, monkeypatch):
+    """Each platform gets its natives; other POMs are modeled only once."""
+    built = []
+    pom = Component.pom
+    monkeypatch.setattr(
+        Component, "pom", lambda self: built.append(self.artifactId) or pom(self)
+    )
+    app = platform_repo.create_dependency("org.example:app:1.0")
+    resolver = PythonResolver()
+
+    results = resolver.resolve_platforms([app], _PLATFORMS)
+
+    classifiers = {
+        name: [d.classifier for d in transitive if d.artifactId == "natives"]
+        for name, (_, transitive) in results.items()
+    }
+    assert classifiers == {
+        "linux-x64": ["natives-linux-amd64"],
+        "linux-arm64": ["natives-linux-aarch64"],
+        "macos-arm64": ["natives-macos-aarch64"],
+    }
+    for _, transitive in results.values():
+        assert [d.artifactId for d in transitive] == ["core", "natives", "lib"]
+
+    # app (as a BOM and as a dependency) depends on the platform; core does
+    # not, even though it inherits the OS-activated profiles, nor lib, nor
+    # natives (one POM for all classifiers)
+    assert built.count("app") == 2 * len(_PLATFORMS)
+    assert built.count("core") == 1
+    assert built.count("lib") == 1
+    assert built.count("natives") == 1
+
+
+def test_resolve_platforms_matches_resolve(platform_repo):
+    app = platform_repo.create_dependency("org.example:app:1.0")
+    shared = PythonResolver().resolve_platforms([app], _PLATFORMS)
+
+    for name, constraints in _PLATFORMS.items():
+        resolver = PythonResolver(profile_constraints=constraints)
+        inputs, transitive = resolver.resolve([app])
+        expected = [(str(d), d.scope) for d in inputs + transitive]
+        actual = [(str(d), d.scope) for d in shared[name][0] + shared[name][1]]
+        assert actual == expected
+
+
+def test_platform_fields():
+    """A model records the constraint fields its dependencies depend on."""
+    profile = ET.Element("profile")
+    activation = ET.SubElement(profile, "activation")
+    os_elem = ET.SubElement(activation, "os")
+    ET.SubElement(os_elem, "arch").text = "amd64"
+    ET.SubElement(profile, "dependencies")
+
+    model = Model(MockPOM(), _ctx, profile_constraints=ProfileConstraints())
+    assert model.platform_fields == {"lenient"}
+
+    model._record_activation_fields(profile)
+    assert model.platform_fields == {"lenient", "os_arch"}
+    assert model._interpolate("natives-${os.name}-${foo}") == (
+        "natives-${os.name}-${foo}"
+    )
+    assert model.platform_fields == {
+        "lenient",
+        "os_arch",
+        "os_name",
+        "properties:foo",
+    }
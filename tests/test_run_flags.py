@@ -1,15 +1,17 @@
 """
-Tests for --global, --local, and --main-class flags in jgo run.
+Tests for --global, --local, --exec, and --main-class flags in jgo run.
 
 Covers:
   - execute() routing: --global bypasses jgo.toml even when it exists
   - execute() routing: jgo.toml without endpoint → spec mode
   - --local flag: a positional click mis-assigns as endpoint → moved to app_args
+  - --exec/--no-exec: exec_java defaults to True on POSIX and is overridable
   - --main-class priority: CLI override wins over spec's configured main class
 """
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from subprocess import CompletedProcess
 from unittest.mock import MagicMock, patch
@@ -160,6 +162,43 @@ class TestLocalFlag:
         mock_spec.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# --exec/--no-exec flag
+# ---------------------------------------------------------------------------
+
+
+class TestExecFlag:
+    """--exec replaces jgo with the JVM; the default depends on the platform."""
+
+    def _passed_args(self, tmp_path, args: list[str]) -> ParsedArgs:
+        from jgo.cli._parser import cli
+
+        runner = CliRunner()
+        run_spec = patch("jgo.cli._commands.run._run_spec", return_value=0)
+        with run_spec as mock_spec, runner.isolated_filesystem(temp_dir=tmp_path):
+            Path("jgo.toml").write_text(_SPEC_TOML)
+            result = runner.invoke(cli, args, catch_exceptions=False)
+        assert result.exit_code == 0
+        return mock_spec.call_args[0][0]
+
+    def test_default_follows_platform(self, tmp_path):
+        passed_args = self._passed_args(tmp_path, ["--ignore-config", "run"])
+        assert passed_args.exec_java == (os.name == "posix")
+
+    def test_no_exec(self, tmp_path):
+        passed_args = self._passed_args(
+            tmp_path, ["--ignore-config", "run", "--no-exec"]
+        )
+        assert passed_args.exec_java is False
+
+    def test_exec(self, tmp_path):
+        passed_args = self._passed_args(tmp_path, ["--ignore-config", "run", "--exec"])
+        assert passed_args.exec_java is True
+
+    def test_parsed_args_default_is_no_exec(self):
+        assert ParsedArgs().exec_java is False
+
+
 # ---------------------------------------------------------------------------
 # --main-class priority in spec mode
 # ---------------------------------------------------------------------------
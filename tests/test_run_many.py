@@ -0,0 +1,132 @@
+"""
+Tests for jgo.run_many(), the concurrent batch runner API.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from subprocess import CompletedProcess
+from typing import ClassVar
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import jgo
+
+
+class _FakeRunner:
+    """JavaRunner stand-in that records how many runs overlap."""
+
+    instances: ClassVar[list[_FakeRunner]] = []
+
+    def __init__(self, jvm_config=None, **kwargs):
+        self.jvm_config = jvm_config
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.runs = 0
+        _FakeRunner.instances.append(self)
+
+    def run(self, environment, main_class=None, app_args=None, **kwargs):
+        with self.lock:
+            self.active += 1
+            self.runs += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return CompletedProcess(args=app_args, returncode=int(app_args[0]))
+
+    def run_and_capture(self, environment, main_class=None, app_args=None, **kwargs):
+        result = self.run(environment, main_class, app_args, **kwargs)
+        result.stdout = f"output of {app_args[0]}\n"
+        return result
+
+
+@pytest.fixture
+def fake_layers(tmp_path):
+    """Patch the builder and runner used by run_many()."""
+    _FakeRunner.instances.clear()
+    builder = MagicMock()
+    runner = patch("jgo.JavaRunner", _FakeRunner)
+    with patch("jgo.EnvironmentBuilder", return_value=builder), runner:
+        yield builder
+
+
+def _jobs(n, endpoint="org.example:tool:1.0"):
+    return [{"endpoint": endpoint, "app_args": [str(i % 3)]} for i in range(n)]
+
+
+def test_results_for_every_invocation(fake_layers, tmp_path):
+    results = dict(jgo.run_many(_jobs(10), max_jvms=4, cache_dir=tmp_path))
+    assert sorted(results) == list(range(10))
+    assert all(results[i].returncode == i % 3 for i in range(10))
+
+
+def test_max_jvms_caps_concurrency(fake_layers, tmp_path):
+    list(jgo.run_many(_jobs(12), max_jvms=3, cache_dir=tmp_path))
+    runner = _FakeRunner.instances[0]
+    assert 1 < runner.peak <= 3
+
+
+def test_memory_budget_caps_concurrency(fake_layers, tmp_path):
+    list(
+        jgo.run_many(
+            _jobs(8),
+            max_jvms=8,
+            memory_budget="4G",
+            max_heap="2G",
+            cache_dir=tmp_path,
+        )
+    )
+    runner = _FakeRunner.instances[0]
+    assert runner.peak <= 2
+    assert runner.jvm_config.max_heap == "2G"
+
+
+def test_heap_split_across_jvms(fake_layers, tmp_path):
+    list(jgo.run_many(_jobs(1), max_jvms=4, memory_budget="8G", cache_dir=tmp_path))
+    assert _FakeRunner.instances[0].jvm_config.max_heap == "2048M"
+
+
+def test_capture_output(fake_layers, tmp_path):
+    results = dict(jgo.run_many(_jobs(3), capture=True, cache_dir=tmp_path))
+    assert [results[i].stdout for i in range(3)] == [
+        "output of 0\n",
+        "output of 1\n",
+        "output of 2\n",
+    ]
+    assert dict(jgo.run_many(_jobs(1), cache_dir=tmp_path))[0].stdout is None
+
+
+def test_update_once_per_endpoint(fake_layers, tmp_path):
+    jobs = _jobs(3) + _jobs(2, endpoint="org.example:other:1.0")
+    list(jgo.run_many(jobs, update=True, cache_dir=tmp_path))
+    updates = [c.kwargs["update"] for c in fake_layers.from_endpoint.call_args_list]
+    assert updates.count(True) == 2
+    assert len(updates) == 5
+
+
+def test_stop_consuming_results(fake_layers, tmp_path):
+    """Jobs waiting for a JVM slot do not run once the caller stops early."""
+    results = jgo.run_many(_jobs(20), max_jvms=1, max_builds=4, cache_dir=tmp_path)
+    for _ in results:
+        break
+    results.close()
+    runner = _FakeRunner.instances[0]
+    # The yielded run, and at most one that was running when the caller stopped
+    assert runner.runs <= 2
+
+
+def test_build_failure_is_raised(fake_layers, tmp_path):
+    fake_layers.from_endpoint.side_effect = RuntimeError("cannot resolve")
+    with pytest.raises(RuntimeError, match="cannot resolve"):
+        list(jgo.run_many(["org.example:tool:1.0"], cache_dir=tmp_path))
+
+
+def test_invalid_invocation(fake_layers, tmp_path):
+    with pytest.raises(ValueError, match="Unknown invocation keys"):
+        list(jgo.run_many([{"endpoint": "g:a", "bogus": 1}], cache_dir=tmp_path))
+    with pytest.raises(ValueError, match="no endpoint"):
+        list(jgo.run_many([{"app_args": []}], cache_dir=tmp_path))
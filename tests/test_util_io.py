@@ -2,7 +2,11 @@
 Tests for jgo.maven.util utility functions.
 """
 
-from jgo.util.io import binary, text
+from unittest.mock import patch
+
+import pytest
+
+from jgo.util.io import binary, read_json, text, write_atomic, write_json
 
 
 def test_text(tmp_path):
@@ -23,3 +27,31 @@ def test_binary(tmp_path):
 
     result = binary(test_file)
     assert result == test_content
+
+
+def test_write_atomic(tmp_path):
+    """A failed write leaves the old content and no temporary file behind."""
+    test_file = tmp_path / "sub" / "test.bin"
+    write_atomic(test_file, b"old")
+    assert test_file.read_bytes() == b"old"
+
+    failure = OSError("disk full")
+    with patch("os.replace", side_effect=failure), pytest.raises(OSError):
+        write_atomic(test_file, b"new")
+    assert test_file.read_bytes() == b"old"
+    assert [p.name for p in test_file.parent.iterdir()] == ["test.bin"]
+
+
+def test_json(tmp_path):
+    """Test the read_json and write_json functions."""
+    test_file = tmp_path / "test.json"
+    assert read_json(test_file) == {}
+
+    write_json(test_file, {"b": 1, "a": [2]})
+    assert read_json(test_file) == {"a": [2], "b": 1}
+
+    # Anything but a JSON object reads as empty
+    test_file.write_text("[1, 2]")
+    assert read_json(test_file) == {}
+    test_file.write_text("{not json")
+    assert read_json(test_file) == {}
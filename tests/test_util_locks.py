@@ -0,0 +1,93 @@
+"""
+Tests for jgo.util.locks advisory file locks.
+"""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from jgo.util.locks import file_lock
+
+
+def test_file_lock_excludes_threads(tmp_path):
+    """Test that holders of the same lock never overlap."""
+    lock = tmp_path / "locks" / "a.lock"
+    active = []
+    overlaps = []
+
+    def work():
+        with file_lock(lock):
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(1)
+            time.sleep(0.02)
+            active.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert overlaps == []
+    assert lock.exists()
+
+
+def test_file_lock_timeout(tmp_path):
+    """Test that waiting for a lock held by another process can time out."""
+    lock = tmp_path / "a.lock"
+    holder = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            (
+                "import sys, time; from pathlib import Path;"
+                "from jgo.util.locks import file_lock\n"
+                f"with file_lock(Path({str(lock)!r})):\n"
+                "    print('locked', flush=True); time.sleep(30)"
+            ),
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert holder.stdout.readline().strip() == "locked"
+        with pytest.raises(TimeoutError), file_lock(lock, timeout=0.2):
+            pass
+    finally:
+        holder.kill()
+        holder.wait()
+
+    # The operating system releases the lock of a killed process
+    with file_lock(lock, timeout=5):
+        pass
+
+
+def test_file_lock_follows_removed_file(tmp_path):
+    """Test that waiters lock anew when the holder moves its lock file away."""
+    lock = tmp_path / "env" / ".build.lock"
+    acquired = threading.Event()
+    order = []
+
+    def waiter():
+        acquired.wait()
+        with file_lock(lock) as fd:
+            order.append(("waiter", os.fstat(fd).st_ino))
+
+    thread = threading.Thread(target=waiter)
+    thread.start()
+    with file_lock(lock) as fd:
+        held = os.fstat(fd).st_ino
+        acquired.set()
+        time.sleep(0.3)
+        (tmp_path / "env").rename(tmp_path / "trash")
+        order.append(("holder", held))
+    thread.join()
+
+    assert order[0] == ("holder", held)
+    assert order[1][0] == "waiter"
+    assert lock.exists()
+    assert os.stat(lock).st_ino == order[1][1]